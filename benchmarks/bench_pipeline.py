@@ -0,0 +1,252 @@
+"""Benchmarks del flujo crear/leer/guardar con archivos sinteticos.
+
+Genera archivos csv, json y xlsx de distintos tamanos y anchos, y mide por etapa
+(read, headers, to_dict, save) el tiempo, el pico de RSS y el pico de memoria
+reservada (tracemalloc). Cada etapa de cada caso corre en un proceso nuevo y el pico de RSS
+se obtiene muestreando el RSS actual, asi no arrastra lo de las etapas anteriores. El RSS no
+incluye la memoria liberada por la lectura previa que la etapa reutiliza; `alloc_peak` si la incluye
+y no depende del asignador.
+
+Uso:
+
+```
+python benchmarks/bench_pipeline.py --output results.json
+python benchmarks/bench_pipeline.py --baseline baseline.json --threshold 0.25
+```
+
+Con `--baseline` el proceso termina con codigo 1 si alguna metrica empeora mas que
+`--threshold` (0.25 = 25%) respecto a la linea base.
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
+
+FORMATS = ("csv", "json", "xlsx")
+STAGES = ("read", "headers", "to_dict", "save")
+METRICS = ("wall", "rss_peak", "alloc_peak")
+SIZES = {
+    "quick": {"rows": [1_000, 10_000], "columns": [5, 20]},
+    "full": {"rows": [10_000, 100_000, 1_000_000], "columns": [5, 20, 50]},
+}
+XLSX_MAX_ROWS = 100_000
+"""openpyxl es mucho mas lento que los demas formatos; los casos xlsx mas grandes se omiten."""
+MIN_WALL = 0.005
+"""Tiempos por debajo de este valor (segundos) se consideran ruido al comparar."""
+MIN_MEMORY = 1024 * 1024
+"""Picos de memoria por debajo de este valor (bytes) se consideran ruido al comparar."""
+RSS_INTERVAL = 0.001
+"""Segundos entre cada muestra del RSS."""
+
+def generate_fixture(directory: str, fmt: str, rows: int, columns: int, seed: int = 0) -> str:
+    """Crea (si no existe) un archivo sintetico con columnas de texto, enteros y decimales."""
+    path = os.path.join(directory, f"data_{rows}x{columns}.{fmt}")
+    if os.path.exists(path):
+        return path
+    rnd = random.Random(seed)
+    headers = [f"col_{i}" for i in range(columns)]
+    kinds = [i % 3 for i in range(columns)]
+    def value(kind):
+        if kind == 0:
+            return "".join(rnd.choice("abcdefghijklmnopqrstuvwxyz ") for _ in range(rnd.randint(3, 16)))
+        if kind == 1:
+            return str(rnd.randint(-10**6, 10**6))
+        return f"{rnd.uniform(-1000, 1000):.4f}"
+    records = ([value(kind) for kind in kinds] for _ in range(rows))
+    tmp_path = path + ".tmp"
+    if fmt == "csv":
+        import csv
+        with open(tmp_path, "w", encoding="utf-8", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(headers)
+            writer.writerows(records)
+    elif fmt == "json":
+        with open(tmp_path, "w", encoding="utf-8") as file:
+            file.write("[")
+            for number, record in enumerate(records):
+                file.write(("," if number else "") + json.dumps(dict(zip(headers, record))))
+            file.write("]")
+    else:
+        from openpyxl import Workbook
+        workbook = Workbook(write_only=True)
+        sheet = workbook.create_sheet("Sheet")
+        sheet.append(headers)
+        for record in records:
+            sheet.append(record)
+        workbook.save(tmp_path)
+    os.replace(tmp_path, path)
+    return path
+
+def _current_rss() -> int:
+    """RSS actual del proceso en bytes; None si la plataforma no lo expone (solo Linux)."""
+    try:
+        with open("/proc/self/statm", encoding="ascii") as file:
+            return int(file.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+def _rss_peak(function) -> int:
+    """Pico de RSS durante `function` sobre el RSS al iniciar, muestreando el RSS actual en otro hilo.
+
+    ru_maxrss no sirve por etapa: es el maximo de todo el proceso y la lectura ya lo alcanzo.
+    """
+    start = _current_rss()
+    if start is None:
+        function()
+        return None
+    peak = start
+    done = threading.Event()
+
+    def sample():
+        nonlocal peak
+        while not done.wait(RSS_INTERVAL):
+            peak = max(peak, _current_rss())
+
+    sampler = threading.Thread(target=sample, daemon=True)
+    sampler.start()
+    try:
+        function()
+    finally:
+        done.set()
+        sampler.join()
+    return max(peak, _current_rss()) - start
+
+def _release_memory():
+    """Libera la memoria que ya no se usa y, con glibc, la regresa al sistema (malloc_trim).
+
+    Asi la etapa medida no reutiliza memoria liberada por la lectura previa y su pico de RSS la incluye.
+    """
+    gc.collect()
+    try:
+        import ctypes
+        ctypes.CDLL("libc.so.6").malloc_trim(0)
+    except (OSError, AttributeError):
+        pass
+
+def _measure(function, repeat: int) -> dict:
+    """Mide una etapa en corridas separadas: el pico de RSS, el mejor tiempo de `repeat` y el pico de tracemalloc.
+
+    El RSS se mide primero, antes de que otras corridas dejen memoria libre que la etapa pueda reutilizar;
+    el RSS y tracemalloc se miden aparte para no alterar el tiempo.
+    """
+    _release_memory()
+    rss_peak = _rss_peak(function)
+    wall = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        elapsed = time.perf_counter() - start
+        wall = elapsed if wall is None else min(wall, elapsed)
+    tracemalloc.start()
+    try:
+        function()
+        alloc_peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return {"wall": wall, "rss_peak": rss_peak, "alloc_peak": alloc_peak}
+
+def run_stage(path: str, fmt: str, output_dir: str, repeat: int, stage: str) -> dict:
+    """Mide una etapa de un archivo en el proceso actual; las etapas posteriores a read leen el archivo antes."""
+    from pytabify import DataTableCreator, DataTableSaver
+    options = {"sheet_name": "Sheet"} if fmt == "xlsx" else {}
+
+    def read():
+        return DataTableCreator.from_file(path, **options)
+
+    if stage == "read":
+        return _measure(read, repeat)
+    datatable = read()
+    if stage == "headers":
+        return _measure(datatable.headers, repeat)
+    if stage == "to_dict":
+        return _measure(datatable.to_dict, repeat)
+    save = getattr(DataTableSaver, f"into_{fmt}")
+    output = os.path.join(output_dir, f"out.{fmt}")
+    return _measure(lambda: save(datatable, output), repeat)
+
+def run(sizes: dict, formats: list[str], fixtures: str, repeat: int) -> dict:
+    """Genera los archivos que falten y corre cada caso en un proceso nuevo."""
+    os.makedirs(fixtures, exist_ok=True)
+    cases = {}
+    with tempfile.TemporaryDirectory() as output_dir:
+        for fmt in formats:
+            for rows in sizes["rows"]:
+                if fmt == "xlsx" and rows > XLSX_MAX_ROWS:
+                    continue
+                for columns in sizes["columns"]:
+                    path = generate_fixture(fixtures, fmt, rows, columns)
+                    for stage in STAGES:
+                        stdout = subprocess.run(
+                            [sys.executable, __file__, "--case", path, fmt, output_dir, str(repeat), stage],
+                            capture_output=True, text=True, check=True
+                        ).stdout
+                        metrics = json.loads(stdout)
+                        cases[f"{fmt}/{rows}x{columns}/{stage}"] = metrics
+                        print(f"{fmt:>5} {rows:>9}x{columns:<3} {stage:<8} {metrics['wall']:.4f}s", file=sys.stderr)
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": repeat,
+        "cases": cases,
+    }
+
+def compare(results: dict, baseline: dict, threshold: float) -> list[str]:
+    """Regresa las metricas que empeoraron mas que `threshold` respecto a la linea base."""
+    regressions = []
+    for case, metrics in results["cases"].items():
+        base = baseline.get("cases", {}).get(case)
+        if base is None:
+            continue
+        for metric in METRICS:
+            current, previous = metrics.get(metric), base.get(metric)
+            # Sin linea base positiva no hay porcentaje que comparar.
+            if current is None or previous is None or previous <= 0:
+                continue
+            if current < (MIN_WALL if metric == "wall" else MIN_MEMORY):
+                continue
+            if current > previous * (1 + threshold):
+                regressions.append(f"{case} {metric}: {previous} -> {current}")
+    return regressions
+
+def main(argv: list[str] = None) -> int:
+    """Punto de entrada de la linea de comandos; regresa el codigo de salida."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", 1)[0])
+    parser.add_argument("--size", choices=sorted(SIZES), default="quick")
+    parser.add_argument("--formats", nargs="+", choices=FORMATS, default=list(FORMATS))
+    parser.add_argument("--fixtures", default=os.path.join(tempfile.gettempdir(), "pytabify-bench"))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", help="Archivo json donde guardar los resultados")
+    parser.add_argument("--baseline", help="Archivo json con resultados previos para comparar")
+    parser.add_argument("--threshold", type=float, default=0.25)
+    parser.add_argument("--case", nargs=5, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.case:
+        path, fmt, output_dir, repeat, stage = args.case
+        print(json.dumps(run_stage(path, fmt, output_dir, int(repeat), stage)))
+        return 0
+
+    results = run(SIZES[args.size], args.formats, args.fixtures, args.repeat)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(results, file, indent=2)
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as file:
+            regressions = compare(results, json.load(file), args.threshold)
+        for regression in regressions:
+            print(f"REGRESION {regression}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
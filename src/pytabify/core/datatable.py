@@ -1,6 +1,12 @@
+from typing import Any, Callable, Iterable, Union
 from pytabify.core.dt_row import DTRow
+from pytabify.core.dt_columns import DTColumns, MISSING
+from pytabify.core import dt_query, dt_join
+from pytabify.core.dt_index import DTIndex
+from pytabify.core.dt_tracker import DTChangeTracker
 from pytabify.utils.observer import FieldChangeObserver
 from pytabify.core.dt_header import DTHeader
+from pytabify.utils.errors import DataTypeException
 
 class DataTable:
     """Representa un conjunto de datos tabulares (filas y columnas).
@@ -8,37 +14,228 @@ class DataTable:
     Cada fila es un objeto DTRow y cada columna es un objeto DTField.
     La primer fila es considerada como la fila de encabezados.
     Aunque la fila 0 es de encabezados, no se considera como una fila de datos y no se incluye en el conteo de filas, por lo que se puede acceder a la primer fila de datos con el indice 0.
+
+    Los datos se guardan por columnas (DTColumns); las filas y campos se crean como vistas al accederlos.
+
+    Las consultas (where, select, sort_by, distinct, group_by) trabajan una columna a la vez y regresan
+    nuevos DataTables; las columnas que no cambian se comparten (copia al escribir).
+
+    Los indices (create_index) aceleran lookup, range y los filtros de igualdad de where; se mantienen
+    al modificar celdas y al agregar filas, pero no pasan a los DataTables que regresan las consultas.
     """
 
-    def __init__(self, rows: list[DTRow], observer: FieldChangeObserver):
-        self._rows = rows
-        self._len = len(rows)
+    def __init__(self, store: DTColumns, observer: FieldChangeObserver):
+        self._store = store
         self._observer = observer
 
+    @classmethod
+    def concat(cls, datatables: list["DataTable"]) -> "DataTable":
+        """Une varios DataTables uno despues de otro, alineando sus encabezados por nombre.
+
+        Las celdas de columnas que no existen en alguno de los DataTables quedan ausentes en esas filas.
+        """
+        store = DTColumns.concat([datatable._store for datatable in datatables])
+        return cls(store, FieldChangeObserver())
+
+    @property
+    def store(self) -> DTColumns:
+        """Almacenamiento columnar del DataTable."""
+        return self._store
+
+    @property
+    def tracker(self) -> DTChangeTracker:
+        """Registro de filas modificadas; permite guardar solo los cambios (`append=True`)."""
+        return self._store.tracker
+
     def __len__(self):
-        return len(self._rows)
+        return len(self._store)
+
+    @classmethod
+    def _wrap(cls, store: DTColumns) -> "DataTable":
+        return cls(store, FieldChangeObserver())
 
     def row(self, index: int) -> DTRow:
         """Obtiene una fila por su indice."""
-        return self._rows[index]
+        total = len(self._store)
+        if index < 0:
+            index += total
+        if not 0 <= index < total:
+            raise IndexError("El indice de la fila esta fuera de rango.")
+        return DTRow.view(self._store, index, self._observer)
 
     def total_rows(self):
         """Indica el total de filas de datos."""
-        return self._len
+        return len(self._store)
 
     def __getitem__(self, index: int):
-        return self._rows[index]
+        if isinstance(index, slice):
+            return [self.row(i) for i in range(*index.indices(len(self._store)))]
+        return self.row(index)
 
     def __iter__(self):
-        return iter(self._rows)
+        return (DTRow.view(self._store, index, self._observer) for index in range(len(self._store)))
 
     def headers(self):
         """Obtiene los encabezados de las columnas."""
-        return list(
-            {DTHeader(field.name, field.index) for row in self._rows for field in row}
-              | {DTHeader(event["field"].name, event["pos"]) for event in self._observer.events}
-        )
+        return [DTHeader(name, index) for index, name in enumerate(self._store.names)]
+
+    def add_column(
+        self,
+        name: str,
+        values: Union[Iterable[Any], Callable[[DTRow], Any]] = None,
+        default: Any = None,
+        dtype: Union[str, type] = None
+    ):
+        """Agrega una columna a todas las filas.
+
+        `values` es una lista con un valor por fila o una funcion que recibe cada fila (DTRow)
+        y regresa su valor; sin `values` todas las filas reciben `default`. Si tampoco se indica
+        `default` las celdas quedan ausentes. `dtype` convierte la columna a ese tipo; con celdas
+        ausentes lanza DataTypeException.
+        """
+        if dtype is not None and values is None and default is None:
+            raise DataTypeException(f"La columna {name} con dtype necesita values o default")
+        total = len(self._store)
+        if callable(values):
+            column = [str(values(DTRow.view(self._store, index, self._observer))) for index in range(total)]
+        elif values is not None:
+            column = [str(value) for value in values]
+        elif default is not None:
+            column = [str(default)] * total
+        else:
+            column = [MISSING] * total
+        pos = self._store.insert_column(name, column)
+        if dtype is not None:
+            self._store.astype({name: dtype})
+        self._observer.notify(pos, DTHeader(self._store.names[pos], pos))
+
+    def update(
+        self, column: str, values: Any, where: dict[str, dt_query.Predicate] = None
+    ):
+        """Modifica en bloque los valores de una columna, en las filas que cumplen `where` (o en todas).
+
+        `values` puede ser una funcion que recibe el valor actual de la celda (None si esta ausente),
+        una lista con un valor por fila afectada o un valor para todas. Si la columna no existe se crea.
+        """
+        rows = None if not where else dt_query.matching_rows(self._store, where)
+        total = len(self._store) if rows is None else len(rows)
+        pos = self._store.position(column)
+        if callable(values):
+            current = self._store.columns[pos] if pos is not None else [MISSING] * len(self._store)
+            selected = current if rows is None else map(current.__getitem__, rows)
+            values = [values(None if value is MISSING else value) for value in selected]
+        elif isinstance(values, (list, tuple)):
+            if len(values) != total:
+                raise ValueError(f"Se esperaban {total} valores para la columna {column}, no {len(values)}")
+        else:
+            values = [values] * total
+        pos, created = self._store.assign(column, rows, values)
+        if created:
+            self._observer.notify(pos, DTHeader(self._store.names[pos], pos))
+
+    def apply(self, function: Callable[[Any], Any], columns: list[str] = None):
+        """Aplica una funcion a cada celda de las columnas indicadas (todas si no se indican).
+
+        Las celdas ausentes no se modifican.
+        """
+        for column in columns if columns is not None else list(self._store.names):
+            pos = self._store.require(column)
+            if MISSING in self._store.columns[pos]:
+                self.update(column, function, where={column: lambda value: True})
+            else:
+                self.update(column, function)
+
+    def append_rows(self, records: Iterable[dict[str, Any]]):
+        """Agrega filas al final en un solo paso; las columnas nuevas se agregan a todas las filas."""
+        width = len(self._store.names)
+        self._store.extend(records)
+        for pos in range(width, len(self._store.names)):
+            self._observer.notify(pos, DTHeader(self._store.names[pos], pos))
+
+    def dtypes(self) -> dict[str, type]:
+        """Obtiene el tipo de cada columna (str si no se activaron las columnas con tipo)."""
+        return dict(zip(self._store.names, self._store.dtypes))
+
+    def iter_values(self, fill: str = ""):
+        """Itera las filas como tuplas de valores en el orden de headers(), sin crear DTRow ni DTField."""
+        return self._store.iter_tuples(fill)
 
     def to_dict(self):
         """Convierte el DataTable a una lista de diccionarios."""
-        return [row.to_dict() for row in self._rows]
+        return [self._store.record(index) for index in range(len(self._store))]
+
+    def where(self, column: str = None, condition: dt_query.Predicate = None, **conditions: dt_query.Predicate) -> "DataTable":
+        """Filtra las filas que cumplen las condiciones.
+
+        Ejemplo: `dt.where("age", lambda age: int(age) > 30)` o `dt.where(status="active", city="Madrid")`.
+        Una condicion es una funcion que recibe el valor de la celda o un valor a comparar por igualdad.
+        """
+        if column is not None:
+            conditions = {column: condition, **conditions}
+        rows = dt_query.matching_rows(self._store, conditions)
+        if len(rows) == len(self._store):
+            return self._wrap(self._store.share())
+        return self._wrap(self._store.take(rows))
+
+    def select(self, *columns: str) -> "DataTable":
+        """Obtiene un DataTable con las columnas indicadas, en ese orden, sin copiarlas."""
+        return self._wrap(self._store.select(list(columns)))
+
+    def sort_by(self, *columns: str, reverse: bool = False) -> "DataTable":
+        """Ordena las filas por las columnas indicadas; las celdas ausentes quedan al final."""
+        return self._wrap(self._store.take(dt_query.sorted_rows(self._store, list(columns), reverse)))
+
+    def distinct(self, *columns: str) -> "DataTable":
+        """Obtiene las combinaciones distintas de valores de las columnas indicadas, en orden de aparicion."""
+        rows = dt_query.distinct_rows(self._store, list(columns))
+        return self._wrap(self._store.select(list(columns)).take(rows))
+
+    def group_by(self, *columns: str) -> dt_query.DTGroupBy:
+        """Agrupa las filas por las columnas indicadas; use `.agg(...)` para calcular las agregaciones."""
+        return dt_query.DTGroupBy(self._store, list(columns), self._wrap)
+
+    def join(
+        self, other: "DataTable", on: Union[str, list[str]], how: str = "inner", method: str = "hash",
+        suffix: str = "_right"
+    ) -> "DataTable":
+        """Une este DataTable con `other` por las columnas `on` ("inner", "left" u "outer").
+
+        method="hash" conserva el orden de este DataTable; method="merge" recorre ambos ordenados por
+        la llave (sin costo extra si ya vienen ordenados) y entrega las filas en ese orden.
+        Las columnas de `other` con un nombre repetido se renombran agregando `suffix`.
+        """
+        return self._wrap(dt_join.join(self._store, other.store, on, how, method, suffix))
+
+    def create_index(self, column: str, unique: bool = False, kind: str = "hash"):
+        """Crea un indice sobre una columna.
+
+        kind="hash" busca por igualdad y kind="sorted" ademas permite consultas por rango.
+        Con unique=True se lanza DuplicateKeyException si la columna (o un cambio posterior) repite un valor.
+        """
+        self._store.add_index(DTIndex(column, kind, unique))
+
+    def drop_index(self, column: str):
+        """Elimina el indice de una columna."""
+        self._store.drop_index(column)
+
+    def indexes(self) -> dict[str, DTIndex]:
+        """Obtiene los indices por nombre de columna."""
+        return dict(self._store.indexes)
+
+    def lookup(self, column: str = None, value: Any = None, **keys: Any) -> "DataTable":
+        """Obtiene las filas cuyos valores son iguales a los indicados, por ejemplo `dt.lookup(id=5)`.
+
+        Usa los indices de las columnas; si una columna no tiene indice se recorre.
+        """
+        if column is not None:
+            keys = {column: value, **keys}
+        if any(callable(value) for value in keys.values()):
+            raise TypeError("lookup solo acepta valores; use where para filtrar con funciones.")
+        return self._wrap(self._store.take(dt_query.matching_rows(self._store, keys)))
+
+    def range(self, column: str, low: Any = None, high: Any = None) -> "DataTable":
+        """Obtiene las filas con valores entre `low` y `high` (inclusive), ordenadas por esa columna.
+
+        Usa el indice de la columna si es kind="sorted"; None indica un rango abierto.
+        """
+        return self._wrap(self._store.take(dt_query.range_rows(self._store, column, low, high)))
@@ -0,0 +1,448 @@
+import sys
+from array import array
+from typing import Any, Iterable, Iterator, Union
+from pytabify.core.dt_tracker import DTChangeTracker
+from pytabify.core.dt_types import INFER_SAMPLE_SIZE, converter, infer_dtype, resolve_dtype, to_typed_column
+from pytabify.utils.errors import ColumnDoesNotExistException, DataTypeException, DuplicateKeyException
+
+class _Missing:
+    __slots__ = ()
+
+    def __repr__(self):
+        return "MISSING"
+
+    def __reduce__(self):
+        return "MISSING"
+
+MISSING = _Missing()
+"""Marcador de una celda que no existe en una fila (columna agregada desde otra fila).
+
+Se serializa por referencia para que siga siendo el mismo objeto al pasar entre procesos.
+"""
+
+class DTColumns:
+    """Almacenamiento columnar de un DataTable.
+
+    Guarda un encabezado compartido (lista de nombres) y una lista de valores por columna.
+    Las filas (DTRow) y los campos (DTField) son vistas que se crean solo al accederlas.
+    Las celdas ausentes en una fila se marcan con MISSING.
+    El indice nombre -> posicion es compartido por todas las filas y se actualiza al agregar columnas.
+
+    Los indices secundarios (DTIndex) registrados con `add_index` se mantienen al asignar
+    celdas (`set`) y al agregar filas (`extend`); las copias (`share`, `select`, `take`) no los heredan.
+
+    Las celdas modificadas se registran en `tracker` para que los guardados incrementales
+    escriban solo las filas nuevas.
+
+    Por defecto todas las columnas son str. Con `infer_types`/`astype` una columna puede guardarse
+    con su tipo nativo (int, float, bool, date); si despues recibe un valor que no se puede
+    convertir sin perder su representacion como texto, la columna regresa a str.
+    """
+    _CONVERSION_ERRORS = (ValueError, TypeError, OverflowError)
+
+    def __init__(
+        self, names: list[str] = None, columns: list[list[Any]] = None, length: int = 0, dtypes: list[type] = None
+    ):
+        self._names = names if names is not None else []
+        self._positions = {name: pos for pos, name in enumerate(self._names)}
+        self._columns = columns if columns is not None else [[] for _ in self._names]
+        self._dtypes = dtypes if dtypes is not None else [str for _ in self._names]
+        self._converters = [converter(dtype) for dtype in self._dtypes]
+        self._owned = [True] * len(self._columns)
+        self._length = length
+        self._indexes = {}
+        self._tracker = DTChangeTracker()
+
+    @classmethod
+    def from_records(cls, records: Iterable[dict[str, Any]]) -> "DTColumns":
+        """Construye el almacenamiento a partir de una lista de diccionarios."""
+        store = cls()
+        store.extend(records)
+        return store
+
+    @classmethod
+    def concat(cls, stores: list["DTColumns"]) -> "DTColumns":
+        """Une varios almacenamientos uno despues de otro, alineando sus columnas por nombre.
+
+        Una columna conserva su tipo si existe con el mismo tipo en todos; si no, se guarda como str.
+        """
+        names = list(dict.fromkeys(name for store in stores for name in store.names))
+        columns = []
+        dtypes = []
+        for name in names:
+            parts = [(store, store.position(name)) for store in stores]
+            kinds = {None if pos is None else store.dtypes[pos] for store, pos in parts}
+            if len(kinds) == 1 and None not in kinds:
+                dtype = kinds.pop()
+                column = parts[0][0].columns[parts[0][1]][:]
+                for store, pos in parts[1:]:
+                    column.extend(store.columns[pos])
+            else:
+                dtype = str
+                column = []
+                for store, pos in parts:
+                    if pos is None:
+                        column.extend([MISSING] * len(store))
+                    else:
+                        column.extend(value if value is MISSING else str(value) for value in store.columns[pos])
+            columns.append(column)
+            dtypes.append(dtype)
+        return cls(names, columns, sum(len(store) for store in stores), dtypes)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_converters"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._converters = [converter(dtype) for dtype in self._dtypes]
+
+    def share(self) -> "DTColumns":
+        """Crea un almacenamiento que comparte las columnas con este (copia al escribir).
+
+        Ninguno de los dos modifica una columna compartida: la copian antes de su primera escritura.
+        """
+        self._owned = [False] * len(self._columns)
+        store = DTColumns(list(self._names), list(self._columns), self._length, list(self._dtypes))
+        store._owned = [False] * len(self._columns)
+        return store
+
+    def select(self, names: list[str]) -> "DTColumns":
+        """Crea un almacenamiento con las columnas indicadas, compartiendolas (copia al escribir)."""
+        positions = [self.require(name) for name in names]
+        for pos in positions:
+            self._owned[pos] = False
+        store = DTColumns(
+            [self._names[pos] for pos in positions],
+            [self._columns[pos] for pos in positions],
+            self._length,
+            [self._dtypes[pos] for pos in positions]
+        )
+        store._owned = [False] * len(positions)
+        return store
+
+    def take(self, rows: list[int]) -> "DTColumns":
+        """Crea un almacenamiento con las filas indicadas, en ese orden."""
+        columns = []
+        for column in self._columns:
+            values = list(map(column.__getitem__, rows))
+            columns.append(array(column.typecode, values) if isinstance(column, array) else values)
+        return DTColumns(list(self._names), columns, len(rows), list(self._dtypes))
+
+    def nbytes(self) -> int:
+        """Estima la memoria usada por los valores de las columnas."""
+        total = 0
+        for column in self._columns:
+            if isinstance(column, array):
+                total += column.itemsize * len(column)
+            elif isinstance(column, list):
+                total += sys.getsizeof(column) + sum(sys.getsizeof(value) for value in column if value is not MISSING)
+            else:
+                total += sys.getsizeof(column)
+        return total
+
+    def extend(self, records: Iterable[dict[str, Any]]):
+        """Agrega al final los registros indicados.
+
+        Si algun registro repite un valor de un indice unico no se agrega ninguno y se lanza
+        DuplicateKeyException.
+        """
+        self._materialize()
+        if not self._indexes:
+            self._extend(records)
+            return
+        length, width = self._length, len(self._names)
+        # Las columnas que _extend regresa a str se reemplazan por otra lista; se guardan las anteriores
+        # (y su tipo) para restaurarlas si se rechaza el bloque.
+        columns, dtypes = list(self._columns), list(self._dtypes)
+        try:
+            self._extend(records)
+            for index in self._indexes.values():
+                index.extend(self._columns[self._positions[index.name]])
+        except DuplicateKeyException:
+            self._truncate(length, width, columns, dtypes)
+            raise
+
+    def _extend(self, records: Iterable[dict[str, Any]]):
+        columns = self._columns
+        positions = self._positions
+        converters = self._converters
+        for record in records:
+            length = self._length
+            for name, value in record.items():
+                pos = positions.get(name)
+                if pos is None:
+                    # Los nombres se guardan como str: una llave 2024 o None es la columna "2024" o "None".
+                    name = str(name)
+                    pos = positions.get(name)
+                    if pos is None:
+                        pos = self.add_column(name)
+                try:
+                    columns[pos].append(converters[pos](value))
+                except self._CONVERSION_ERRORS:
+                    self._to_str(pos)
+                    columns[pos].append(str(value))
+            self._length = length + 1
+            if len(record) != len(columns):
+                for pos, column in enumerate(columns):
+                    if len(column) == length:
+                        if self._dtypes[pos] is not str:
+                            self._to_str(pos)
+                        columns[pos].append(MISSING)
+
+    def _truncate(self, length: int, width: int, columns: list[Any], dtypes: list[type]):
+        """Descarta las filas desde `length` y las columnas desde `width`; reconstruye los indices.
+
+        `columns` y `dtypes` son las columnas y tipos anteriores, para deshacer los cambios a str.
+        """
+        for name in self._names[width:]:
+            del self._positions[name]
+        for values in (self._names, self._columns, self._dtypes, self._converters, self._owned):
+            del values[width:]
+        for pos, (column, dtype) in enumerate(zip(columns, dtypes)):
+            if self._dtypes[pos] is not dtype:
+                self._columns[pos] = column
+                self._dtypes[pos] = dtype
+                self._converters[pos] = converter(dtype)
+        for column in self._columns:
+            del column[length:]
+        self._length = length
+        for index in self._indexes.values():
+            index.build(self._columns[self._positions[index.name]])
+
+    def __len__(self):
+        return self._length
+
+    @property
+    def names(self) -> list[str]:
+        """Nombres de las columnas en orden de posicion."""
+        return self._names
+
+    @property
+    def columns(self) -> list[list[Any]]:
+        """Valores de cada columna en orden de posicion."""
+        return self._columns
+
+    @property
+    def dtypes(self) -> list[type]:
+        """Tipo de cada columna en orden de posicion."""
+        return self._dtypes
+
+    def position(self, name: str) -> int:
+        """Obtiene la posicion de una columna o None si no existe; los nombres se comparan como str."""
+        return self._positions.get(str(name))
+
+    def require(self, name: str) -> int:
+        """Obtiene la posicion de una columna; lanza ColumnDoesNotExistException si no existe."""
+        pos = self._positions.get(str(name))
+        if pos is None:
+            raise ColumnDoesNotExistException(f"La columna {name} no existe")
+        return pos
+
+    def add_index(self, index: Any):
+        """Construye y registra un indice (DTIndex) sobre su columna; reemplaza el indice anterior."""
+        pos = self.require(index.name)
+        index.build(self._columns[pos])
+        self._indexes[index.name] = index
+
+    def drop_index(self, name: str):
+        """Descarta el indice de una columna, si existe."""
+        self._indexes.pop(name, None)
+
+    def index(self, name: str) -> Any:
+        """Obtiene el indice de una columna o None si no tiene."""
+        return self._indexes.get(name)
+
+    @property
+    def tracker(self) -> DTChangeTracker:
+        """Registro de las filas modificadas y de los archivos guardados."""
+        return self._tracker
+
+    @property
+    def indexes(self) -> dict[str, Any]:
+        """Indices registrados por nombre de columna."""
+        return self._indexes
+
+    def add_column(self, name: str) -> int:
+        """Agrega una columna vacia (MISSING en todas las filas) y regresa su posicion."""
+        name = str(name)
+        pos = len(self._names)
+        self._names.append(name)
+        self._columns.append([MISSING] * self._length)
+        self._dtypes.append(str)
+        self._converters.append(str)
+        self._owned.append(True)
+        self._positions[name] = pos
+        return pos
+
+    def insert_column(self, name: str, values: list[Any]) -> int:
+        """Agrega una columna str con un valor por fila y regresa su posicion."""
+        name = str(name)
+        if name in self._positions:
+            raise ValueError(f"La columna {name} ya existe")
+        if len(values) != self._length:
+            raise ValueError(f"La columna {name} debe tener {self._length} valores, no {len(values)}")
+        pos = len(self._names)
+        self._names.append(name)
+        self._columns.append(values)
+        self._dtypes.append(str)
+        self._converters.append(str)
+        self._owned.append(True)
+        self._positions[name] = pos
+        if any(value is not MISSING for value in values):
+            self._tracker.touch()
+        return pos
+
+    def infer_types(self, sample_size: int = INFER_SAMPLE_SIZE):
+        """Infiere el tipo de las columnas str a partir de sus primeros `sample_size` valores.
+
+        Una columna solo cambia de tipo si todos sus valores conservan su representacion como texto.
+        """
+        for pos, column in enumerate(self._columns):
+            if self._dtypes[pos] is not str:
+                continue
+            dtype = infer_dtype(column[:sample_size])
+            if dtype is not str:
+                typed = to_typed_column(dtype, column)
+                if typed is not None:
+                    self._set_dtype(pos, dtype, typed)
+
+    def astype(self, dtypes: dict[str, Union[str, type]]):
+        """Convierte las columnas indicadas (nombre -> tipo) a su tipo nativo.
+
+        Lanza DataTypeException si algun valor no se puede convertir o si la columna tiene celdas
+        ausentes (filas que no la tienen): solo las columnas str guardan celdas ausentes.
+        """
+        for name, dtype in dtypes.items():
+            pos = self.require(name)
+            dtype = resolve_dtype(dtype)
+            if dtype is str:
+                self._to_str(pos)
+                continue
+            column = self._columns[pos]
+            if not isinstance(column, array) and any(value is MISSING for value in column):
+                raise DataTypeException(
+                    f"La columna {name} tiene celdas ausentes y no se puede convertir a {dtype.__name__}"
+                )
+            self._set_dtype(pos, dtype, to_typed_column(dtype, column, strict=False))
+
+    def _materialize(self, pos: int = None):
+        """Prepara columnas para modificarlas: copia las compartidas y convierte a lista las de solo lectura."""
+        positions = range(len(self._columns)) if pos is None else (pos,)
+        for position in positions:
+            column = self._columns[position]
+            if isinstance(column, (list, array)):
+                if not self._owned[position]:
+                    self._columns[position] = column[:]
+            else:
+                self._columns[position] = list(column)
+            self._owned[position] = True
+
+    def _set_dtype(self, pos: int, dtype: type, column: Any):
+        self._columns[pos] = column
+        self._owned[pos] = True
+        self._dtypes[pos] = dtype
+        self._converters[pos] = converter(dtype)
+        index = self._indexes.get(self._names[pos])
+        if index is not None:
+            index.build(column)
+
+    def _to_str(self, pos: int):
+        column = self._columns[pos]
+        self._set_dtype(pos, str, [value if value is MISSING else str(value) for value in column])
+
+    def get(self, row: int, pos: int) -> Any:
+        """Obtiene el valor de una celda."""
+        return self._columns[pos][row]
+
+    def set(self, row: int, name: str, value: Any) -> tuple[int, bool]:
+        """Asigna el valor de una celda, creando la columna si no existe.
+
+        Regresa la posicion de la columna y si fue creada.
+        """
+        pos = self.position(name)
+        created = pos is None
+        if created:
+            pos = self.add_column(name)
+        self._materialize(pos)
+        index = self._indexes.get(self._names[pos]) if self._indexes else None
+        try:
+            value = self._converters[pos](value)
+        except self._CONVERSION_ERRORS:
+            self._to_str(pos)
+            value = str(value)
+        if index is not None:
+            index.check(row, value)
+        self._tracker.touch((row,))
+        if index is None:
+            self._columns[pos][row] = value
+            return pos, created
+        column = self._columns[pos]
+        old = column[row]
+        column[row] = value
+        index.replace(row, old, value)
+        return pos, created
+
+    def assign(self, name: str, rows: list[int], values: list[Any]) -> tuple[int, bool]:
+        """Asigna en bloque los valores de una columna en las filas indicadas (None para todas).
+
+        Crea la columna si no existe; si algun valor no se puede convertir al tipo de la columna,
+        la columna regresa a str. Regresa la posicion de la columna y si fue creada.
+        """
+        pos = self.position(name)
+        created = pos is None
+        if created:
+            pos = self.add_column(name)
+        self._materialize(pos)
+        try:
+            values = list(map(self._converters[pos], values))
+        except self._CONVERSION_ERRORS:
+            self._to_str(pos)
+            values = list(map(str, values))
+        column = self._columns[pos]
+        index = self._indexes.get(self._names[pos])
+        # Para deshacer una violacion de un indice unico basta la columna anterior (si se reemplaza
+        # completa) o los valores anteriores de las filas asignadas.
+        previous = [column[row] for row in rows] if index is not None and index.unique and rows is not None else None
+        if rows is None:
+            self._columns[pos] = array(column.typecode, values) if isinstance(column, array) else values
+        else:
+            for row, value in zip(rows, values):
+                column[row] = value
+        if index is not None:
+            try:
+                index.build(self._columns[pos])
+            except DuplicateKeyException:
+                if rows is None:
+                    self._columns[pos] = column
+                else:
+                    for row, value in zip(rows, previous):
+                        column[row] = value
+                index.build(column)
+                raise
+        self._tracker.touch(rows)
+        return pos, created
+
+    def iter_tuples(self, fill: Any = "", start: int = 0) -> Iterator[tuple[Any, ...]]:
+        """Itera las filas desde `start` como tuplas en orden de columna, usando `fill` en las celdas ausentes.
+
+        Con fill=MISSING las celdas ausentes se entregan sin reemplazar.
+        """
+        if not self._columns:
+            yield from (() for _ in range(start, self._length))
+            return
+        columns = [column[start:] for column in self._columns] if start else self._columns
+        for values in zip(*columns):
+            if fill is not MISSING and MISSING in values:
+                values = tuple(fill if value is MISSING else value for value in values)
+            yield values
+
+    def record(self, row: int) -> dict[str, Any]:
+        """Obtiene una fila como diccionario, omitiendo las celdas ausentes."""
+        result = {}
+        for name, column in zip(self._names, self._columns):
+            value = column[row]
+            if value is not MISSING:
+                result[name] = value
+        return result
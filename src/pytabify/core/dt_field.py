@@ -1,10 +1,16 @@
 class DTField:
-    """DTField"""
+    """DTField
+
+    Vista ligera de una celda; se crea solo cuando se accede a ella desde un DTRow.
+    `value` siempre es texto; `typed_value` es el valor nativo cuando la columna tiene tipo.
+    """
+    __slots__ = ("_name", "_value", "_typed_value", "_index")
+
     def __init__(self, name: str, value: str, index: int):
         self._name = str(name)
         self._value = str(value)
+        self._typed_value = value
         self._index = index
-        self._len = len(str(value))
 
     def __str__(self):
         return self._value
@@ -29,15 +35,20 @@ class DTField:
         """value"""
         return self._value
 
+    @property
+    def typed_value(self):
+        """typed_value"""
+        return self._typed_value
+
     @property
     def index(self):
         """index"""
         return self._index
 
     def __len__(self):
-        return self._len
+        return len(self._value)
 
     @property
     def length(self):
         """length"""
-        return self._len
+        return len(self._value)
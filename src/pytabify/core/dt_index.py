@@ -0,0 +1,126 @@
+"""Indices secundarios sobre las columnas de un DTColumns."""
+from bisect import bisect_left, bisect_right, insort
+from typing import Any, Iterable
+from pytabify.core.dt_columns import MISSING
+from pytabify.utils.errors import DuplicateKeyException
+
+INDEX_KINDS = ("hash", "sorted")
+INSORT_LIMIT = 32
+"""Filas nuevas que un indice ordenado inserta una a una; con mas se ordena la lista completa."""
+
+class DTIndex:
+    """Indice de una columna: relaciona cada valor con las filas que lo contienen.
+
+    kind="hash" busca por igualdad; kind="sorted" ademas guarda los valores ordenados
+    para consultar rangos. Con unique=True no se permiten valores repetidos.
+    Las celdas ausentes no se indexan.
+    """
+
+    def __init__(self, name: str, kind: str = "hash", unique: bool = False):
+        if kind not in INDEX_KINDS:
+            raise ValueError(f"kind debe ser uno de {list(INDEX_KINDS)}, no {kind}")
+        self._name = name
+        self._kind = kind
+        self._unique = unique
+        self._rows: dict[Any, list[int]] = {}
+        self._entries: list[tuple[Any, int]] = []
+        self._size = 0
+
+    @property
+    def name(self) -> str:
+        """Nombre de la columna indexada."""
+        return self._name
+
+    @property
+    def kind(self) -> str:
+        """Tipo de indice: "hash" o "sorted"."""
+        return self._kind
+
+    @property
+    def unique(self) -> bool:
+        """Indica si los valores de la columna deben ser unicos."""
+        return self._unique
+
+    def build(self, column: Iterable[Any]):
+        """Construye el indice con todos los valores de la columna."""
+        self._rows = {}
+        self._entries = []
+        self._size = 0
+        self.extend(column)
+
+    def extend(self, column: Any):
+        """Indexa las filas agregadas a la columna desde la ultima vez que se indexo.
+
+        En un indice ordenado las filas nuevas se insertan una a una si son pocas;
+        si no, se agregan al final y la lista se ordena una sola vez.
+        """
+        added = []
+        rows = self._rows
+        for row in range(self._size, len(column)):
+            value = column[row]
+            if value is MISSING:
+                continue
+            found = rows.setdefault(value, [])
+            if self._unique and found:
+                raise DuplicateKeyException(f"El valor {value!r} ya existe en la columna {self._name}")
+            found.append(row)
+            added.append((value, row))
+        self._size = len(column)
+        if self._kind != "sorted":
+            return
+        if len(added) <= INSORT_LIMIT:
+            for entry in added:
+                insort(self._entries, entry)
+        else:
+            self._entries.extend(added)
+            self._entries.sort()
+
+    def check(self, row: int, value: Any):
+        """Lanza DuplicateKeyException si asignar `value` a la fila repite un valor de un indice unico."""
+        if self._unique and value is not MISSING:
+            rows = self._rows.get(value)
+            if rows and rows != [row]:
+                raise DuplicateKeyException(f"El valor {value!r} ya existe en la columna {self._name}")
+
+    def add(self, row: int, value: Any):
+        """Agrega una fila al indice."""
+        if value is MISSING:
+            return
+        rows = self._rows.setdefault(value, [])
+        if self._unique and rows:
+            raise DuplicateKeyException(f"El valor {value!r} ya existe en la columna {self._name}")
+        rows.append(row)
+        if self._kind == "sorted":
+            insort(self._entries, (value, row))
+
+    def remove(self, row: int, value: Any):
+        """Quita una fila del indice."""
+        if value is MISSING:
+            return
+        rows = self._rows[value]
+        rows.remove(row)
+        if not rows:
+            del self._rows[value]
+        if self._kind == "sorted":
+            del self._entries[bisect_left(self._entries, (value, row))]
+
+    def replace(self, row: int, old: Any, new: Any):
+        """Actualiza el valor indexado de una fila."""
+        self.remove(row, old)
+        self.add(row, new)
+
+    def get(self, value: Any) -> list[int]:
+        """Obtiene las filas con el valor indicado, en orden de fila."""
+        return sorted(self._rows.get(value, ()))
+
+    def between(self, low: Any = None, high: Any = None) -> list[int]:
+        """Obtiene las filas con valores entre `low` y `high` (inclusive), ordenadas por valor.
+
+        Solo disponible en indices kind="sorted"; None indica un rango abierto.
+        """
+        if self._kind != "sorted":
+            raise ValueError(f"El indice de la columna {self._name} no es ordenado (kind='sorted').")
+        entries = self._entries
+        start = 0 if low is None else bisect_left(entries, (low,))
+        stop = len(entries) if high is None else bisect_right(entries, (high, len(entries) + self._size))
+        return [row for _, row in entries[start:stop]]
@@ -0,0 +1,164 @@
+"""Union (join) por llave de dos almacenamientos columnares."""
+from array import array
+from typing import Any, Union
+from pytabify.core.dt_columns import DTColumns, MISSING
+
+JOIN_HOWS = ("inner", "left", "outer")
+JOIN_METHODS = ("hash", "merge")
+
+def join(
+    left: DTColumns,
+    right: DTColumns,
+    on: Union[str, list[str]],
+    how: str = "inner",
+    method: str = "hash",
+    suffix: str = "_right"
+) -> DTColumns:
+    """Une dos almacenamientos por las columnas `on`.
+
+    method="hash" construye una tabla hash con `right` y conserva el orden de `left`;
+    method="merge" recorre ambos ordenados por la llave (lineal si ya vienen ordenados)
+    y entrega las filas en orden de llave. Las llaves con celdas ausentes no coinciden con ninguna.
+    Las columnas de `right` que ya existen en `left` se renombran agregando `suffix`.
+    """
+    if how not in JOIN_HOWS:
+        raise ValueError(f"how debe ser uno de {list(JOIN_HOWS)}, no {how}")
+    if method not in JOIN_METHODS:
+        raise ValueError(f"method debe ser uno de {list(JOIN_METHODS)}, no {method}")
+    names = [on] if isinstance(on, str) else list(on)
+    left_keys = _keys(left, right, names)
+    right_keys = _keys(right, left, names)
+    pairs = _hash_pairs if method == "hash" else _merge_pairs
+    left_rows, right_rows = pairs(left, right, names, left_keys, right_keys, how)
+    return _build(left, right, names, left_rows, right_rows, suffix)
+
+def _keys(store: DTColumns, other: DTColumns, names: list[str]) -> list[tuple]:
+    """Llaves de cada fila; si el tipo de una columna difiere entre ambos lados se compara como texto."""
+    columns = []
+    for name in names:
+        pos, other_pos = store.require(name), other.require(name)
+        column = store.columns[pos]
+        if store.dtypes[pos] is not other.dtypes[other_pos]:
+            column = [value if value is MISSING else str(value) for value in column]
+        columns.append(column)
+    if not columns:
+        return [() for _ in range(len(store))]
+    return list(zip(*columns))
+
+def _hash_pairs(left, right, names, left_keys, right_keys, how) -> tuple[list, list]:
+    table: dict[tuple, list[int]] = {}
+    for row, key in enumerate(right_keys):
+        if MISSING not in key:
+            table.setdefault(key, []).append(row)
+    left_rows, right_rows = [], []
+    matched = set()
+    for row, key in enumerate(left_keys):
+        found = table.get(key) if MISSING not in key else None
+        if found:
+            left_rows.extend([row] * len(found))
+            right_rows.extend(found)
+            if how == "outer":
+                matched.add(key)
+        elif how != "inner":
+            left_rows.append(row)
+            right_rows.append(None)
+    if how == "outer":
+        for row, key in enumerate(right_keys):
+            if key not in matched:
+                left_rows.append(None)
+                right_rows.append(row)
+    return left_rows, right_rows
+
+def _merge_pairs(left, right, names, left_keys, right_keys, how) -> tuple[list, list]:
+    left_order = _key_order(left_keys)
+    right_order = _key_order(right_keys)
+    left_rows, right_rows = [], []
+    i = j = 0
+    while i < len(left_order) and j < len(right_order):
+        key, other = left_keys[left_order[i]], right_keys[right_order[j]]
+        if key < other:
+            if how != "inner":
+                left_rows.append(left_order[i])
+                right_rows.append(None)
+            i += 1
+        elif other < key:
+            if how == "outer":
+                left_rows.append(None)
+                right_rows.append(right_order[j])
+            j += 1
+        else:
+            i_end, j_end = i, j
+            while i_end < len(left_order) and left_keys[left_order[i_end]] == key:
+                i_end += 1
+            while j_end < len(right_order) and right_keys[right_order[j_end]] == key:
+                j_end += 1
+            for left_row in left_order[i:i_end]:
+                left_rows.extend([left_row] * (j_end - j))
+                right_rows.extend(right_order[j:j_end])
+            i, j = i_end, j_end
+    if how != "inner":
+        rest = left_order[i:] + [row for row in range(len(left)) if MISSING in left_keys[row]]
+        left_rows.extend(rest)
+        right_rows.extend([None] * len(rest))
+    if how == "outer":
+        rest = right_order[j:] + [row for row in range(len(right)) if MISSING in right_keys[row]]
+        left_rows.extend([None] * len(rest))
+        right_rows.extend(rest)
+    return left_rows, right_rows
+
+def _key_order(keys: list[tuple]) -> list[int]:
+    """Filas sin celdas ausentes ordenadas por las mismas llaves que compara el merge."""
+    rows = [row for row, key in enumerate(keys) if MISSING not in key]
+    return sorted(rows, key=keys.__getitem__)
+
+def _build(left, right, names, left_rows, right_rows, suffix) -> DTColumns:
+    out_names, columns, dtypes = [], [], []
+    for pos, name in enumerate(left.names):
+        if name in names:
+            right_pos = right.position(name)
+            column, dtype = _coalesce(
+                left.columns[pos], left.dtypes[pos], left_rows,
+                right.columns[right_pos], right.dtypes[right_pos], right_rows
+            )
+        else:
+            column, dtype = _gather(left.columns[pos], left.dtypes[pos], left_rows)
+        out_names.append(name)
+        columns.append(column)
+        dtypes.append(dtype)
+    taken = set(left.names)
+    for pos, name in enumerate(right.names):
+        if name in names:
+            continue
+        column, dtype = _gather(right.columns[pos], right.dtypes[pos], right_rows)
+        while name in taken:
+            name += suffix
+        taken.add(name)
+        out_names.append(name)
+        columns.append(column)
+        dtypes.append(dtype)
+    return DTColumns(out_names, columns, len(left_rows), dtypes)
+
+def _gather(column: Any, dtype: type, rows: list[int]) -> tuple[Any, type]:
+    """Toma las filas indicadas de una columna; None es una fila sin pareja (celda ausente)."""
+    if None not in rows:
+        values = list(map(column.__getitem__, rows))
+        return (array(column.typecode, values) if isinstance(column, array) else values), dtype
+    values = [MISSING if row is None else column[row] for row in rows]
+    if dtype is not str:
+        values = [value if value is MISSING else str(value) for value in values]
+    return values, str
+
+def _coalesce(left_column, left_dtype, left_rows, right_column, right_dtype, right_rows) -> tuple[Any, type]:
+    """Columna de la llave: el valor de `left` o, en filas solo de `right`, el de `right`."""
+    if None not in left_rows:
+        return _gather(left_column, left_dtype, left_rows)
+    same = left_dtype is right_dtype
+    values = [
+        left_column[row] if row is not None else right_column[other]
+        for row, other in zip(left_rows, right_rows)
+    ]
+    if not same or MISSING in values:
+        return [value if value is MISSING else str(value) for value in values], str
+    if isinstance(left_column, array):
+        return array(left_column.typecode, values), left_dtype
+    return values, left_dtype
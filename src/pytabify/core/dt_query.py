@@ -0,0 +1,175 @@
+"""Consultas por columnas sobre el almacenamiento de un DataTable (filtros, orden, agrupacion)."""
+from statistics import mean
+from typing import Any, Callable, Union
+from pytabify.core.dt_columns import DTColumns, MISSING
+from pytabify.core.dt_types import converter, infer_dtype, to_typed_column
+from pytabify.utils.errors import DataTypeException
+
+Predicate = Union[Callable[[Any], bool], Any]
+Aggregation = tuple[str, Union[str, Callable[[list[Any]], Any]]]
+
+def _number(value: Any) -> Union[int, float]:
+    if isinstance(value, (int, float)):
+        return value
+    try:
+        return int(value)
+    except ValueError:
+        return float(value)
+
+def _numbers(values: list[Any]) -> list[Union[int, float]]:
+    return [_number(value) for value in values]
+
+AGGREGATIONS: dict[str, Callable[[list[Any]], Any]] = {
+    "count": len,
+    "sum": lambda values: sum(_numbers(values)),
+    "mean": lambda values: mean(_numbers(values)) if values else None,
+    "min": lambda values: min(values) if values else None,
+    "max": lambda values: max(values) if values else None,
+    "first": lambda values: values[0] if values else None,
+    "last": lambda values: values[-1] if values else None,
+}
+"""Agregaciones disponibles por nombre; reciben los valores (sin celdas ausentes) de cada grupo."""
+
+def matching_rows(store: DTColumns, conditions: dict[str, Predicate]) -> list[int]:
+    """Obtiene las filas que cumplen todas las condiciones, evaluando una columna a la vez.
+
+    Una condicion es una funcion que recibe el valor de la celda o un valor a comparar por igualdad.
+    Las celdas ausentes nunca cumplen una condicion.
+    Las condiciones de igualdad sobre columnas con indice se resuelven con el indice.
+    """
+    rows = None
+    indexed = [
+        name for name, condition in conditions.items() if not callable(condition) and store.index(name) is not None
+    ]
+    for name in indexed:
+        found = index_rows(store, name, conditions[name])
+        if rows is not None:
+            found = set(found)
+            found = [row for row in rows if row in found]
+        rows = found
+    for name, condition in conditions.items():
+        pos = store.require(name)
+        if name in indexed:
+            continue
+        column = store.columns[pos]
+        test = condition if callable(condition) else _equals(store.dtypes[pos], condition)
+        candidates = range(len(store)) if rows is None else rows
+        rows = [row for row in candidates if (value := column[row]) is not MISSING and test(value)]
+    return list(range(len(store))) if rows is None else rows
+
+def index_rows(store: DTColumns, name: str, value: Any) -> list[int]:
+    """Obtiene las filas cuyo valor es igual a `value` usando el indice de la columna."""
+    pos = store.require(name)
+    try:
+        value = converter(store.dtypes[pos])(value)
+    except (ValueError, TypeError, OverflowError):
+        return []
+    return store.index(name).get(value)
+
+def range_rows(store: DTColumns, name: str, low: Any = None, high: Any = None) -> list[int]:
+    """Obtiene las filas con valores entre `low` y `high` (inclusive), ordenadas por valor.
+
+    Usa el indice ordenado de la columna si existe; si no, recorre la columna.
+    None indica un rango abierto. Lanza DataTypeException si un limite no es del tipo de la columna.
+    """
+    pos = store.require(name)
+    convert = converter(store.dtypes[pos])
+    try:
+        low = None if low is None else convert(low)
+        high = None if high is None else convert(high)
+    except (ValueError, TypeError, OverflowError) as exc:
+        raise DataTypeException(f"Los limites del rango no son del tipo de la columna {name}") from exc
+    index = store.index(name)
+    if index is not None and index.kind == "sorted":
+        return index.between(low, high)
+    column = store.columns[pos]
+    rows = [
+        row for row, value in enumerate(column)
+        if value is not MISSING and (low is None or value >= low) and (high is None or value <= high)
+    ]
+    return sorted(rows, key=column.__getitem__)
+
+def text_condition(condition: Predicate) -> Callable[[str], bool]:
+    """Convierte una condicion en una funcion que recibe el valor de la celda como texto."""
+    if callable(condition):
+        return condition
+    return str(condition).__eq__
+
+def _equals(dtype: type, expected: Any) -> Callable[[Any], bool]:
+    try:
+        expected = converter(dtype)(expected)
+    except (ValueError, TypeError, OverflowError):
+        return lambda value: False
+    return lambda value: value == expected
+
+def sorted_rows(store: DTColumns, names: list[str], reverse: bool = False) -> list[int]:
+    """Obtiene el orden de las filas segun las columnas indicadas; las celdas ausentes van al final."""
+    columns = [store.columns[store.require(name)] for name in names]
+    keys = [
+        tuple((True, "") if value is MISSING else (False, value) for value in values)
+        for values in zip(*columns)
+    ]
+    order = sorted(range(len(store)), key=keys.__getitem__, reverse=reverse)
+    if reverse:
+        missing = [row for row in order if any(key[0] for key in keys[row])]
+        order = [row for row in order if not any(key[0] for key in keys[row])] + missing
+    return order
+
+def distinct_rows(store: DTColumns, names: list[str]) -> list[int]:
+    """Obtiene la primer fila de cada combinacion distinta de valores de las columnas indicadas."""
+    columns = [store.columns[store.require(name)] for name in names]
+    first = {}
+    for row, key in enumerate(zip(*columns)):
+        first.setdefault(key, row)
+    return list(first.values())
+
+class DTGroupBy:
+    """Agrupacion de un DataTable por una o mas columnas.
+
+    Ejemplo:
+
+    ```python
+    dt.group_by("city").agg(total=("amount", "sum"), people=("id", "count"))
+    ```
+    """
+
+    def __init__(self, store: DTColumns, names: list[str], wrap: Callable[[DTColumns], Any] = None):
+        self._store = store
+        self._names = list(names)
+        self._wrap = wrap
+        columns = [store.columns[store.require(name)] for name in self._names]
+        self._groups: dict[tuple, list[int]] = {}
+        for row, key in enumerate(zip(*columns)):
+            self._groups.setdefault(key, []).append(row)
+
+    def __len__(self):
+        return len(self._groups)
+
+    def groups(self) -> dict[tuple, list[int]]:
+        """Relaciona cada combinacion de valores con las filas del grupo."""
+        return self._groups
+
+    def agg(self, **aggregations: Aggregation) -> Any:
+        """Calcula una columna por agregacion: nombre=(columna, "count"|"sum"|"mean"|"min"|"max"|"first"|"last" o funcion)."""
+        store = self._store
+        keys = list(self._groups)
+        names = list(self._names)
+        columns = [[key[index] for key in keys] for index in range(len(self._names))]
+        dtypes = [store.dtypes[store.position(name)] for name in self._names]
+
+        for name, (column_name, function) in aggregations.items():
+            column = store.columns[store.require(column_name)]
+            function = AGGREGATIONS[function] if isinstance(function, str) else function
+            values = [
+                function([value for value in map(column.__getitem__, rows) if value is not MISSING])
+                for rows in self._groups.values()
+            ]
+            dtype = infer_dtype(values)
+            typed = to_typed_column(dtype, values)
+            if typed is None:
+                dtype, typed = str, to_typed_column(str, values)
+            names.append(name)
+            columns.append(typed)
+            dtypes.append(dtype)
+        result = DTColumns(names, columns, len(keys), dtypes)
+        return self._wrap(result) if self._wrap else result
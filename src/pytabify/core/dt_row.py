@@ -1,54 +1,77 @@
 from pytabify.core.dt_field import DTField
+from pytabify.core.dt_columns import DTColumns, MISSING
 from pytabify.utils.observer import FieldChangeObserver
 
 class DTRow:
-    """DTRow"""
+    """DTRow
+
+    Vista de una fila sobre el almacenamiento columnar (DTColumns) de un DataTable.
+    """
     def __init__(self, fields: list[DTField], index: int, observer: FieldChangeObserver):
-        self._fields = fields
-        self._observer = observer
+        store = DTColumns(
+            names=[field.name for field in fields],
+            columns=[[field.value] for field in fields],
+            length=1
+        )
+        self._bind(store, 0, observer)
         self._index = index
 
-    def __setitem__(self, name, value):
-        new_index = self._observer.new_index()
-        if new_index == 0:
-            new_index = len(self._fields)
+    @classmethod
+    def view(cls, store: DTColumns, index: int, observer: FieldChangeObserver) -> "DTRow":
+        """Crea una vista de la fila `index` sobre un almacenamiento existente."""
+        row = cls.__new__(cls)
+        row._bind(store, index, observer)
+        return row
+
+    def _bind(self, store: DTColumns, index: int, observer: FieldChangeObserver):
+        self._store = store
+        self._row = index
+        self._index = index
+        self._observer = observer
 
-        field = DTField(name, value, new_index)
-        self._fields.append(field)
-        self._observer.notify(new_index, field)
+    def _set_field(self, name, value):
+        pos, created = self._store.set(self._row, name, value)
+        if created:
+            self._observer.notify(pos, self._field(pos))
+
+    def _field(self, pos: int) -> DTField:
+        value = self._store.get(self._row, pos)
+        if value is MISSING:
+            return None
+        return DTField(self._store.names[pos], value, pos)
+
+    def __setitem__(self, name, value):
+        self._set_field(name, value)
 
     def __setattr__(self, name, value):
         if name.startswith("_"):
             super().__setattr__(name, value)
         else:
-            new_index = self._observer.new_index()
-            if new_index == 0:
-                new_index = len(self._fields)
-
-            field = DTField(name, value, new_index)
-            self._fields.append(field)
-            self._observer.notify(new_index, field)
+            self._set_field(name, value)
 
     def __getitem__(self, name: str) -> DTField:
-        values = list(filter(lambda field: field.name == name, self._fields))
-        if values:
-            return values[0]
+        pos = self._store.position(name)
+        if pos is not None:
+            return self._field(pos)
 
     def __getattr__(self, name: str) -> DTField:
-        values = list(filter(lambda field: field.name == name, self._fields))
-        if values:
-            return values[0]
+        if name.startswith("_"):
+            raise AttributeError(name)
+        pos = self._store.position(name)
+        if pos is not None:
+            return self._field(pos)
 
     def __len__(self):
-        return len(self._fields)
+        return self.total_fields()
 
     def total_fields(self):
         """total_fields"""
-        return len(self._fields)
+        return sum(1 for column in self._store.columns if column[self._row] is not MISSING)
 
     def to_dict(self):
         """to_dict"""
-        return {field.name:field.value for field in self._fields}
+        return self._store.record(self._row)
 
     def __iter__(self):
-        return iter(self._fields)
+        fields = (self._field(pos) for pos in range(len(self._store.names)))
+        return (field for field in fields if field is not None)
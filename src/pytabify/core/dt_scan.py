@@ -0,0 +1,86 @@
+"""Consultas perezosas sobre un archivo: el filtro y la proyeccion se delegan a la lectura."""
+from typing import Any, Callable
+from pytabify.core.dt_query import Predicate, text_condition
+from pytabify.utils.errors import ColumnDoesNotExistException
+
+class DTScan:
+    """Plan de consulta perezoso sobre un archivo.
+
+    Ejemplo:
+
+    ```python
+    dt = DataTableCreator.scan("data.csv").where(status="active").select("id", "name").collect()
+    ```
+
+    `where` y `select` solo agregan pasos al plan y regresan un nuevo DTScan. `collect` lee el archivo
+    una sola vez pasando las columnas y el filtro a la estrategia de lectura, asi las celdas de las
+    columnas y filas descartadas no se guardan ni se convierten a DTField.
+    Las condiciones reciben el valor de la celda como texto (igual que `DTField.value`)
+    o un valor a comparar por igualdad.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        load: Callable[..., Any],
+        options: dict[str, Any] = None,
+        conditions: list[tuple[str, Predicate]] = None,
+        columns: list[str] = None
+    ):
+        self._path = path
+        self._load = load
+        self._options = dict(options or {})
+        self._conditions = list(conditions or [])
+        self._columns = columns
+
+    def _step(self, conditions: list[tuple[str, Predicate]], columns: list[str]) -> "DTScan":
+        return DTScan(self._path, self._load, self._options, conditions, columns)
+
+    def where(self, column: str = None, condition: Predicate = None, **conditions: Predicate) -> "DTScan":
+        """Agrega un filtro al plan; varias condiciones sobre la misma columna deben cumplirse todas."""
+        if column is not None:
+            conditions = {column: condition, **conditions}
+        if self._columns is not None:
+            missing = [name for name in conditions if name not in self._columns]
+            if missing:
+                raise ColumnDoesNotExistException(f"Las columnas {missing} no fueron seleccionadas")
+        return self._step(self._conditions + list(conditions.items()), self._columns)
+
+    def select(self, *columns: str) -> "DTScan":
+        """Agrega una proyeccion al plan; solo se leen las columnas indicadas, en ese orden."""
+        if self._columns is not None:
+            missing = [name for name in columns if name not in self._columns]
+            if missing:
+                raise ColumnDoesNotExistException(f"Las columnas {missing} no fueron seleccionadas")
+        return self._step(self._conditions, list(columns))
+
+    def plan(self) -> dict[str, Any]:
+        """Describe lo que se delega a la lectura: el archivo, las columnas y las columnas filtradas."""
+        return {
+            "path": self._path,
+            "columns": None if self._columns is None else list(self._columns),
+            "where": list(dict.fromkeys(name for name, _ in self._conditions))
+        }
+
+    def reader_options(self) -> dict[str, Any]:
+        """Opciones `columns` y `where` para la estrategia de lectura."""
+        options = {}
+        if self._columns is not None:
+            options["columns"] = list(self._columns)
+        if self._conditions:
+            found: dict[str, list] = {}
+            for name, condition in self._conditions:
+                found.setdefault(name, []).append(condition)
+            # Una condicion por columna se pasa sin convertir: un valor (no una funcion) permite usar el cache.
+            options["where"] = {
+                name: conditions[0] if len(conditions) == 1 else _all_of([text_condition(c) for c in conditions])
+                for name, conditions in found.items()
+            }
+        return options
+
+    def collect(self) -> Any:
+        """Ejecuta el plan y regresa el DataTable resultante."""
+        return self._load(self._path, **self._options, **self.reader_options())
+
+def _all_of(tests: list[Callable[[str], bool]]) -> Callable[[str], bool]:
+    return lambda value: all(test(value) for test in tests)
@@ -0,0 +1,74 @@
+"""Registro de cambios de un DTColumns para guardar solo lo nuevo desde el ultimo guardado."""
+import os
+from dataclasses import dataclass
+from typing import Any
+
+@dataclass(frozen=True)
+class DTDelta:
+    """Cambios pendientes de guardar en un archivo: filas desde `start` y columnas nuevas."""
+    start: int
+    columns: list[str]
+
+class DTChangeTracker:
+    """Registra que filas se modificaron y en que momento (version) se guardo cada archivo.
+
+    Solo se guarda la version de las filas modificadas; las filas agregadas al final no se registran
+    porque se detectan por el numero de filas guardadas. Al guardar se descartan los registros
+    que ya no afectan a ningun archivo.
+    """
+
+    def __init__(self):
+        self._version = 0
+        self._all = 0
+        self._rows: dict[int, int] = {}
+        self._saves: dict[str, tuple[int, int, tuple[str, ...], tuple[int, int]]] = {}
+
+    def touch(self, rows: Any = None):
+        """Registra la modificacion de las filas indicadas (o de todas si es None)."""
+        self._version += 1
+        if rows is None:
+            self._all = self._version
+            self._rows.clear()
+            return
+        version = self._version
+        for row in rows:
+            self._rows[row] = version
+
+    def dirty_rows(self, path: str) -> list[int]:
+        """Filas ya guardadas en `path` que se modificaron despues (todas si no se ha guardado)."""
+        save = self._saves.get(os.path.abspath(path))
+        if save is None:
+            return None
+        version, rows = save[0], save[1]
+        if self._all > version:
+            return list(range(rows))
+        return sorted(row for row, changed in self._rows.items() if changed > version and row < rows)
+
+    def delta(self, path: str, length: int, names: list[str]) -> DTDelta:
+        """Obtiene lo que falta guardar en `path`, o None si se debe volver a escribir completo.
+
+        Se escribe completo si no se ha guardado antes, si el archivo cambio desde entonces,
+        si cambio alguna fila ya guardada o si se quitaron filas o columnas.
+        """
+        key = os.path.abspath(path)
+        save = self._saves.get(key)
+        if save is None or _stamp(key) != save[3]:
+            return None
+        _, rows, saved_names, _ = save
+        if length < rows or tuple(names[:len(saved_names)]) != saved_names or self.dirty_rows(key):
+            return None
+        return DTDelta(rows, list(names[len(saved_names):]))
+
+    def saved(self, path: str, length: int, names: list[str]):
+        """Registra que `path` contiene las primeras `length` filas con las columnas `names`."""
+        key = os.path.abspath(path)
+        self._saves[key] = (self._version, length, tuple(names), _stamp(key))
+        oldest = min(save[0] for save in self._saves.values())
+        self._rows = {row: version for row, version in self._rows.items() if version > oldest}
+
+def _stamp(path: str) -> tuple[int, int]:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
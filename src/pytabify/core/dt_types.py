@@ -0,0 +1,100 @@
+from array import array
+from datetime import date
+from typing import Any, Callable, Sequence, Union
+from pytabify.utils.errors import DataTypeException
+
+INFER_SAMPLE_SIZE = 1000
+
+DTYPES = {"str": str, "int": int, "float": float, "bool": bool, "date": date}
+"""Tipos de columna soportados, por nombre."""
+
+_INFER_ORDER = (bool, int, float, date)
+_TYPECODES = {int: "q", float: "d"}
+_ERRORS = (ValueError, TypeError, OverflowError)
+
+def _parse_bool(text: str) -> bool:
+    if text == "True":
+        return True
+    if text == "False":
+        return False
+    raise ValueError(f"{text} no es un valor bool")
+
+def _parse_bool_lenient(text: str) -> bool:
+    lowered = text.strip().lower()
+    if lowered in ("true", "1", "yes", "si"):
+        return True
+    if lowered in ("false", "0", "no"):
+        return False
+    raise ValueError(f"{text} no es un valor bool")
+
+_PARSERS = {int: int, float: float, bool: _parse_bool, date: date.fromisoformat}
+_LENIENT_PARSERS = {int: int, float: float, bool: _parse_bool_lenient, date: date.fromisoformat}
+
+def resolve_dtype(dtype: Union[str, type]) -> type:
+    """Obtiene el tipo de columna a partir de su nombre o del tipo mismo."""
+    resolved = DTYPES.get(dtype, dtype)
+    if resolved not in DTYPES.values():
+        raise DataTypeException(f"El tipo {dtype} no es soportado. Opciones: {list(DTYPES)}")
+    return resolved
+
+def converter(dtype: type) -> Callable[[Any], Any]:
+    """Obtiene el convertidor estricto de un tipo de columna.
+
+    Solo acepta valores cuya representacion como texto se conserva (`str(convertido) == str(valor)`),
+    asi DTField.value regresa lo mismo que sin tipos. Lanza ValueError, TypeError u OverflowError si no.
+    """
+    if dtype is str:
+        return str
+    parse = _PARSERS[dtype]
+
+    def convert(value: Any) -> Any:
+        if type(value) is dtype:
+            return value
+        text = value if type(value) is str else str(value)
+        result = parse(text)
+        if str(result) != text:
+            raise ValueError(f"{text} no conserva su representacion como {dtype.__name__}")
+        return result
+    return convert
+
+def infer_dtype(values: Sequence[Any]) -> type:
+    """Infiere el tipo de una columna a partir de una muestra de sus valores."""
+    if not values:
+        return str
+    for dtype in _INFER_ORDER:
+        convert = converter(dtype)
+        try:
+            for value in values:
+                convert(value)
+        except _ERRORS:
+            continue
+        return dtype
+    return str
+
+def to_typed_column(dtype: type, values: Sequence[Any], strict: bool = True) -> Sequence[Any]:
+    """Convierte los valores de una columna a su representacion compacta.
+
+    Los enteros y flotantes se guardan en `array('q')`/`array('d')`.
+    Con `strict` regresa None si algun valor no se puede convertir; sin `strict`
+    convierte cualquier texto valido y lanza DataTypeException si falla.
+    """
+    if dtype is str:
+        return [str(value) for value in values]
+    convert = converter(dtype) if strict else _lenient_converter(dtype)
+    try:
+        converted = [convert(value) for value in values]
+        typecode = _TYPECODES.get(dtype)
+        return array(typecode, converted) if typecode else converted
+    except _ERRORS as exc:
+        if strict:
+            return None
+        raise DataTypeException(f"No fue posible convertir la columna a {dtype.__name__}: {exc}") from exc
+
+def _lenient_converter(dtype: type) -> Callable[[Any], Any]:
+    parse = _LENIENT_PARSERS[dtype]
+
+    def convert(value: Any) -> Any:
+        if type(value) is dtype:
+            return value
+        return parse(value if type(value) is str else str(value))
+    return convert
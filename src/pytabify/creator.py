@@ -1,12 +1,19 @@
 import os
-from typing import Any
+from typing import Any, AsyncIterator, Iterator, Union
 from pytabify.core.datatable import DataTable
+from pytabify.core.dt_columns import DTColumns
 from pytabify.core.dt_row import DTRow
-from pytabify.core.dt_field import DTField
+from pytabify.core.dt_scan import DTScan
+from pytabify.io import compression
 from pytabify.io.file_formats import FileFormats
+from pytabify.io.interfaces.read import ReadingStrategy, DEFAULT_CHUNK_SIZE
 from pytabify.utils.observer import FieldChangeObserver
+from pytabify.utils import instrumentation
 from pytabify.utils.validation import validate_data
-from pytabify.utils.errors import FileExtensionException
+from pytabify.utils.table_cache import DataTableCache, CacheInfo
+from pytabify.utils.errors import FileExtensionException, FilesReadingException
+
+DTypes = Union[str, dict[str, Union[str, type]]]
 
 class DataTableCreator:
     """Permite crear un DataTable a partir de un archivo o de una lista de diccionarios.
@@ -18,48 +25,341 @@ class DataTableCreator:
 
     dt = DataTableCreator.from_file("data.json")
     dt = DataTableCreator.from_records([{"name": "Alice", "age": 30}])
+
+    for row in DataTableCreator.iter_file("data.csv", chunk_size=5000):
+        print(row.name.value)
     ```
 
     Notas:
-    - El archivo debe tener una extension valida (.csv, .json, .xlsx).
+    - El archivo debe tener una extension valida (.csv, .json, .jsonl, .xlsx, .pytc), opcionalmente
+      seguida de .gz, .bz2 o .xz; con sniff=True el formato se detecta por el contenido.
     - La lista de diccionarios debe tener la misma estructura (lista de diccionarios).
     - Para lectura de archivos XLSX se debe especificar el nombre de la hoja con el argumento sheet_name.
+    - Los metodos `*_async` leen desde asyncio en el ejecutor acotado de `utils.aio`.
     """
+    _memory_cache: DataTableCache = None
+
+    @staticmethod
+    def from_file(
+        path: str,
+        validate: str = "full",
+        schema: dict = None,
+        dtypes: DTypes = None,
+        cache: Union[bool, str] = False,
+        **kwargs
+    ) -> DataTable:
+        """Crea un DataTable a partir de un archivo.
+
+        `validate` indica el modo de validacion ("full", "structural", "sample" u "off")
+        y `schema` un JSON Schema propio en lugar de DATA_TABLE_SCHEMA.
+        `dtypes` activa las columnas con tipo: "infer" o un diccionario columna -> tipo.
+        Con `cache` la primera lectura se compila al formato binario (.pytc) y las siguientes
+        lo reutilizan mientras el archivo no cambie (ruta, fecha de modificacion y tamano).
+        `cache` puede ser True (carpeta __pytabify_cache__ junto al archivo) o la carpeta a usar.
+        Si se activo el cache en memoria (`enable_cache`) se reutiliza el DataTable ya leido en el proceso.
+        Cada etapa (read, validate, build, cache) se reporta a los listeners de `utils.instrumentation`.
+        Los archivos .gz, .bz2 y .xz (por ejemplo data.csv.gz) se descomprimen al leerlos; con
+        `sniff=True` la compresion y el formato se detectan por el contenido y no por la extension.
+        """
+        memory_cache = DataTableCreator._memory_cache
+        if memory_cache is not None:
+            options = dict(kwargs, validate=validate, schema=schema, dtypes=dtypes, cache=cache)
+            key = memory_cache.key(path, options)
+            if key is not None:
+                with instrumentation.stage("memory_cache", path) as stage:
+                    store = memory_cache.get(key)
+                    stage.details = {"hit": store is not None}
+                if store is None:
+                    datatable = DataTableCreator._from_source(path, validate, schema, dtypes, cache, **kwargs)
+                    store = memory_cache.put(key, datatable.store)
+                return DataTable(store, FieldChangeObserver())
+        return DataTableCreator._from_source(path, validate, schema, dtypes, cache, **kwargs)
+
+    @staticmethod
+    def enable_cache(max_entries: int = 128, max_bytes: int = None):
+        """Activa el cache en memoria de `from_file` para todo el proceso.
+
+        Los DataTables entregados comparten sus columnas con el cache y las copian al modificarlas.
+        """
+        DataTableCreator._memory_cache = DataTableCache(max_entries, max_bytes)
+
+    @staticmethod
+    def disable_cache():
+        """Desactiva y vacia el cache en memoria de `from_file`."""
+        DataTableCreator._memory_cache = None
+
+    @staticmethod
+    def clear_cache(path: str = None):
+        """Vacia el cache en memoria, o solo las entradas de `path`."""
+        if DataTableCreator._memory_cache is not None:
+            DataTableCreator._memory_cache.invalidate(path)
+
+    @staticmethod
+    def cache_info() -> CacheInfo:
+        """Obtiene las estadisticas del cache en memoria (None si no esta activo)."""
+        if DataTableCreator._memory_cache is None:
+            return None
+        return DataTableCreator._memory_cache.info()
 
     @staticmethod
-    def from_file(path: str, **kwargs) -> DataTable:
-        """Crea un DataTable a partir de un archivo."""
-        data = DataTableCreator._read_data(path, **kwargs)
-        return DataTableCreator._create_dt(data)
+    def _from_source(path, validate, schema, dtypes, cache, **kwargs) -> DataTable:
+        if cache:
+            return DataTableCreator._from_compiled(path, validate, schema, dtypes, cache, **kwargs)
+        data = DataTableCreator._read_data(path, validate, schema, **kwargs)
+        return DataTableCreator._create_dt(data, dtypes, path)
 
     @staticmethod
-    def from_records(records: list[dict[str, Any]]) -> DataTable:
+    def scan(path: str, **kwargs) -> DTScan:
+        """Crea una consulta perezosa sobre un archivo: `scan(path).where(...).select(...).collect()`.
+
+        El filtro y las columnas se pasan a la estrategia de lectura, por lo que las filas y columnas
+        descartadas no se materializan. Los demas argumentos (incluidos `columns` y `where`) se pasan
+        a `from_file` al ejecutar `collect`.
+        """
+        options = dict(kwargs)
+        columns = options.pop("columns", None)
+        where = options.pop("where", None) or {}
+        return DTScan(path, DataTableCreator.from_file, options, list(where.items()), columns)
+
+    @staticmethod
+    def from_cache(path: str) -> DataTable:
+        """Crea un DataTable a partir de un archivo guardado con `DataTableSaver.into_cache`."""
+        return DataTableCreator.from_file(path, validate="structural")
+
+    @staticmethod
+    def from_shared_memory(name: str) -> DataTable:
+        """Crea un DataTable a partir de un segmento publicado con `DataTableSaver.into_shared_memory`.
+
+        No se lee ni se copia ningun archivo: las columnas leen cada valor del segmento compartido.
+        El DataTable no escribe en el segmento; las columnas que se modifican se copian al proceso.
+        """
+        from pytabify.utils.shared_table import SharedTable
+        return SharedTable.attach(name).datatable()
+
+    @staticmethod
+    def from_records(records: list[dict[str, Any]], dtypes: DTypes = None) -> DataTable:
         """Crea un DataTable a partir de una lista de diccionarios."""
-        return DataTableCreator._create_dt(records)
+        return DataTableCreator._create_dt(records, dtypes)
+
+    @staticmethod
+    def from_files(
+        paths: list[str], workers: int = None, executor: str = "thread", concat: bool = False, **kwargs
+    ) -> Union[dict[str, DataTable], DataTable]:
+        """Crea DataTables a partir de varios archivos, leyendolos en paralelo.
+
+        `executor` puede ser "thread" o "process" y `workers` limita la cantidad de lecturas simultaneas.
+        Regresa un diccionario ruta -> DataTable en el orden de `paths`, o un solo DataTable
+        con todas las filas en ese orden si `concat` es True. Los demas argumentos se pasan a `from_file`.
+        Si algun archivo falla se lanza FilesReadingException con el error de cada archivo.
+        """
+        from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+        executors = {"thread": ThreadPoolExecutor, "process": ProcessPoolExecutor}
+        if executor not in executors:
+            raise ValueError(f"executor debe ser uno de {list(executors)}, no {executor}")
+
+        paths = list(paths)
+        results = {}
+        errors = {}
+        with executors[executor](max_workers=workers) as pool:
+            futures = [(path, pool.submit(_load_file, path, kwargs)) for path in paths]
+            for path, future in futures:
+                try:
+                    results[path] = future.result()
+                except Exception as exc:
+                    errors[path] = exc
+        if errors:
+            raise FilesReadingException(errors)
+
+        if concat:
+            return DataTable.concat([results[path] for path in paths])
+        return results
 
     @staticmethod
-    def _read_data(path, **kwargs):
-        _, ext_file = os.path.splitext(path)
-        if ext_file not in FileFormats:
-            raise FileExtensionException(f"La extension {ext_file} no es valida.")
-        reading_strategy = FileFormats(ext_file).get_strategy()
-        data = reading_strategy(path, **kwargs).read()
-        validate_data(data)
+    def iter_file(
+        path: str,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        validate: str = "full",
+        schema: dict = None,
+        dtypes: DTypes = None,
+        **kwargs
+    ) -> Iterator[DTRow]:
+        """Itera las filas de un archivo sin cargarlo completo en memoria.
+
+        Las filas se leen y validan en bloques de a lo mas `chunk_size` registros.
+        """
+        for datatable in DataTableCreator.iter_chunks(path, chunk_size, validate, schema, dtypes, **kwargs):
+            yield from datatable
+
+    @staticmethod
+    def iter_chunks(
+        path: str,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        validate: str = "full",
+        schema: dict = None,
+        dtypes: DTypes = None,
+        **kwargs
+    ) -> Iterator[DataTable]:
+        """Itera un archivo como DataTables de a lo mas `chunk_size` filas cada uno.
+
+        Con dtypes="infer" los tipos se infieren por bloque.
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size debe ser mayor a cero.")
+        reading_strategy = DataTableCreator._get_strategy(path, **kwargs)
+        for chunk in reading_strategy.iter_chunks(chunk_size):
+            DataTableCreator._validate(chunk, schema, validate, path)
+            yield DataTableCreator._create_dt(chunk, dtypes, path)
+
+    @staticmethod
+    async def from_file_async(path: str, **kwargs) -> DataTable:
+        """Version async de `from_file`; la lectura se ejecuta en el ejecutor acotado de `utils.aio`.
+
+        Si la tarea se cancela antes de que empiece la lectura, la lectura no se ejecuta.
+        """
+        from pytabify.utils import aio
+        return await aio.get_runner().run(_load_file, path, kwargs)
+
+    @staticmethod
+    async def from_files_async(
+        paths: list[str], concat: bool = False, **kwargs
+    ) -> Union[dict[str, DataTable], DataTable]:
+        """Version async de `from_files`.
+
+        Las lecturas simultaneas se limitan con `utils.aio.configure(max_workers, max_concurrency)`.
+        Si algun archivo falla se lanza FilesReadingException con el error de cada archivo.
+        """
+        import asyncio
+        paths = list(paths)
+        results = await asyncio.gather(
+            *(DataTableCreator.from_file_async(path, **kwargs) for path in paths), return_exceptions=True
+        )
+        errors = {}
+        for path, result in zip(paths, results):
+            if isinstance(result, Exception):
+                errors[path] = result
+            elif isinstance(result, BaseException):
+                raise result
+        if errors:
+            raise FilesReadingException(errors)
+
+        if concat:
+            return DataTable.concat(results)
+        return dict(zip(paths, results))
+
+    @staticmethod
+    async def iter_file_async(
+        path: str,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        validate: str = "full",
+        schema: dict = None,
+        dtypes: DTypes = None,
+        **kwargs
+    ) -> AsyncIterator[DTRow]:
+        """Version async de `iter_file`: `async for row in DataTableCreator.iter_file_async(path)`.
+
+        Cada bloque se lee en el ejecutor de `utils.aio`; al cancelar o cerrar la iteracion el archivo se cierra.
+        """
+        datatables = DataTableCreator.iter_chunks_async(path, chunk_size, validate, schema, dtypes, **kwargs)
+        try:
+            async for datatable in datatables:
+                for row in datatable:
+                    yield row
+        finally:
+            await datatables.aclose()
+
+    @staticmethod
+    async def iter_chunks_async(
+        path: str,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        validate: str = "full",
+        schema: dict = None,
+        dtypes: DTypes = None,
+        **kwargs
+    ) -> AsyncIterator[DataTable]:
+        """Version async de `iter_chunks`."""
+        from pytabify.utils import aio
+        chunks = DataTableCreator.iter_chunks(path, chunk_size, validate, schema, dtypes, **kwargs)
+        datatables = aio.get_runner().iterate(chunks)
+        try:
+            async for datatable in datatables:
+                yield datatable
+        finally:
+            await datatables.aclose()
+
+    @staticmethod
+    def _from_compiled(path, validate, schema, dtypes, cache, **kwargs) -> DataTable:
+        from pytabify.io.strategies import columnar_cache
+        options = dict(kwargs, dtypes=dtypes)
+        if columnar_cache.options_key(options) is None:
+            # Un filtro con funciones no identifica el contenido: se lee sin cache.
+            return DataTableCreator.from_file(path, validate, schema, dtypes, **kwargs)
+        cache_file = columnar_cache.cache_path(path, options, None if cache is True else cache)
+        source = columnar_cache.source_info(path, options) if os.path.exists(path) else None
+        with instrumentation.stage("disk_cache", cache_file) as stage:
+            store = columnar_cache.load_if_fresh(cache_file, source) if source else None
+            stage.details = {"hit": store is not None}
+            if store is not None:
+                stage.rows, stage.columns = len(store), len(store.names)
+                stage.bytes = instrumentation.file_size(cache_file)
+        if store is not None:
+            DataTableCreator._validate(store, schema, validate, path)
+            return DataTable(store, FieldChangeObserver())
+
+        datatable = DataTableCreator.from_file(path, validate, schema, dtypes, **kwargs)
+        try:
+            os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+            columnar_cache.write_columns(datatable.store, cache_file, source)
+        except OSError:
+            pass
+        return datatable
+
+    @staticmethod
+    def _get_strategy(path, **kwargs) -> ReadingStrategy:
+        base, kind = compression.split_compression(path)
+        _, ext_file = os.path.splitext(base)
+        if kwargs.get("sniff") and os.path.isfile(path):
+            kind = compression.sniff_compression(path)
+            ext_file = compression.sniff_format(path, kind)
+        try:
+            file_format = FileFormats(ext_file)
+        except ValueError as exc:
+            raise FileExtensionException(f"La extension {ext_file} no es valida.") from exc
+        reading_strategy = file_format.get_strategy()
+        return reading_strategy(path, **dict(kwargs, compression=kwargs.get("compression", kind)))
+
+    @staticmethod
+    def _read_data(path, validate="full", schema=None, **kwargs):
+        reading_strategy = DataTableCreator._get_strategy(path, **kwargs)
+        with instrumentation.stage("read", path) as stage:
+            data = reading_strategy.read_columns()
+            if data is None:
+                data = reading_strategy.read()
+            stage.bytes = instrumentation.file_size(path) if instrumentation.enabled() else None
+            stage.rows = len(data) if isinstance(data, (list, DTColumns)) else None
+        DataTableCreator._validate(data, schema, validate, path)
         return data
 
     @staticmethod
-    def _create_dt(data):
+    def _validate(data, schema, validate, path=None):
+        with instrumentation.stage("validate", path) as stage:
+            validate_data(data, schema, validate)
+            stage.rows = len(data) if isinstance(data, (list, DTColumns)) else None
+            stage.details = {"mode": validate}
+
+    @staticmethod
+    def _create_dt(data, dtypes: DTypes = None, path: str = None):
         observer = FieldChangeObserver()
-        rows = [
-            DTRow(
-                fields=[
-                    DTField(name, value, index)
-                    for index, (name, value) in enumerate(record.items())
-                ],
-                index=row_index,
-                observer=observer
-            )
-            for row_index, record in enumerate(data)
-        ]
-
-        return DataTable(rows, observer)
+        with instrumentation.stage("build", path) as stage:
+            store = data if isinstance(data, DTColumns) else DTColumns.from_records(data)
+            if isinstance(dtypes, str):
+                if dtypes != "infer":
+                    raise ValueError(f"dtypes debe ser 'infer' o un diccionario columna -> tipo, no {dtypes}")
+                store.infer_types()
+            elif dtypes is not None:
+                store.astype(dtypes)
+            stage.rows, stage.columns = len(store), len(store.names)
+        return DataTable(store, observer)
+
+
+def _load_file(path: str, kwargs: dict) -> DataTable:
+    return DataTableCreator.from_file(path, **kwargs)
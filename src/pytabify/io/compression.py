@@ -0,0 +1,63 @@
+"""Archivos comprimidos (gzip, bz2, xz) y deteccion del formato a partir del contenido.
+
+Los archivos se descomprimen y comprimen en streaming con los modulos gzip, bz2 y lzma,
+sin escribir archivos temporales. Cada modulo se importa hasta que se usa.
+"""
+import os
+from importlib import import_module
+from typing import IO
+from pytabify.utils.errors import FileExtensionException
+
+COMPRESSIONS = {".gz": "gzip", ".bz2": "bz2", ".xz": "xz"}
+"""Extension -> compresion; "data.csv.gz" es un csv comprimido con gzip."""
+
+_MODULES = {"gzip": "gzip", "bz2": "bz2", "xz": "lzma"}
+_MAGIC_NUMBERS = ((b"\x1f\x8b", "gzip"), (b"BZh", "bz2"), (b"\xfd7zXZ\x00", "xz"))
+_SNIFF_SIZE = 4096
+_BOM = b"\xef\xbb\xbf"
+
+def split_compression(path: str) -> tuple[str, str]:
+    """Separa la extension de compresion de una ruta: "data.csv.gz" -> ("data.csv", "gzip").
+
+    Si la ruta no tiene una extension de compresion regresa (path, None).
+    """
+    base, ext = os.path.splitext(path)
+    compression = COMPRESSIONS.get(ext.lower())
+    return (base, compression) if compression else (path, None)
+
+def sniff_compression(path: str) -> str:
+    """Detecta la compresion de un archivo por sus primeros bytes; None si no esta comprimido."""
+    with open(path, mode="rb") as file:
+        head = file.read(8)
+    return next((compression for magic, compression in _MAGIC_NUMBERS if head.startswith(magic)), None)
+
+def open_file(path: str, mode: str = "r", compression: str = None, **kwargs) -> IO:
+    """Abre un archivo como `open`; con `compression` ("gzip", "bz2" o "xz") lo (des)comprime al vuelo."""
+    if compression is None:
+        return open(path, mode, **kwargs)
+    if compression not in _MODULES:
+        raise ValueError(f"compression debe ser uno de {list(_MODULES)}, no {compression}")
+    if "b" not in mode and "t" not in mode:
+        mode += "t"
+    return import_module(_MODULES[compression]).open(path, mode, **kwargs)
+
+def sniff_format(path: str, compression: str = None) -> str:
+    """Detecta la extension del formato (.csv, .json, .jsonl, .xlsx o .pytc) a partir del contenido.
+
+    Lanza FileExtensionException si el contenido no corresponde a ningun formato.
+    """
+    with open_file(path, "rb", compression) as file:
+        head = file.read(_SNIFF_SIZE)
+    if head.startswith(b"PK\x03\x04"):
+        return ".xlsx"
+    if head.startswith(b"PYTC"):
+        return ".pytc"
+    text = head[len(_BOM):] if head.startswith(_BOM) else head
+    text = text.lstrip()
+    if text.startswith(b"["):
+        return ".json"
+    if text.startswith(b"{"):
+        return ".jsonl"
+    if b"\x00" in head:
+        raise FileExtensionException(f"No fue posible detectar el formato del archivo {path}")
+    return ".csv"
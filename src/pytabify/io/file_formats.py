@@ -1,18 +1,25 @@
 from enum import Enum
+from importlib import import_module
 from pytabify.io.interfaces.read import ReadingStrategy
-from pytabify.io.strategies.reading import CSVFileReadingStrategy, JSONFileReadingStrategy, XLSXReadingStrategy
+
+_READING_STRATEGIES = {
+    ".csv": ("pytabify.io.strategies.reading", "CSVFileReadingStrategy"),
+    ".json": ("pytabify.io.strategies.reading", "JSONFileReadingStrategy"),
+    ".jsonl": ("pytabify.io.strategies.reading", "JSONLinesFileReadingStrategy"),
+    ".xlsx": ("pytabify.io.strategies.reading", "XLSXReadingStrategy"),
+    ".pytc": ("pytabify.io.strategies.reading", "CacheReadingStrategy"),
+}
+"""Registro extension -> (modulo, clase); el modulo se importa hasta que se usa el formato."""
 
 class FileFormats(Enum):
     """FileFormats"""
     CSV = ".csv"
     JSON = ".json"
+    JSONL = ".jsonl"
     XLSX = ".xlsx"
+    CACHE = ".pytc"
 
-    def get_strategy(self) -> ReadingStrategy:
+    def get_strategy(self) -> type[ReadingStrategy]:
         """get_strategy"""
-        mapping = {
-            FileFormats.CSV: CSVFileReadingStrategy,
-            FileFormats.JSON: JSONFileReadingStrategy,
-            FileFormats.XLSX: XLSXReadingStrategy
-        }
-        return mapping.get(self)
+        module, name = _READING_STRATEGIES[self.value]
+        return getattr(import_module(module), name)
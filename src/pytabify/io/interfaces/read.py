@@ -1,16 +1,124 @@
 import os
 from abc import ABC, abstractmethod
+from itertools import islice
+from typing import IO, Any, Iterable, Iterator
+from pytabify.core.dt_columns import DTColumns
+from pytabify.core.dt_query import matching_rows, text_condition
+from pytabify.io.compression import open_file
+from pytabify.utils.errors import ColumnDoesNotExistException
+
+DEFAULT_CHUNK_SIZE = 10_000
 
 class ReadingStrategy(ABC):
-    """ReadingStrategy"""
+    """ReadingStrategy
+
+    Opciones comunes:
+    - columns: lista con los nombres de las columnas a leer (proyeccion).
+    - where: diccionario columna -> condicion; solo se leen las filas que cumplen todas (filtro).
+      Una condicion es una funcion que recibe el valor como texto o un valor a comparar por igualdad.
+    - compression: "gzip", "bz2" o "xz" si el archivo esta comprimido; se descomprime al leerlo.
+    """
     def __init__(self, path: str, **kwargs):
         self._path = path
         self._sheet_name = kwargs.get("sheet_name")
         self._encoding = kwargs.get("encoding", "utf-8")
+        self._columns = kwargs.get("columns")
+        self._where = {name: text_condition(condition) for name, condition in (kwargs.get("where") or {}).items()}
+        self._compression = kwargs.get("compression")
 
     @abstractmethod
     def read(self) -> list[dict[str, str]]:
-        """read"""
+        """read
+
+        Las estrategias aplican `columns` y `where` al leer (ver `_pushdown` y `_pushdown_columns`).
+        """
+
+    def read_columns(self) -> DTColumns:
+        """Lee el archivo directamente en columnas si la estrategia lo soporta.
+
+        Regresa None cuando la estrategia solo lee registros con `read`.
+        """
+        return None
+
+    def iter_records(self) -> Iterator[dict[str, str]]:
+        """Itera los registros del archivo uno a uno.
+
+        Las estrategias que pueden leer de forma incremental sobrescriben este metodo.
+        """
+        yield from self.read()
+
+    def iter_chunks(self, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[list[dict[str, str]]]:
+        """Itera los registros del archivo en bloques de a lo mas `chunk_size` registros."""
+        records = self.iter_records()
+        while chunk := list(islice(records, chunk_size)):
+            yield chunk
+
+    def _has_pushdown(self) -> bool:
+        return self._columns is not None or bool(self._where)
+
+    def _required_columns(self) -> list[str]:
+        """Columnas que se deben leer: las proyectadas y las usadas por el filtro."""
+        if self._columns is None:
+            return None
+        return list(dict.fromkeys([*self._columns, *self._where]))
+
+    def _check_columns(self, available: Iterable[str]):
+        available = set(available)
+        missing = [name for name in dict.fromkeys([*(self._columns or []), *self._where]) if name not in available]
+        if missing:
+            raise ColumnDoesNotExistException(f"Las columnas {missing} no existen en el archivo {self._path}")
+
+    def _pushdown(self, records: Iterable[Any]) -> Iterable[Any]:
+        """Aplica el filtro y la proyeccion a registros ya leidos.
+
+        Los elementos que no son diccionarios se entregan sin cambios para que la validacion los rechace.
+        Como estos formatos no tienen encabezado, al terminar se lanza ColumnDoesNotExistException
+        si alguna columna de `columns` o `where` no aparecio en ningun registro.
+        """
+        if not self._has_pushdown():
+            return records
+        return self._iter_pushdown(records)
+
+    def _iter_pushdown(self, records: Iterable[Any]) -> Iterator[Any]:
+        tests = list(self._where.items())
+        columns = self._columns
+        names = set([*(columns or []), *self._where])
+        pending = set(names)
+        seen = False
+        for record in records:
+            if not isinstance(record, dict):
+                yield record
+                continue
+            seen = True
+            if pending:
+                pending.difference_update(record.keys())
+            if not all(name in record and test(str(record[name])) for name, test in tests):
+                continue
+            yield record if columns is None else {name: record[name] for name in columns if name in record}
+        if seen and pending:
+            self._check_columns(names - pending)
+
+    def _pushdown_columns(self, store: DTColumns) -> DTColumns:
+        """Aplica el filtro y la proyeccion a un DTColumns; las demas columnas no se decodifican."""
+        if not self._has_pushdown():
+            return store
+        self._check_columns(store.names)
+        conditions = {}
+        for name, test in self._where.items():
+            if store.dtypes[store.position(name)] is str:
+                conditions[name] = test
+            else:
+                conditions[name] = lambda value, test=test: test(str(value))
+        rows = matching_rows(store, conditions)
+        if self._columns is not None:
+            store = store.select(self._columns)
+        return store if len(rows) == len(store) else store.take(rows)
+
+    def _open(self, mode: str = "r", **kwargs) -> IO:
+        """Abre el archivo con la codificacion de la estrategia, descomprimiendolo si es necesario."""
+        if "b" not in mode:
+            kwargs.setdefault("encoding", self._encoding)
+        return open_file(self._path, mode, self._compression, **kwargs)
 
     def _file_exists(self):
         return os.path.exists(self._path)
@@ -0,0 +1,253 @@
+"""Formato binario columnar para guardar y volver a cargar un DataTable sin leer el archivo original.
+
+Estructura del archivo:
+
+    MAGIC | bloques de cada columna | pie (json) | largo del pie (8 bytes) | MAGIC
+
+Los bloques de columnas int/float son el contenido de un `array('q')`/`array('d')`; bool se guarda
+como `array('b')` y date como ordinales en `array('q')`. Las columnas str guardan el texto utf-8
+concatenado, las posiciones de cada valor en un `array('q')` y, si hay celdas ausentes, un byte por fila.
+Al cargar, el archivo se mapea en memoria y los textos se decodifican al accederlos.
+"""
+import os
+import sys
+import json
+import mmap
+import struct
+from array import array
+from datetime import date
+from typing import Any
+from pytabify.core.dt_columns import DTColumns, MISSING
+from pytabify.core.dt_types import DTYPES
+from pytabify.utils.errors import FileReadingException
+
+MAGIC = b"PYTC1\n"
+VERSION = 1
+CACHE_DIR_NAME = "__pytabify_cache__"
+_LENGTH = struct.Struct("<Q")
+TYPECODES = {"int": "q", "float": "d", "bool": "b", "date": "q"}
+"""Typecode del array con el que se guarda cada tipo de columna que no es str."""
+_DTYPE_NAMES = {dtype: name for name, dtype in DTYPES.items()}
+_WRITE_BATCH = 65536
+
+def write_columns(store: DTColumns, path: str, source: dict = None):
+    """Guarda un DTColumns en `path`; el archivo se reemplaza de forma atomica."""
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, mode="wb") as file:
+            dump_columns(store, file, source)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+def dump_columns(store: DTColumns, file, source: dict = None):
+    """Escribe un DTColumns en un archivo binario abierto (o BytesIO) desde su posicion 0."""
+    file.write(MAGIC)
+    columns = [
+        _write_column(file, name, _DTYPE_NAMES[dtype], column)
+        for name, dtype, column in zip(store.names, store.dtypes, store.columns)
+    ]
+    footer = json.dumps({
+        "version": VERSION,
+        "rows": len(store),
+        "byteorder": sys.byteorder,
+        "columns": columns,
+        "source": source
+    }).encode("utf-8")
+    file.write(footer)
+    file.write(_LENGTH.pack(len(footer)))
+    file.write(MAGIC)
+
+def _write_column(file, name: str, dtype: str, column: Any) -> dict[str, Any]:
+    meta = {"name": name, "dtype": dtype}
+    if dtype == "str":
+        meta.update(_write_str_column(file, column))
+        return meta
+    if dtype == "date":
+        values = array("q", (value.toordinal() for value in column))
+    elif isinstance(column, array) and column.typecode == TYPECODES[dtype]:
+        values = column
+    else:
+        values = array(TYPECODES[dtype], column)
+    meta["data"] = _write_block(file, values.tobytes())
+    return meta
+
+def _write_str_column(file, column: Any) -> dict[str, Any]:
+    data_start = file.tell()
+    offsets = array("q", [0])
+    missing = None
+    batch = []
+    position = 0
+    for row, value in enumerate(column):
+        if value is MISSING:
+            if missing is None:
+                missing = bytearray(len(column))
+            missing[row] = 1
+        else:
+            encoded = value.encode("utf-8")
+            position += len(encoded)
+            batch.append(encoded)
+            if len(batch) >= _WRITE_BATCH:
+                file.write(b"".join(batch))
+                batch.clear()
+        offsets.append(position)
+    file.write(b"".join(batch))
+    meta = {
+        "data": [data_start, position],
+        "offsets": _write_block(file, offsets.tobytes())
+    }
+    if missing is not None:
+        meta["missing"] = _write_block(file, bytes(missing))
+    return meta
+
+def _write_block(file, data: bytes) -> list[int]:
+    start = file.tell()
+    file.write(data)
+    return [start, len(data)]
+
+def read_footer(buffer: mmap.mmap, end: int = None) -> dict[str, Any]:
+    """Obtiene el pie del archivo (metadatos de las columnas y del archivo de origen).
+
+    `end` indica donde terminan los datos si el buffer es mas grande que el archivo.
+    """
+    end = len(buffer) if end is None else end
+    tail = len(MAGIC) + _LENGTH.size
+    if end < len(MAGIC) + tail or buffer[:len(MAGIC)] != MAGIC or buffer[end - len(MAGIC):end] != MAGIC:
+        raise FileReadingException("El archivo no tiene el formato de cache de pytabify")
+    (length,) = _LENGTH.unpack(buffer[end - tail:end - len(MAGIC)])
+    footer = json.loads(bytes(buffer[end - tail - length:end - tail]).decode("utf-8"))
+    if footer.get("version") != VERSION:
+        raise FileReadingException(f"La version {footer.get('version')} del cache no es soportada")
+    return footer
+
+def read_columns(path: str) -> tuple[DTColumns, dict[str, Any]]:
+    """Carga un DTColumns desde `path`; regresa tambien el pie del archivo."""
+    with open(path, mode="rb") as file:
+        try:
+            buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError as exc:
+            raise FileReadingException("El archivo no tiene el formato de cache de pytabify") from exc
+    footer = read_footer(buffer)
+    swap = footer["byteorder"] != sys.byteorder
+    names = []
+    dtypes = []
+    columns = []
+    for meta in footer["columns"]:
+        names.append(meta["name"])
+        dtypes.append(DTYPES[meta["dtype"]])
+        if meta["dtype"] == "str":
+            columns.append(CacheStrColumn(path, buffer, meta, footer["rows"], swap))
+        else:
+            columns.append(_read_typed_column(buffer, meta, swap))
+    return DTColumns(names, columns, footer["rows"], dtypes), footer
+
+def _read_typed_column(buffer: mmap.mmap, meta: dict[str, Any], swap: bool) -> Any:
+    values = _read_array(buffer, TYPECODES[meta["dtype"]], meta["data"], swap)
+    if meta["dtype"] == "bool":
+        return [value != 0 for value in values]
+    if meta["dtype"] == "date":
+        return [date.fromordinal(value) for value in values]
+    return values
+
+def _read_array(buffer: mmap.mmap, typecode: str, block: list[int], swap: bool) -> array:
+    start, length = block
+    values = array(typecode)
+    values.frombytes(buffer[start:start + length])
+    if swap:
+        values.byteswap()
+    return values
+
+class CacheStrColumn:
+    """Columna str de un archivo de cache mapeado en memoria; decodifica cada valor al accederlo."""
+
+    def __init__(self, path: str, buffer: mmap.mmap, meta: dict[str, Any], rows: int, swap: bool):
+        self._path = path
+        self._buffer = buffer
+        self._meta = meta
+        self._rows = rows
+        self._swap = swap
+        self._start = meta["data"][0]
+        self._offsets = _read_array(buffer, "q", meta["offsets"], swap)
+        missing = meta.get("missing")
+        self._missing = buffer[missing[0]:missing[0] + missing[1]] if missing else None
+
+    def __len__(self):
+        return self._rows
+
+    def _value(self, row: int) -> str:
+        if self._missing is not None and self._missing[row]:
+            return MISSING
+        start = self._start + self._offsets[row]
+        return str(self._buffer[start:self._start + self._offsets[row + 1]], "utf-8")
+
+    def __getitem__(self, row):
+        if isinstance(row, slice):
+            return [self._value(position) for position in range(*row.indices(self._rows))]
+        if row < 0:
+            row += self._rows
+        if not 0 <= row < self._rows:
+            raise IndexError("El indice de la fila esta fuera de rango.")
+        return self._value(row)
+
+    def __iter__(self):
+        return (self._value(row) for row in range(self._rows))
+
+    def __getstate__(self):
+        return (self._path, self._meta, self._rows, self._swap)
+
+    def __setstate__(self, state):
+        path, meta, rows, swap = state
+        with open(path, mode="rb") as file:
+            buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.__init__(path, buffer, meta, rows, swap)
+
+def options_key(options: dict[str, Any]) -> str:
+    """Serializa las opciones de lectura de forma determinista.
+
+    Los tipos (dtypes={"id": int}) se guardan por nombre. Regresa None si alguna opcion no se puede
+    serializar, por ejemplo una funcion en `where`: su repr depende de la direccion en memoria.
+    """
+    try:
+        return json.dumps(options, sort_keys=True, default=_type_name)
+    except (TypeError, ValueError):
+        return None
+
+def _type_name(value: Any) -> str:
+    if isinstance(value, type):
+        return f"{value.__module__}.{value.__qualname__}"
+    raise TypeError(f"{type(value).__name__} no se puede serializar")
+
+def source_info(path: str, options: dict[str, Any]) -> dict[str, Any]:
+    """Datos del archivo de origen que identifican una version compilada en cache.
+
+    Las opciones deben poder serializarse con `options_key`.
+    """
+    stat = os.stat(path)
+    return {
+        "path": os.path.abspath(path),
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size,
+        "options": json.loads(options_key(options))
+    }
+
+def cache_path(path: str, options: dict[str, Any], cache_dir: str = None) -> str:
+    """Ruta del archivo compilado para `path` con las opciones de lectura indicadas.
+
+    Por defecto se guarda en __pytabify_cache__ junto al archivo de origen.
+    """
+    cache_dir = cache_dir or os.path.join(os.path.dirname(os.path.abspath(path)), CACHE_DIR_NAME)
+    import hashlib
+    key = json.dumps([os.path.abspath(path), options_key(options)])
+    digest = hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+    return os.path.join(cache_dir, f"{os.path.basename(path)}.{digest}.pytc")
+
+def load_if_fresh(path: str, source: dict[str, Any]) -> DTColumns:
+    """Carga el archivo compilado si existe y corresponde a `source`; si no regresa None."""
+    if not os.path.exists(path):
+        return None
+    try:
+        store, footer = read_columns(path)
+    except (OSError, ValueError, KeyError, FileReadingException):
+        return None
+    return store if footer.get("source") == source else None
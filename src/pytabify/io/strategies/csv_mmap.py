@@ -0,0 +1,157 @@
+"""Lectura de CSV sobre un archivo mapeado en memoria (mmap).
+
+Solo se guarda la posicion en bytes de cada campo; el texto de una celda se decodifica
+cuando se accede a ella. Las paginas del archivo las comparte el sistema operativo entre procesos.
+"""
+import io
+import os
+import csv
+import mmap
+import codecs
+import re
+from array import array
+from typing import Iterator
+from pytabify.core.dt_columns import DTColumns
+from pytabify.utils.errors import FileReadingException
+
+_TOKENS = re.compile(rb'"[^"]*(?:""[^"]*)*"|,|\n')
+_COMMA = ord(",")
+_NEWLINE = ord("\n")
+_CR = ord("\r")
+_QUOTE = b'"'
+
+def is_ascii_compatible(encoding: str) -> bool:
+    """Indica si en la codificacion las comillas, comas y saltos de linea ocupan un solo byte ASCII."""
+    encoder = codecs.getincrementalencoder(encoding)()
+    encoder.encode("a")
+    return encoder.encode('"\n,') == b'"\n,'
+
+class CSVMmapIndex:
+    """Indice de posiciones de los campos de un CSV mapeado en memoria.
+
+    Por cada fila guarda el inicio de cada campo (-1 si la fila tiene menos campos que el encabezado)
+    y el fin de la fila, en un solo `array`.
+    """
+
+    def __init__(self, path: str, encoding: str):
+        self._path = path
+        self._encoding = encoding
+        self._buffer = self._open()
+        self._offsets = array("i" if len(self._buffer) < 2 ** 31 else "q")
+        self._fieldnames = None
+        self._stride = 1
+        self._rows = 0
+
+    def _open(self) -> mmap.mmap:
+        with open(self._path, mode="rb") as file:
+            return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    @property
+    def fieldnames(self) -> list[str]:
+        """Nombres de las columnas tomados del encabezado."""
+        return self._fieldnames or []
+
+    @property
+    def rows(self) -> int:
+        """Numero de filas de datos."""
+        return self._rows
+
+    def scan(self):
+        """Recorre el archivo una vez y registra la posicion de cada campo."""
+        buffer = self._buffer
+        starts = [0]
+        for token in _TOKENS.finditer(buffer):
+            char = buffer[token.start()]
+            if char == _COMMA:
+                starts.append(token.end())
+            elif char == _NEWLINE:
+                self._add_row(starts, token.start())
+                starts = [token.end()]
+        if starts[0] < len(buffer):
+            self._add_row(starts, len(buffer))
+
+    def _add_row(self, starts: list[int], end: int):
+        if end > starts[-1] and self._buffer[end - 1] == _CR:
+            end -= 1
+        if len(starts) == 1 and end == starts[0]:
+            return
+
+        if self._fieldnames is None:
+            self._fieldnames = [self._decode(start, field_end) for start, field_end in self._bounds(starts, end)]
+            self._stride = len(self._fieldnames) + 1
+            return
+
+        missing = self._stride - 1 - len(starts)
+        if missing < 0:
+            raise FileReadingException(
+                f"La fila {self._rows + 1} del csv tiene mas campos que el encabezado; use la lectura sin mmap."
+            )
+        self._offsets.extend(starts)
+        if missing:
+            self._offsets.extend([-1] * missing)
+        self._offsets.append(end)
+        self._rows += 1
+
+    @staticmethod
+    def _bounds(starts: list[int], end: int) -> Iterator[tuple[int, int]]:
+        for position, start in enumerate(starts):
+            yield start, starts[position + 1] - 1 if position + 1 < len(starts) else end
+
+    def value(self, row: int, col: int) -> str:
+        """Decodifica el valor de una celda."""
+        base = row * self._stride
+        offsets = self._offsets
+        start = offsets[base + col]
+        if start == -1:
+            # Igual que csv.DictReader: los campos faltantes valen None.
+            return str(None)
+        following = offsets[base + col + 1] if col + 2 < self._stride else -1
+        end = following - 1 if following != -1 else offsets[base + self._stride - 1]
+        return self._decode(start, end)
+
+    def _decode(self, start: int, end: int) -> str:
+        raw = self._buffer[start:end]
+        if raw.startswith(_QUOTE):
+            return next(csv.reader(io.StringIO(raw.decode(self._encoding), newline="")))[0]
+        return raw.decode(self._encoding)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_buffer"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._buffer = self._open()
+
+class CSVMmapColumn:
+    """Columna de un CSV mapeado en memoria; decodifica cada valor al accederlo."""
+    __slots__ = ("_index", "_col")
+
+    def __init__(self, index: CSVMmapIndex, col: int):
+        self._index = index
+        self._col = col
+
+    def __len__(self):
+        return self._index.rows
+
+    def __getitem__(self, row):
+        if isinstance(row, slice):
+            return [self._index.value(position, self._col) for position in range(*row.indices(len(self)))]
+        if row < 0:
+            row += len(self)
+        if not 0 <= row < len(self):
+            raise IndexError("El indice de la fila esta fuera de rango.")
+        return self._index.value(row, self._col)
+
+    def __iter__(self):
+        return (self._index.value(row, self._col) for row in range(len(self)))
+
+def read_mmap_columns(path: str, encoding: str) -> DTColumns:
+    """Lee un CSV a un DTColumns cuyas columnas se decodifican de forma perezosa."""
+    if os.path.getsize(path) == 0:
+        return DTColumns()
+    index = CSVMmapIndex(path, encoding)
+    index.scan()
+    names = index.fieldnames
+    return DTColumns(list(names), [CSVMmapColumn(index, col) for col in range(len(names))], index.rows)
@@ -1,60 +1,384 @@
-import json
+import io
+import os
 import csv
-from openpyxl import load_workbook
-from pytabify.io.interfaces.read import ReadingStrategy
+import json
+import mmap
+from itertools import islice
+from typing import Any, Iterator
+from pytabify.core.dt_columns import DTColumns
+from pytabify.io.interfaces.read import ReadingStrategy, DEFAULT_CHUNK_SIZE
+from pytabify.io.strategies.csv_mmap import is_ascii_compatible, read_mmap_columns
+from pytabify.io.strategies import columnar_cache
 from pytabify.utils.errors import  (
     FileReadingException,
     FileNotFoundException,
     SheetNameHasNotEmptyException,
-    SheetNameDoesNotExistException
+    SheetNameDoesNotExistException,
+    ColumnDoesNotExistException
 )
 
+def load_workbook(*args, **kwargs):
+    """Abre un libro con openpyxl; openpyxl se importa hasta la primer lectura de un xlsx."""
+    from openpyxl import load_workbook as openpyxl_load_workbook
+    return openpyxl_load_workbook(*args, **kwargs)
+
 class JSONFileReadingStrategy(ReadingStrategy):
     """JsonFileReadingStrategy"""
+    _BLOCK_SIZE = 64 * 1024
+
     def read(self) -> list[dict[str, str]]:
         if not self._file_exists():
             raise FileNotFoundException(f"El archivo {self._path} NO Existe verifique la ruta.")
 
-        with open(self._path, mode="r", encoding=self._encoding) as file:
+        with self._open() as file:
             try:
-                return json.load(file)
+                data = json.load(file)
             except json.JSONDecodeError as exc:
                 raise FileReadingException("Ocurrio un error al leer el archivo de datos json") from exc
+        if isinstance(data, list) and self._has_pushdown():
+            return list(self._pushdown(data))
+        return data
+
+    def iter_records(self) -> Iterator[dict[str, str]]:
+        for chunk in self.iter_chunks():
+            if not isinstance(chunk, list):
+                raise FileReadingException("El archivo de datos json no contiene una lista de registros")
+            yield from chunk
+
+    def iter_chunks(self, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Any]:
+        """Itera los elementos de la lista json sin cargar todo el archivo.
+
+        Si el documento no es una lista se entrega completo como un solo bloque
+        para que la validacion lo rechace igual que en `read`.
+        """
+        if not self._file_exists():
+            raise FileNotFoundException(f"El archivo {self._path} NO Existe verifique la ruta.")
+
+        with self._open() as file:
+            try:
+                buffer = file.read(self._BLOCK_SIZE).lstrip()
+                if not buffer.startswith("["):
+                    yield json.loads(buffer + file.read())
+                    return
+                records = self._pushdown(self._iter_array(file, buffer))
+                while chunk := list(islice(records, chunk_size)):
+                    yield chunk
+            except json.JSONDecodeError as exc:
+                raise FileReadingException("Ocurrio un error al leer el archivo de datos json") from exc
+
+    def _iter_array(self, file, buffer: str) -> Iterator[Any]:
+        decoder = json.JSONDecoder()
+        pos = 1
+        eof = False
+        first = True
+        expect_value = True
+        while True:
+            while pos < len(buffer) and buffer[pos].isspace():
+                pos += 1
+            if pos >= len(buffer):
+                if eof:
+                    raise json.JSONDecodeError("Fin de archivo inesperado", buffer, pos)
+                buffer, pos, eof = self._fill(file, buffer, pos)
+                continue
+
+            char = buffer[pos]
+            if char == "]" and (first or not expect_value):
+                if buffer[pos + 1:].strip() or file.read().strip():
+                    raise json.JSONDecodeError("Datos extra despues de la lista", buffer, pos + 1)
+                return
+            if not expect_value:
+                if char != ",":
+                    raise json.JSONDecodeError("Se esperaba ',' o ']'", buffer, pos)
+                pos += 1
+                expect_value = True
+                continue
+
+            try:
+                value, end = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                buffer, pos, eof = self._fill(file, buffer, pos)
+                continue
+            if end == len(buffer) and not eof:
+                # Un valor al final del bloque puede estar incompleto (por ejemplo un numero).
+                buffer, pos, eof = self._fill(file, buffer, pos)
+                continue
+            yield value
+            pos = end
+            first = False
+            expect_value = False
+
+    def _fill(self, file, buffer: str, pos: int) -> tuple[str, int, bool]:
+        block = file.read(self._BLOCK_SIZE)
+        return buffer[pos:] + block, 0, not block
+
+class JSONLinesFileReadingStrategy(ReadingStrategy):
+    """JSONLinesFileReadingStrategy
+
+    Lee un registro json por linea (JSON Lines); las lineas vacias se ignoran.
+    """
+    def read(self) -> list[dict[str, str]]:
+        return list(self.iter_records())
+
+    def iter_records(self) -> Iterator[dict[str, str]]:
+        if not self._file_exists():
+            raise FileNotFoundException(f"El archivo {self._path} NO Existe verifique la ruta.")
+
+        with self._open() as file:
+            yield from self._pushdown(self._iter_lines(file))
+
+    def _iter_lines(self, file) -> Iterator[Any]:
+        for number, line in enumerate(file, start=1):
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError as exc:
+                raise FileReadingException(
+                    f"Ocurrio un error al leer la linea {number} del archivo de datos jsonl"
+                ) from exc
 
 class CSVFileReadingStrategy(ReadingStrategy):
-    """CsvFileReadingStrategy"""
+    """CsvFileReadingStrategy
+
+    Opciones adicionales:
+    - workers: numero de procesos para leer un archivo grande en paralelo. El archivo se divide
+      en rangos de bytes que terminan en un fin de registro (respetando saltos de linea entre comillas),
+      cada proceso lee su rango a columnas y los bloques se unen en el orden original.
+      Requiere una codificacion compatible con ASCII y comillas al estilo RFC 4180
+      (una comilla solo puede aparecer dentro de un campo entre comillas).
+    - mmap: mapea el archivo en memoria y solo guarda la posicion de cada campo; las celdas
+      se decodifican al accederlas. Tiene los mismos requisitos que `workers` y no admite filas
+      con mas campos que el encabezado. El archivo no debe modificarse mientras se usa el DataTable.
+
+    `workers` y `mmap` necesitan el archivo sin comprimir; un archivo comprimido se lee en streaming.
+    """
+    MIN_RANGE_BYTES = 1024 * 1024
+    _SCAN_BLOCK_SIZE = 16 * 1024 * 1024
+
+    def __init__(self, path: str, **kwargs):
+        super().__init__(path, **kwargs)
+        self._workers = kwargs.get("workers")
+        self._use_mmap = kwargs.get("mmap", False)
+
     def read(self) -> list[dict[str, str]]:
+        return list(self.iter_records())
+
+    def read_columns(self) -> DTColumns:
+        if self._compression or not is_ascii_compatible(self._encoding):
+            return None
+        if self._use_mmap:
+            if not self._file_exists():
+                raise FileNotFoundError(f"El archivo {self._path} NO Existe verifique la ruta.")
+            return self._pushdown_columns(read_mmap_columns(self._path, self._encoding))
+        if not self._workers or self._workers < 2:
+            return None
+        if not self._file_exists():
+            raise FileNotFoundError(f"El archivo {self._path} NO Existe verifique la ruta.")
+
+        size = os.path.getsize(self._path)
+        if size == 0:
+            return DTColumns()
+        parts = max(1, min(self._workers, size // self.MIN_RANGE_BYTES))
+        with open(self._path, mode="rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            header_end = self._record_end(buffer, 0, 0)[0]
+            fieldnames = next(csv.reader(io.StringIO(buffer[:header_end].decode(self._encoding), newline="")), [])
+            bounds = self._split(buffer, header_end, size, parts)
+
+        ranges = list(zip(bounds, bounds[1:]))
+        try:
+            if len(ranges) == 1:
+                stores = [_read_csv_range(self._path, *ranges[0], self._encoding, fieldnames)]
+            else:
+                from concurrent.futures import ProcessPoolExecutor
+                with ProcessPoolExecutor(max_workers=len(ranges)) as pool:
+                    stores = list(pool.map(
+                        _read_csv_range,
+                        *zip(*[(self._path, start, end, self._encoding, fieldnames) for start, end in ranges])
+                    ))
+        except Exception as exc:
+            raise FileReadingException("Ocurrio un Error al leer el archivo de datos csv") from exc
+
+        store = DTColumns.concat(stores)
+        if not store.names:
+            store = DTColumns(list(fieldnames))
+        return self._pushdown_columns(store)
+
+    def _split(self, buffer: mmap.mmap, start: int, size: int, parts: int) -> list[int]:
+        """Calcula los limites de cada rango; cada uno termina justo despues de un fin de registro."""
+        bounds = [start]
+        pos = start
+        quotes = 0
+        for part in range(1, parts):
+            target = start + part * (size - start) // parts
+            if target <= pos:
+                continue
+            quotes += self._count_quotes(buffer, pos, target)
+            pos, quotes = self._record_end(buffer, target, quotes)
+            if pos >= size:
+                break
+            bounds.append(pos)
+        bounds.append(size)
+        return bounds
+
+    def _record_end(self, buffer: mmap.mmap, pos: int, quotes: int) -> tuple[int, int]:
+        """Busca el primer salto de linea desde `pos` que no esta entre comillas."""
+        while True:
+            newline = buffer.find(b"\n", pos)
+            if newline == -1:
+                return len(buffer), quotes
+            quotes += self._count_quotes(buffer, pos, newline)
+            pos = newline + 1
+            if quotes % 2 == 0:
+                return pos, quotes
+
+    def _count_quotes(self, buffer: mmap.mmap, start: int, end: int) -> int:
+        count = 0
+        for block_start in range(start, end, self._SCAN_BLOCK_SIZE):
+            count += buffer[block_start:min(end, block_start + self._SCAN_BLOCK_SIZE)].count(b'"')
+        return count
+
+    def iter_records(self) -> Iterator[dict[str, str]]:
         if not self._file_exists():
             raise FileNotFoundError(f"El archivo {self._path} NO Existe verifique la ruta.")
 
-        with open(self._path, mode="r", encoding=self._encoding) as file:
+        with self._open(newline="") as file:
             try:
-                reader = csv.DictReader(file)
-                return list(reader)
+                if self._columns is not None:
+                    yield from self._iter_projected(file)
+                elif self._where:
+                    reader = csv.DictReader(file)
+                    self._check_columns(reader.fieldnames or [])
+                    yield from self._pushdown(reader)
+                else:
+                    yield from csv.DictReader(file)
+            except ColumnDoesNotExistException:
+                raise
             except Exception as exc:
                 raise FileReadingException("Ocurrio un Error al leer el archivo de datos csv") from exc
 
+    def _iter_projected(self, file) -> Iterator[dict[str, str]]:
+        """Lee solo los campos de las columnas proyectadas y filtradas; no crea el diccionario de las demas."""
+        reader = csv.reader(file)
+        header = next(reader, [])
+        positions = {name: pos for pos, name in enumerate(header)}
+        self._check_columns(positions)
+        tests = [(positions[name], test) for name, test in self._where.items()]
+        projection = [(name, positions[name]) for name in self._columns]
+        for row in reader:
+            if not row:
+                continue
+            size = len(row)
+            if all(pos < size and test(row[pos]) for pos, test in tests):
+                yield {name: row[pos] if pos < size else None for name, pos in projection}
+
+def _read_csv_range(path: str, start: int, end: int, encoding: str, fieldnames: list[str]) -> DTColumns:
+    with open(path, mode="rb") as file:
+        file.seek(start)
+        text = file.read(end - start).decode(encoding)
+    return DTColumns.from_records(csv.DictReader(io.StringIO(text, newline=""), fieldnames=fieldnames))
+
 class XLSXReadingStrategy(ReadingStrategy):
-    """XlsxReadingStrategy"""
+    """XlsxReadingStrategy
+
+    Opciones adicionales:
+    - read_only: abre el libro en modo de solo lectura por streaming (por defecto True).
+    - data_only: lee el valor calculado de las formulas en lugar de la formula (por defecto False).
+    - row_range: tupla (inicio, fin) con las filas de datos a leer; base 0 y fin exclusivo.
+    - columns: lista con los nombres de las columnas a leer; las demas celdas no se leen.
+    - where: filtro de filas; solo se convierten a texto las celdas de las filas que lo cumplen.
+
+    Un xlsx comprimido se descomprime en memoria porque openpyxl necesita acceso aleatorio al zip.
+    """
+    def __init__(self, path: str, **kwargs):
+        super().__init__(path, **kwargs)
+        self._read_only = kwargs.get("read_only", True)
+        self._data_only = kwargs.get("data_only", False)
+        self._row_range = kwargs.get("row_range")
+
     def read(self) -> list[dict[str, str]]:
+        return list(self.iter_records())
+
+    def iter_records(self) -> Iterator[dict[str, str]]:
         if not self._file_exists():
             raise FileNotFoundError(f"El archivo {self._path} NO Existe verifique la ruta.")
 
         if self._sheet_name is None:
             raise SheetNameHasNotEmptyException("sheet_name debe ser definido")
 
-        workbook = load_workbook(self._path)
+        source = self._path
+        if self._compression:
+            with self._open("rb") as file:
+                source = io.BytesIO(file.read())
+        workbook = load_workbook(source, read_only=self._read_only, data_only=self._data_only)
+        try:
+            if self._sheet_name not in workbook.sheetnames:
+                raise SheetNameDoesNotExistException(f"La hoja {self._sheet_name} no existe en el archivo")
 
-        if self._sheet_name not in workbook.sheetnames:
-            raise SheetNameDoesNotExistException(f"La hoja {self._sheet_name} no existe en el archivo")
+            hoja = workbook[self._sheet_name]
+            if self._read_only:
+                # En modo solo lectura openpyxl confia en <dimension> de la hoja, que otras herramientas
+                # suelen dejar desactualizado (por ejemplo "A1"); se descarta para leer todas las filas.
+                hoja.reset_dimensions()
+            encabezados = list(next(hoja.iter_rows(max_row=1, values_only=True), ()))
+            min_row, max_row = self._row_bounds()
+            self._check_columns(encabezados)
+            columnas = self._required_columns()
+            min_col, max_col, selected = self._column_bounds(encabezados, columnas)
+            if selected is not None:
+                encabezados = columnas
+            posiciones = {columna: indice for indice, columna in enumerate(encabezados)}
+            filtros = [(posiciones[columna], condicion) for columna, condicion in self._where.items()]
+            proyeccion = None if self._columns is None else [posiciones[columna] for columna in self._columns]
+            if proyeccion is not None:
+                encabezados = list(self._columns)
 
-        hoja = workbook[self._sheet_name]
-        encabezados = [celda.value for celda in hoja[1]]
+            # Sin <dimension> las filas no se completan; se completan hasta el ancho del encabezado.
+            max_col = max_col or len(encabezados) or None
+            for fila in hoja.iter_rows(
+                min_row=min_row, max_row=max_row, min_col=min_col, max_col=max_col, values_only=True
+            ):
+                if selected is not None:
+                    fila = [fila[indice] for indice in selected]
+                if filtros and not all(
+                    condicion("" if fila[indice] is None else str(fila[indice])) for indice, condicion in filtros
+                ):
+                    continue
+                if proyeccion is not None:
+                    fila = [fila[indice] for indice in proyeccion]
+                yield dict(zip(encabezados, ["" if valor is None else str(valor) for valor in fila]))
+        finally:
+            workbook.close()
 
-        data = []
-        for fila in hoja.iter_rows(min_row=2, values_only=True):
-            fila_dict = {}
-            for indice, valor_celda in enumerate(fila):
-                fila_dict[encabezados[indice]] = "" if valor_celda is None else str(valor_celda)
-            data.append(fila_dict)
-        return data
+    def _row_bounds(self) -> tuple[int, int]:
+        if self._row_range is None:
+            return 2, None
+        start, stop = self._row_range
+        if start < 0 or (stop is not None and stop < start):
+            raise ValueError("row_range debe ser una tupla (inicio, fin) con 0 <= inicio <= fin.")
+        return start + 2, None if stop is None else stop + 1
+
+    def _column_bounds(self, encabezados: list[str], columnas: list[str]) -> tuple[int, int, list[int]]:
+        if columnas is None:
+            return None, None, None
+        positions = [encabezados.index(columna) for columna in columnas]
+        min_col = min(positions, default=0)
+        max_col = max(positions, default=0)
+        return min_col + 1, max_col + 1, [position - min_col for position in positions]
+
+class CacheReadingStrategy(ReadingStrategy):
+    """CacheReadingStrategy
+
+    Lee el formato binario columnar de pytabify (.pytc) mapeando el archivo en memoria.
+    """
+    def read(self) -> list[dict[str, str]]:
+        store = self.read_columns()
+        return [store.record(row) for row in range(len(store))]
+
+    def read_columns(self) -> DTColumns:
+        if not self._file_exists():
+            raise FileNotFoundException(f"El archivo {self._path} NO Existe verifique la ruta.")
+        if self._compression:
+            raise FileReadingException("El cache .pytc se mapea en memoria y no se puede leer comprimido")
+        return self._pushdown_columns(columnar_cache.read_columns(self._path)[0])
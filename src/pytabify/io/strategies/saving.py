@@ -1,71 +1,207 @@
+import io
+import os
 import json
 import csv
-from openpyxl import Workbook
+from datetime import date
+from json.encoder import encode_basestring_ascii
+from typing import Iterator
 from pytabify.io.interfaces.save import SavingStrategy
 from pytabify.core.datatable import DataTable
+from pytabify.core.dt_columns import DTColumns, MISSING
+from pytabify.core.dt_tracker import DTDelta
+from pytabify.io.strategies.csv_mmap import is_ascii_compatible
+from pytabify.io.strategies import columnar_cache
+from pytabify.io.compression import open_file, split_compression
 from pytabify.utils.errors import FileWritingException
 
 class JsonFileSavingStrategy(SavingStrategy):
-    """JsonFileSavingStrategy"""
+    """JsonFileSavingStrategy
+
+    Escribe la lista de registros de forma incremental, fila por fila desde las columnas,
+    sin construir la lista de diccionarios (`to_dict`).
+    Con append=True, si el archivo no cambio desde el ultimo guardado de este DataTable y ninguna
+    fila guardada se modifico, solo se agregan las filas nuevas antes del cierre de la lista.
+    Un json comprimido siempre se reescribe completo.
+    """
     @staticmethod
-    def save(datatable: DataTable, path: str, encoding: str) -> list[dict[str, str]]:
+    def save(datatable: DataTable, path: str, encoding: str, append: bool = False) -> list[dict[str, str]]:
         """save"""
-        data = datatable.to_dict()
-        with open(path, mode="w", encoding=encoding) as output_file:
+        store = datatable.store
+        delta = _delta(store, path, encoding) if append and not split_compression(path)[1] else None
+        if delta is not None:
+            JsonFileSavingStrategy._append(store, path, encoding, delta.start)
+        else:
+            with _open(path, "w", encoding=encoding) as output_file:
+                try:
+                    output_file.write("[")
+                    output_file.writelines(_separated(json_records(store)))
+                    output_file.write("]")
+                except Exception as e:
+                    raise FileWritingException(
+                        f"No fue posible guardar los datos en el json {path}. Mas detalles: {e}"
+                    ) from e
+        store.tracker.saved(path, len(store), store.names)
+
+    @staticmethod
+    def _append(store: DTColumns, path: str, encoding: str, start: int):
+        if start == len(store):
+            return
+        with open(path, mode="r+b") as output_file:
             try:
-                json.dump(data, output_file)
+                output_file.seek(-1, os.SEEK_END)
+                if output_file.read(1) != b"]":
+                    raise ValueError("el archivo no termina con el cierre de la lista")
+                records = ", ".join(json_records(store, start))
+                output_file.seek(-1, os.SEEK_END)
+                output_file.write(f"{', ' if start else ''}{records}]".encode(encoding))
             except Exception as e:
                 raise FileWritingException(
-                    f"No fue posible guardar los datos en el json {path}. Mas detalles: {e}"
+                    f"No fue posible agregar los datos al json {path}. Mas detalles: {e}"
                 ) from e
 
-class CsvFileSavingStrategy(SavingStrategy):
-    """CsvFileSavingStrategy"""
+class JsonLinesFileSavingStrategy(SavingStrategy):
+    """JsonLinesFileSavingStrategy
+
+    Guarda un registro json por linea. Con append=True solo se agregan al final las filas nuevas
+    (pueden tener columnas nuevas), sin reescribir el archivo.
+    """
     @staticmethod
-    def save(datatable: DataTable, path: str, encoding: str) -> list[dict[str, str]]:
+    def save(datatable: DataTable, path: str, encoding: str, append: bool = False) -> list[dict[str, str]]:
         """save"""
+        store = datatable.store
+        delta = store.tracker.delta(path, len(store), store.names) if append else None
+        start = 0 if delta is None else delta.start
+        with _open(path, "w" if delta is None else "a", encoding=encoding) as output_file:
+            try:
+                output_file.writelines(f"{record}\n" for record in json_records(store, start))
+            except Exception as e:
+                raise FileWritingException(
+                    f"No fue posible guardar los datos en el jsonl {path}. Mas detalles: {e}"
+                ) from e
+        store.tracker.saved(path, len(store), store.names)
 
-        fieldnames = datatable.headers()
-        sorted_fieldnames = list(
-            map(
-                lambda fieldname: fieldname.name,
-                sorted(fieldnames, key=lambda field: field.index)
-            )
-        )
-        data = datatable.to_dict()
+class CsvFileSavingStrategy(SavingStrategy):
+    """CsvFileSavingStrategy
 
-        with open(path, mode="w", encoding=encoding, newline="") as output_file:
+    Escribe con `csv.writer` las tuplas de valores de cada fila en el orden de las columnas,
+    sin construir diccionarios por fila.
+    Con append=True, si el archivo no cambio desde el ultimo guardado de este DataTable, ninguna
+    fila guardada se modifico y no hay columnas nuevas, solo se agregan las filas nuevas al final.
+    """
+    @staticmethod
+    def save(datatable: DataTable, path: str, encoding: str, append: bool = False) -> list[dict[str, str]]:
+        """save"""
+        store = datatable.store
+        delta = _delta(store, path, encoding) if append else None
+        start = delta.start if delta is not None and not delta.columns else None
+
+        with _open(path, "w" if start is None else "a", encoding=encoding, newline="") as output_file:
             try:
-                writer = csv.DictWriter(output_file, fieldnames=sorted_fieldnames)
-                writer.writeheader()
-                writer.writerows(data)
+                writer = csv.writer(output_file)
+                if start is None:
+                    writer.writerow(store.names)
+                writer.writerows(store.iter_tuples("", start or 0))
             except Exception as e:
                 raise FileWritingException(
                     f"No fue posible guardar los datos en el csv {path}. Mas detalles: {e}"
                 ) from e
+        store.tracker.saved(path, len(store), store.names)
+
+def _json_float(value: float) -> str:
+    if value != value:
+        return "NaN"
+    if value in (float("inf"), float("-inf")):
+        return "Infinity" if value > 0 else "-Infinity"
+    return float.__repr__(value)
+
+_JSON_ENCODERS = {
+    str: encode_basestring_ascii,
+    int: int.__repr__,
+    float: _json_float,
+    bool: lambda value: "true" if value else "false",
+    date: lambda value: encode_basestring_ascii(value.isoformat()),
+}
+
+def json_records(store: DTColumns, start: int = 0) -> Iterator[str]:
+    """Codifica cada fila desde `start` como un objeto json, igual que `json.dumps(record)`.
+
+    Las llaves se codifican una sola vez por columna y las celdas ausentes se omiten.
+    """
+    keys = [f"{encode_basestring_ascii(name)}: " for name in store.names]
+    encoders = [_JSON_ENCODERS.get(dtype, json.dumps) for dtype in store.dtypes]
+    columns = list(zip(keys, encoders))
+    for values in store.iter_tuples(MISSING, start):
+        yield "{" + ", ".join(
+            key + encode(value) for (key, encode), value in zip(columns, values) if value is not MISSING
+        ) + "}"
+
+def _separated(records: Iterator[str]) -> Iterator[str]:
+    for position, record in enumerate(records):
+        yield record if position == 0 else f", {record}"
+
+def _open(path: str, mode: str, **kwargs):
+    """Abre el archivo de salida; si la ruta termina en .gz, .bz2 o .xz se comprime al escribir."""
+    return open_file(path, mode, split_compression(path)[1], **kwargs)
+
+def _delta(store: DTColumns, path: str, encoding: str) -> DTDelta:
+    """Cambios pendientes de `path`; None si se debe reescribir (incluye codificaciones no ASCII)."""
+    if not is_ascii_compatible(encoding):
+        return None
+    return store.tracker.delta(path, len(store), store.names)
 
 class XlsxFileSavingStrategy(SavingStrategy):
-    """XlsxFileSavingStrategy"""
+    """XlsxFileSavingStrategy
+
+    Escribe en modo write-only de openpyxl: las filas se agregan directo desde el DataTable
+    sin construir una lista de diccionarios ni objetos de celda por cada valor.
+    """
+    DEFAULT_SHEET_NAME = "Sheet"
+
+    @staticmethod
+    def save(datatable: DataTable, path: str, encoding: str, sheet_name: str = DEFAULT_SHEET_NAME) -> list[dict[str, str]]:
+        """save"""
+        XlsxFileSavingStrategy.save_sheets({sheet_name: datatable}, path)
+
+    @staticmethod
+    def save_sheets(sheets: dict[str, DataTable], path: str):
+        """Guarda varios DataTables en un solo libro, uno por hoja, en una sola pasada."""
+        if not sheets:
+            raise ValueError("Se debe indicar al menos una hoja para guardar.")
+
+        from openpyxl import Workbook
+        wb = Workbook(write_only=True)
+        try:
+            for sheet_name, datatable in sheets.items():
+                wb_sheet = wb.create_sheet(title=sheet_name)
+                wb_sheet.append([header.name for header in datatable.headers()])
+                for values in datatable.iter_values():
+                    wb_sheet.append(values)
+            if split_compression(path)[1]:
+                # El zip del libro necesita acceso aleatorio: se arma en memoria y despues se comprime.
+                buffer = io.BytesIO()
+                wb.save(buffer)
+                with _open(path, "wb") as output_file:
+                    output_file.write(buffer.getbuffer())
+            else:
+                wb.save(path)
+        except Exception as e:
+            raise FileWritingException(
+                f"No fue posible guardar los datos en el xlsx {path}. Mas detalles: {e}"
+            ) from e
+
+class CacheFileSavingStrategy(SavingStrategy):
+    """CacheFileSavingStrategy
+
+    Guarda el DataTable en el formato binario columnar de pytabify (.pytc).
+    """
     @staticmethod
-    def save(datatable: DataTable, path: str, encoding: str) -> list[dict[str, str]]:
+    def save(datatable: DataTable, path: str, encoding: str = None) -> list[dict[str, str]]:
         """save"""
-        fieldnames = datatable.headers()
-        sorted_fieldnames = list(
-            map(
-                lambda fieldname: fieldname.name,
-                sorted(fieldnames, key=lambda field: field.index)
-            )
-        )
-        data = datatable.to_dict()
-
-        wb = Workbook()
-        wb_sheet = wb.active
-
-        for col_idx, header in enumerate(sorted_fieldnames, start=1):
-            wb_sheet.cell(row=1, column=col_idx, value=header)
-
-        for row_idx, fila_data in enumerate(data, start=2):
-            for col_idx, header in enumerate(sorted_fieldnames, start=1):
-                wb_sheet.cell(row=row_idx, column=col_idx, value=fila_data.get(header, ""))
-
-        wb.save(path)
+        if split_compression(path)[1]:
+            raise FileWritingException(f"El cache {path} se lee mapeado en memoria y no se puede comprimir")
+        try:
+            columnar_cache.write_columns(datatable.store, path)
+        except Exception as e:
+            raise FileWritingException(
+                f"No fue posible guardar los datos en el cache {path}. Mas detalles: {e}"
+            ) from e
@@ -1,5 +1,6 @@
+from importlib import import_module
 from pytabify.core.datatable import DataTable
-from pytabify.io.strategies.saving import JsonFileSavingStrategy, CsvFileSavingStrategy, XlsxFileSavingStrategy
+from pytabify.utils import instrumentation
 
 class DataTableSaver:
     """Permite guardar un DataTable en diferentes formatos
@@ -13,18 +14,103 @@ class DataTableSaver:
 
     Notas:
     - Se puede especificar el encoding del archivo.
+    - Con append=True (csv, json y jsonl) solo se escriben las filas agregadas desde el ultimo
+      guardado del DataTable en ese archivo; si eso no es posible el archivo se reescribe completo.
+    - Cada guardado se reporta como la etapa "save" a los listeners de `utils.instrumentation`.
+    - Los metodos `into_*_async` guardan desde asyncio en el ejecutor acotado de `utils.aio`.
     """
     @staticmethod
-    def into_csv(datatable: DataTable, path: str, encoding: str = "utf-8"):
+    def into_csv(datatable: DataTable, path: str, encoding: str = "utf-8", append: bool = False):
         """Guarda un DataTable en un archivo CSV."""
-        CsvFileSavingStrategy.save(datatable, path, encoding)
+        save = _strategy("CsvFileSavingStrategy").save
+        _save("csv", [datatable], path, append, save, datatable, path, encoding, append)
 
     @staticmethod
-    def into_json(datatable: DataTable, path: str, encoding: str = "utf-8"):
+    def into_json(datatable: DataTable, path: str, encoding: str = "utf-8", append: bool = False):
         """Guarda un DataTable en un archivo JSON."""
-        JsonFileSavingStrategy.save(datatable, path, encoding)
+        save = _strategy("JsonFileSavingStrategy").save
+        _save("json", [datatable], path, append, save, datatable, path, encoding, append)
 
     @staticmethod
-    def into_xlsx(datatable: DataTable, path: str, encoding: str = "utf-8"):
+    def into_jsonl(datatable: DataTable, path: str, encoding: str = "utf-8", append: bool = False):
+        """Guarda un DataTable en un archivo JSON Lines (un registro por linea)."""
+        save = _strategy("JsonLinesFileSavingStrategy").save
+        _save("jsonl", [datatable], path, append, save, datatable, path, encoding, append)
+
+    @staticmethod
+    def into_xlsx(datatable: DataTable, path: str, encoding: str = "utf-8", sheet_name: str = "Sheet"):
         """Guarda un DataTable en un archivo XLSX."""
-        XlsxFileSavingStrategy.save(datatable, path, encoding)
+        save = _strategy("XlsxFileSavingStrategy").save
+        _save("xlsx", [datatable], path, False, save, datatable, path, encoding, sheet_name)
+
+    @staticmethod
+    def into_xlsx_sheets(sheets: dict[str, DataTable], path: str):
+        """Guarda varios DataTables en un archivo XLSX, uno por hoja (nombre de hoja -> DataTable)."""
+        save = _strategy("XlsxFileSavingStrategy").save_sheets
+        _save("xlsx", list(sheets.values()), path, False, save, sheets, path)
+
+    @staticmethod
+    def into_cache(datatable: DataTable, path: str):
+        """Guarda un DataTable en el formato binario columnar de pytabify (.pytc)."""
+        save = _strategy("CacheFileSavingStrategy").save
+        _save("pytc", [datatable], path, False, save, datatable, path)
+
+    @staticmethod
+    def into_shared_memory(datatable: DataTable, name: str = None):
+        """Publica un DataTable en un segmento de `multiprocessing.shared_memory` y regresa su SharedTable.
+
+        Otros procesos lo abren con `DataTableCreator.from_shared_memory(name)`. El segmento se elimina
+        con `unlink()`, al salir de un `with` o al terminar este proceso.
+        """
+        from pytabify.utils.shared_table import SharedTable
+        return SharedTable.publish(datatable.store, name)
+
+    @staticmethod
+    async def into_csv_async(datatable: DataTable, path: str, encoding: str = "utf-8", append: bool = False):
+        """Version async de `into_csv`; el guardado se ejecuta en el ejecutor de `utils.aio`."""
+        await _run_async(DataTableSaver.into_csv, datatable, path, encoding, append)
+
+    @staticmethod
+    async def into_json_async(datatable: DataTable, path: str, encoding: str = "utf-8", append: bool = False):
+        """Version async de `into_json`."""
+        await _run_async(DataTableSaver.into_json, datatable, path, encoding, append)
+
+    @staticmethod
+    async def into_jsonl_async(datatable: DataTable, path: str, encoding: str = "utf-8", append: bool = False):
+        """Version async de `into_jsonl`."""
+        await _run_async(DataTableSaver.into_jsonl, datatable, path, encoding, append)
+
+    @staticmethod
+    async def into_xlsx_async(datatable: DataTable, path: str, encoding: str = "utf-8", sheet_name: str = "Sheet"):
+        """Version async de `into_xlsx`."""
+        await _run_async(DataTableSaver.into_xlsx, datatable, path, encoding, sheet_name)
+
+    @staticmethod
+    async def into_xlsx_sheets_async(sheets: dict[str, DataTable], path: str):
+        """Version async de `into_xlsx_sheets`."""
+        await _run_async(DataTableSaver.into_xlsx_sheets, sheets, path)
+
+    @staticmethod
+    async def into_cache_async(datatable: DataTable, path: str):
+        """Version async de `into_cache`."""
+        await _run_async(DataTableSaver.into_cache, datatable, path)
+
+async def _run_async(function, *args):
+    from pytabify.utils import aio
+    return await aio.get_runner().run(function, *args)
+
+def _strategy(name: str):
+    """Obtiene una estrategia de guardado; el modulo de estrategias se importa hasta el primer guardado."""
+    return getattr(import_module("pytabify.io.strategies.saving"), name)
+
+def _save(file_format: str, datatables: list[DataTable], path: str, append: bool, save, *args):
+    if not instrumentation.enabled():
+        save(*args)
+        return
+    before = instrumentation.file_size(path) if append else None
+    with instrumentation.stage("save", path) as stage:
+        save(*args)
+        stage.rows = sum(len(datatable) for datatable in datatables)
+        stage.columns = max((len(datatable.store.names) for datatable in datatables), default=0)
+        stage.bytes = (instrumentation.file_size(path) or 0) - (before or 0)
+        stage.details = {"format": file_format, "append": append}
@@ -0,0 +1,101 @@
+"""Ejecucion de lecturas y guardados desde asyncio sin bloquear el event loop.
+
+Las funciones bloqueantes se ejecutan en un ThreadPoolExecutor acotado y un semaforo por
+event loop limita cuantas se ejecutan a la vez. Al cancelar una tarea, el trabajo que aun no
+empezaba se descarta; el que ya se estaba ejecutando termina en su hilo y su resultado se ignora.
+"""
+import asyncio
+import threading
+import weakref
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, AsyncIterator, Callable, Iterator
+
+DEFAULT_MAX_WORKERS = 4
+
+class AsyncRunner:
+    """Ejecutor acotado para las APIs async de DataTableCreator y DataTableSaver.
+
+    `max_workers` es el numero de hilos y `max_concurrency` cuantas operaciones pueden estar
+    en ejecucion a la vez por event loop (por defecto igual a `max_workers`).
+    """
+
+    def __init__(self, max_workers: int = DEFAULT_MAX_WORKERS, max_concurrency: int = None):
+        if max_workers < 1 or (max_concurrency is not None and max_concurrency < 1):
+            raise ValueError("max_workers y max_concurrency deben ser mayores a cero.")
+        self._max_workers = max_workers
+        self._max_concurrency = max_concurrency or max_workers
+        self._executor: ThreadPoolExecutor = None
+        self._semaphores: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    @property
+    def max_workers(self) -> int:
+        """Numero de hilos del ejecutor."""
+        return self._max_workers
+
+    @property
+    def max_concurrency(self) -> int:
+        """Operaciones simultaneas permitidas por event loop."""
+        return self._max_concurrency
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(self._max_workers, thread_name_prefix="pytabify")
+            return self._executor
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(self._max_concurrency)
+        return semaphore
+
+    async def run(self, function: Callable[..., Any], *args, **kwargs) -> Any:
+        """Ejecuta `function` en el ejecutor y espera su resultado."""
+        async with self._semaphore():
+            return await asyncio.wrap_future(self._get_executor().submit(function, *args, **kwargs))
+
+    async def iterate(self, iterator: Iterator[Any]) -> AsyncIterator[Any]:
+        """Consume un iterador bloqueante en el ejecutor, un elemento a la vez.
+
+        Al terminar, cancelar o cerrar la iteracion se cierra el iterador (y su archivo);
+        si un paso seguia en ejecucion se cierra cuando ese paso termina.
+        """
+        done = object()
+        pending: Future = None
+        try:
+            while True:
+                async with self._semaphore():
+                    pending = self._get_executor().submit(next, iterator, done)
+                    item = await asyncio.wrap_future(pending)
+                if item is done:
+                    return
+                yield item
+        finally:
+            close = getattr(iterator, "close", None)
+            if close is not None:
+                if pending is not None and not pending.done():
+                    pending.add_done_callback(lambda _: close())
+                else:
+                    close()
+
+    def shutdown(self, wait: bool = True):
+        """Detiene los hilos del ejecutor; se vuelve a crear en el siguiente uso."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+_runner = AsyncRunner()
+
+def get_runner() -> AsyncRunner:
+    """Obtiene el ejecutor compartido de las APIs async."""
+    return _runner
+
+def configure(max_workers: int = DEFAULT_MAX_WORKERS, max_concurrency: int = None) -> AsyncRunner:
+    """Reemplaza el ejecutor compartido; el anterior termina sus tareas en curso."""
+    global _runner
+    previous, _runner = _runner, AsyncRunner(max_workers, max_concurrency)
+    previous.shutdown(wait=False)
+    return _runner
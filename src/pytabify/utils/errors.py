@@ -17,4 +17,26 @@ class SheetNameHasNotEmptyException(pytabifyError):
     """SheetNameHasNotEmptyException"""
 
 class SheetNameDoesNotExistException(pytabifyError):
-    """SheetNameDoesNotExistException"""
\ No newline at end of file
+    """SheetNameDoesNotExistException"""
+
+class ColumnDoesNotExistException(pytabifyError):
+    """ColumnDoesNotExistException"""
+
+class DataTypeException(pytabifyError):
+    """DataTypeException"""
+
+class FilesReadingException(pytabifyError):
+    """FilesReadingException
+
+    Agrupa los errores de varios archivos; `errors` relaciona cada ruta con su excepcion.
+    """
+    def __init__(self, errors: dict):
+        self.errors = errors
+        details = "; ".join(f"{path}: {error!r}" for path, error in errors.items())
+        super().__init__(f"No fue posible leer {len(errors)} archivo(s). {details}")
+
+    def __reduce__(self):
+        return (self.__class__, (self.errors,))
+
+class DuplicateKeyException(pytabifyError):
+    """DuplicateKeyException"""
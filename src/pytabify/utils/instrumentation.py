@@ -0,0 +1,185 @@
+"""Eventos de instrumentacion por etapa (lectura, validacion, construccion, guardado).
+
+Ejemplo:
+
+```python
+from pytabify.utils.instrumentation import StageCollector
+
+with StageCollector(trace_memory=True) as collector:
+    DataTableCreator.from_file("data.csv")
+print(collector.summary())
+```
+
+Sin listeners registrados `stage` regresa un objeto que no mide nada, por lo que el costo
+es una llamada y un `with` por etapa.
+"""
+import os
+import threading
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+@dataclass(frozen=True)
+class StageEvent:
+    """Resultado de una etapa.
+
+    `duration` esta en segundos; `bytes` son los bytes leidos o escritos y `peak_memory`
+    el pico de memoria (bytes sobre el inicio de la etapa) cuando se activo tracemalloc.
+    """
+    stage: str
+    path: str
+    duration: float
+    rows: int = None
+    columns: int = None
+    bytes: int = None
+    peak_memory: int = None
+    details: dict[str, Any] = field(default_factory=dict)
+
+Listener = Callable[[StageEvent], None]
+
+_listeners: tuple[tuple[Listener, bool], ...] = ()
+_lock = threading.Lock()
+_local = threading.local()
+
+def add_listener(listener: Listener, trace_memory: bool = False):
+    """Registra una funcion que recibe un StageEvent al terminar cada etapa.
+
+    Con `trace_memory` se activa tracemalloc (si no estaba activo) para medir el pico de memoria.
+    """
+    global _listeners
+    with _lock:
+        _listeners = _listeners + ((listener, trace_memory),)
+    if trace_memory and not tracemalloc.is_tracing():
+        tracemalloc.start()
+
+def remove_listener(listener: Listener):
+    """Quita un listener; detiene tracemalloc si ya ningun listener lo necesita."""
+    global _listeners
+    with _lock:
+        removed = [entry for entry in _listeners if entry[0] == listener]
+        _listeners = tuple(entry for entry in _listeners if entry[0] != listener)
+        tracing = any(trace for _, trace in _listeners)
+    if any(trace for _, trace in removed) and not tracing and tracemalloc.is_tracing():
+        tracemalloc.stop()
+
+def enabled() -> bool:
+    """Indica si hay listeners registrados."""
+    return bool(_listeners)
+
+def stage(name: str, path: str = None) -> Any:
+    """Mide una etapa; el objeto del `with` acepta `rows`, `columns`, `bytes` y `details`."""
+    if not _listeners:
+        return _NOOP
+    return _Stage(name, path)
+
+def file_size(path: str) -> int:
+    """Tamano del archivo en bytes o None si no existe."""
+    try:
+        return os.path.getsize(path)
+    except (OSError, TypeError):
+        return None
+
+class _NoopStage:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def __setattr__(self, name, value):
+        pass
+
+_NOOP = _NoopStage()
+
+class _Stage:
+    def __init__(self, name: str, path: str):
+        self.name = name
+        self.path = path
+        self.rows = None
+        self.columns = None
+        self.bytes = None
+        self.details = {}
+        self._start = 0.0
+        self._memory = None
+        self._peak = 0
+
+    def __enter__(self):
+        if tracemalloc.is_tracing():
+            stack = _local.__dict__.setdefault("stack", [])
+            current, peak = tracemalloc.get_traced_memory()
+            if stack:
+                stack[-1]._peak = max(stack[-1]._peak, peak)
+            tracemalloc.reset_peak()
+            self._memory = current
+            self._peak = current
+            stack.append(self)
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        duration = time.perf_counter() - self._start
+        peak_memory = None
+        if self._memory is not None:
+            stack = _local.stack
+            stack.pop()
+            peak = max(self._peak, tracemalloc.get_traced_memory()[1]) if tracemalloc.is_tracing() else self._peak
+            if stack:
+                stack[-1]._peak = max(stack[-1]._peak, peak)
+            peak_memory = peak - self._memory
+        if exc_type is not None:
+            self.details["error"] = repr(exc)
+        event = StageEvent(
+            self.name, self.path, duration, self.rows, self.columns, self.bytes, peak_memory, self.details
+        )
+        for listener, _ in _listeners:
+            listener(event)
+        return False
+
+class StageCollector:
+    """Listener que guarda los eventos; se registra y se quita al usarlo con `with`."""
+
+    def __init__(self, trace_memory: bool = False):
+        self._trace_memory = trace_memory
+        self._events: list[StageEvent] = []
+        self._lock = threading.Lock()
+
+    def __call__(self, event: StageEvent):
+        with self._lock:
+            self._events.append(event)
+
+    def __enter__(self) -> "StageCollector":
+        add_listener(self, self._trace_memory)
+        return self
+
+    def __exit__(self, *exc):
+        remove_listener(self)
+        return False
+
+    @property
+    def events(self) -> list[StageEvent]:
+        """Eventos registrados en orden de llegada."""
+        with self._lock:
+            return list(self._events)
+
+    def summary(self) -> dict[str, dict[str, Any]]:
+        """Totales por etapa: numero de eventos, duracion, filas, bytes y pico de memoria maximo."""
+        result: dict[str, dict[str, Any]] = {}
+        for event in self.events:
+            totals = result.setdefault(
+                event.stage, {"count": 0, "duration": 0.0, "rows": 0, "bytes": 0, "peak_memory": None}
+            )
+            totals["count"] += 1
+            totals["duration"] += event.duration
+            totals["rows"] += event.rows or 0
+            totals["bytes"] += event.bytes or 0
+            if event.peak_memory is not None:
+                totals["peak_memory"] = max(totals["peak_memory"] or 0, event.peak_memory)
+        return result
+
+    def clear(self):
+        """Descarta los eventos registrados."""
+        with self._lock:
+            self._events.clear()
@@ -1,28 +1,52 @@
 """FieldChangeObserver"""
+from collections import deque
+from typing import Union
 from pytabify.core.dt_field import DTField
+from pytabify.core.dt_header import DTHeader
+
+MAX_EVENTS = 1000
 
 class FieldChangeObserver:
-    """FieldChangeObserver"""
-    def __init__(self):
-        self._events: list[dict[str, str]] = []
+    """FieldChangeObserver
+
+    Registra las columnas agregadas a un DataTable (un evento por columna, no por fila).
+    Solo conserva los ultimos `max_events` eventos; `total_events` cuenta todos.
+    """
+    def __init__(self, max_events: int = MAX_EVENTS):
+        self._events: deque[dict] = deque(maxlen=max_events)
+        self._total = 0
         self._pos = 0
 
     def new_index(self) -> int:
         """new_index"""
         return self._pos
 
-    def notify(self, index, field: DTField):
-        """notify"""
+    def notify(self, index, field: Union[DTField, DTHeader]):
+        """notify
+
+        `field` es el DTField de la fila que creo la columna o el DTHeader de una columna
+        agregada con `DataTable.add_column`.
+        """
         self._events.append({
             "field": field,
             "pos": index
         })
+        self._total += 1
         if self._pos == 0:
             self._pos = index
         else:
             self._pos += 1
 
     @property
-    def events(self):
+    def events(self) -> list[dict]:
         """events"""
-        return self._events
+        return list(self._events)
+
+    @property
+    def total_events(self) -> int:
+        """Numero de eventos notificados, incluidos los que ya se descartaron."""
+        return self._total
+
+    def clear(self):
+        """Descarta los eventos registrados."""
+        self._events.clear()
@@ -0,0 +1,261 @@
+"""DataTables en memoria compartida (multiprocessing.shared_memory) para varios procesos.
+
+Un proceso publica el DataTable en un segmento con nombre usando el formato binario columnar (.pytc);
+los demas procesos se conectan por nombre y obtienen un DataTable cuyas columnas leen cada valor
+del segmento al accederlo, sin leer el archivo original ni copiar las columnas.
+
+Ejemplo con pytest-xdist (conftest.py):
+
+```python
+def pytest_configure(config):
+    if not hasattr(config, "workerinput"):  # proceso principal
+        dt = DataTableCreator.from_file("users.csv", dtypes="infer")
+        config.shared_users = DataTableSaver.into_shared_memory(dt, "users")
+
+def pytest_unconfigure(config):
+    if hasattr(config, "shared_users"):
+        config.shared_users.unlink()
+
+@pytest.fixture(scope="session")
+def users():
+    return DataTableCreator.from_shared_memory("users")
+```
+
+El segmento se elimina con `unlink`, al salir del `with` o al terminar el proceso que lo publico.
+"""
+import io
+import sys
+import mmap
+import atexit
+import struct
+import threading
+from datetime import date
+from multiprocessing import shared_memory
+from typing import Any
+from pytabify.core.dt_columns import DTColumns, MISSING
+from pytabify.core.dt_types import DTYPES
+from pytabify.io.strategies import columnar_cache
+from pytabify.utils.errors import FileNotFoundException
+
+_OFFSETS = struct.Struct("=qq")
+_published: dict[str, "SharedTable"] = {}
+_attached: dict[str, "SharedTable"] = {}
+_lock = threading.Lock()
+
+class SharedTable:
+    """Segmento de memoria compartida con las columnas de un DataTable.
+
+    Se crea con `publish` (el proceso queda como dueno) o con `attach` desde cualquier proceso.
+    Los DataTables de `datatable()` nunca escriben en el segmento: al modificar una columna
+    se copia a la memoria del proceso (copia al escribir).
+    """
+
+    def __init__(self, memory: shared_memory.SharedMemory, owner: bool):
+        self._memory = memory
+        self._owner = owner
+        self._closed = False
+        try:
+            self._footer = columnar_cache.read_footer(memory.buf, _data_end(memory.buf))
+        except Exception:
+            memory.close()
+            raise
+
+    @classmethod
+    def publish(cls, store: DTColumns, name: str = None) -> "SharedTable":
+        """Copia un DTColumns a un segmento nuevo; con name=None el nombre se genera.
+
+        Lanza FileExistsError si ya existe un segmento con ese nombre.
+        """
+        buffer = io.BytesIO()
+        columnar_cache.dump_columns(store, buffer)
+        data = buffer.getvalue()
+        memory = shared_memory.SharedMemory(name, create=True, size=len(data))
+        try:
+            # El MAGIC final se escribe al ultimo: un segmento incompleto no tiene un pie valido.
+            body = len(data) - len(columnar_cache.MAGIC)
+            memory.buf[:body] = data[:body]
+            memory.buf[body:len(data)] = data[body:]
+            table = cls(memory, owner=True)
+        except Exception:
+            memory.close()
+            memory.unlink()
+            raise
+        with _lock:
+            _published[table.name] = table
+        return table
+
+    @classmethod
+    def attach(cls, name: str) -> "SharedTable":
+        """Se conecta a un segmento publicado; en un mismo proceso reutiliza la conexion.
+
+        Lanza FileNotFoundException si no existe y FileReadingException si no contiene un DataTable.
+        """
+        with _lock:
+            table = _published.get(name) or _attached.get(name)
+            if table is not None:
+                return table
+            try:
+                memory = _open(name)
+            except FileNotFoundError as exc:
+                raise FileNotFoundException(f"El segmento de memoria compartida {name} no existe") from exc
+            table = cls(memory, owner=False)
+            _attached[name] = table
+            return table
+
+    @property
+    def name(self) -> str:
+        """Nombre con el que otros procesos se conectan al segmento."""
+        return self._memory.name
+
+    @property
+    def owner(self) -> bool:
+        """Indica si este proceso publico el segmento."""
+        return self._owner
+
+    @property
+    def closed(self) -> bool:
+        """Indica si la conexion ya se cerro."""
+        return self._closed
+
+    @property
+    def size(self) -> int:
+        """Tamano del segmento en bytes."""
+        return self._memory.size
+
+    @property
+    def buffer(self) -> memoryview:
+        """Contenido del segmento."""
+        if self._closed:
+            raise ValueError(f"El segmento de memoria compartida {self.name} ya se cerro")
+        return self._memory.buf
+
+    def datatable(self) -> Any:
+        """Crea un DataTable cuyas columnas leen del segmento."""
+        from pytabify.core.datatable import DataTable
+        from pytabify.utils.observer import FieldChangeObserver
+        return DataTable(self.store(), FieldChangeObserver())
+
+    def store(self) -> DTColumns:
+        """Crea un DTColumns cuyas columnas leen del segmento."""
+        if self._closed:
+            raise ValueError(f"El segmento de memoria compartida {self.name} ya se cerro")
+        rows = self._footer["rows"]
+        metas = self._footer["columns"]
+        return DTColumns(
+            [meta["name"] for meta in metas],
+            [SharedColumn(self, meta, rows) for meta in metas],
+            rows,
+            [DTYPES[meta["dtype"]] for meta in metas]
+        )
+
+    def close(self):
+        """Cierra la conexion de este proceso; los DataTables creados con ella ya no se pueden leer."""
+        with _lock:
+            if self._closed:
+                return
+            self._closed = True
+            registry = _published if self._owner else _attached
+            if registry.get(self.name) is self:
+                del registry[self.name]
+        self._memory.close()
+
+    def unlink(self):
+        """Cierra la conexion y elimina el segmento; solo lo puede hacer el proceso que lo publico.
+
+        Los procesos que ya estaban conectados conservan su copia del mapeo hasta cerrarla.
+        """
+        if not self._owner:
+            raise ValueError("Solo el proceso que publico el segmento lo puede eliminar")
+        closed = self._closed
+        self.close()
+        if not closed:
+            self._memory.unlink()
+
+    def __enter__(self) -> "SharedTable":
+        return self
+
+    def __exit__(self, *exc):
+        if self._owner:
+            self.unlink()
+        else:
+            self.close()
+        return False
+
+class SharedColumn:
+    """Columna de un segmento compartido; lee y decodifica cada valor al accederlo."""
+    __slots__ = ("_table", "_meta", "_rows", "_start", "_offsets", "_missing", "_item", "_decode")
+
+    def __init__(self, table: SharedTable, meta: dict[str, Any], rows: int):
+        self._table = table
+        self._meta = meta
+        self._rows = rows
+        self._start = meta["data"][0]
+        self._offsets = meta["offsets"][0] if "offsets" in meta else None
+        self._missing = meta["missing"][0] if "missing" in meta else None
+        dtype = meta["dtype"]
+        self._item = None if dtype == "str" else struct.Struct("=" + columnar_cache.TYPECODES[dtype])
+        self._decode = {"bool": bool, "date": date.fromordinal}.get(dtype)
+
+    def __len__(self):
+        return self._rows
+
+    def _value(self, row: int) -> Any:
+        buffer = self._table.buffer
+        if self._item is not None:
+            value = self._item.unpack_from(buffer, self._start + row * self._item.size)[0]
+            return self._decode(value) if self._decode else value
+        if self._missing is not None and buffer[self._missing + row]:
+            return MISSING
+        start, end = _OFFSETS.unpack_from(buffer, self._offsets + row * 8)
+        return str(buffer[self._start + start:self._start + end], "utf-8")
+
+    def __getitem__(self, row):
+        if isinstance(row, slice):
+            return [self._value(position) for position in range(*row.indices(self._rows))]
+        if row < 0:
+            row += self._rows
+        if not 0 <= row < self._rows:
+            raise IndexError("El indice de la fila esta fuera de rango.")
+        return self._value(row)
+
+    def __iter__(self):
+        return (self._value(row) for row in range(self._rows))
+
+    def __getstate__(self):
+        return (self._table.name, self._meta, self._rows)
+
+    def __setstate__(self, state):
+        name, meta, rows = state
+        self.__init__(SharedTable.attach(name), meta, rows)
+
+def _data_end(buffer: memoryview) -> int:
+    """Fin de los datos; el sistema puede redondear el tamano del segmento al de una pagina."""
+    size = len(buffer)
+    tail = bytes(buffer[max(0, size - mmap.PAGESIZE):])
+    return size - (len(tail) - len(tail.rstrip(b"\0")))
+
+def _open(name: str) -> shared_memory.SharedMemory:
+    """Abre un segmento existente sin registrarlo en el resource_tracker de este proceso.
+
+    Si se registra, el tracker lo elimina al terminar el proceso aunque lo haya publicado otro.
+    """
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name, track=False)
+    from multiprocessing import resource_tracker
+    register = resource_tracker.register
+
+    def skip_shared_memory(resource, rtype):
+        if rtype != "shared_memory":
+            register(resource, rtype)
+    resource_tracker.register = skip_shared_memory
+    try:
+        return shared_memory.SharedMemory(name)
+    finally:
+        resource_tracker.register = register
+
+@atexit.register
+def _cleanup():
+    for table in list(_attached.values()):
+        table.close()
+    for table in list(_published.values()):
+        table.unlink()
@@ -0,0 +1,109 @@
+"""Cache en memoria (por proceso) de los DataTables leidos con DataTableCreator.from_file."""
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+from pytabify.core.dt_columns import DTColumns
+
+@dataclass(frozen=True)
+class CacheInfo:
+    """Estadisticas del cache en memoria."""
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    bytes: int
+    max_entries: int
+    max_bytes: int
+
+class DataTableCache:
+    """Cache LRU de almacenamientos columnares (DTColumns) por archivo y opciones de lectura.
+
+    La llave incluye la ruta absoluta, la fecha de modificacion y el tamano del archivo, por lo que
+    un archivo modificado no vuelve a usar la version anterior. Las entradas se descartan de la menos
+    a la mas recientemente usada al superar `max_entries` o `max_bytes`.
+    Cada consulta entrega una copia que comparte las columnas (copia al escribir),
+    asi una prueba no puede modificar los datos que recibe otra.
+    """
+
+    def __init__(self, max_entries: int = 128, max_bytes: int = None):
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._entries: OrderedDict[tuple, tuple[DTColumns, int]] = OrderedDict()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(path: str, options: dict[str, Any]) -> tuple:
+        """Construye la llave de un archivo.
+
+        Regresa None (no se usa el cache) si el archivo no existe o si alguna opcion no se puede
+        serializar de forma determinista, por ejemplo una funcion en `where`.
+        """
+        from pytabify.io.strategies.columnar_cache import options_key
+        serialized = options_key(options)
+        if serialized is None:
+            return None
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return (os.path.abspath(path), stat.st_mtime_ns, stat.st_size, serialized)
+
+    def get(self, key: tuple) -> DTColumns:
+        """Obtiene una copia (copia al escribir) del almacenamiento en cache o None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[0].share()
+
+    def put(self, key: tuple, store: DTColumns) -> DTColumns:
+        """Guarda un almacenamiento y regresa una copia (copia al escribir) para el llamador."""
+        size = store.nbytes() if self._max_bytes is not None else 0
+        shared = store.share()
+        with self._lock:
+            if self._max_bytes is not None and size > self._max_bytes:
+                return shared
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[1]
+            self._entries[key] = (store, size)
+            self._bytes += size
+            self._evict()
+        return shared
+
+    def _evict(self):
+        while self._entries and (
+            len(self._entries) > self._max_entries
+            or (self._max_bytes is not None and self._bytes > self._max_bytes)
+        ):
+            _, (_, size) = self._entries.popitem(last=False)
+            self._bytes -= size
+            self._evictions += 1
+
+    def invalidate(self, path: str = None):
+        """Descarta las entradas de un archivo, o todas si no se indica `path`."""
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+                self._bytes = 0
+                return
+            path = os.path.abspath(path)
+            for key in [key for key in self._entries if key[0] == path]:
+                self._bytes -= self._entries.pop(key)[1]
+
+    def info(self) -> CacheInfo:
+        """Obtiene las estadisticas del cache."""
+        with self._lock:
+            return CacheInfo(
+                self._hits, self._misses, self._evictions, len(self._entries),
+                self._bytes, self._max_entries, self._max_bytes
+            )
@@ -1,10 +1,78 @@
-from typing import Any
-import jsonschema
+import json
+from typing import Any, Sequence
 from pytabify.core.dt_schema import DATA_TABLE_SCHEMA
+from pytabify.core.dt_columns import DTColumns
 
-def validate_data(data: Any) -> bool:
-    try:
-        jsonschema.validate(instance=data, schema=DATA_TABLE_SCHEMA)
+VALIDATION_MODES = ("full", "structural", "sample", "off")
+"""Modos de validacion:
+
+- full: valida todos los registros contra el esquema.
+- structural: solo verifica que los datos sean una lista de diccionarios.
+- sample: verificacion estructural de todo y validacion completa de una muestra de registros.
+- off: no valida.
+"""
+
+SAMPLE_SIZE = 100
+
+_validators: dict[str, Any] = {}
+
+def validate_data(data: Any, schema: dict = None, mode: str = "full") -> bool:
+    """Valida los datos contra un JSON Schema (por defecto DATA_TABLE_SCHEMA).
+
+    Con el esquema por defecto la validacion es una verificacion estructural directa;
+    jsonschema solo se usa para construir el error cuando los datos no son validos.
+    `data` tambien puede ser un DTColumns leido directamente en columnas.
+    """
+    if mode not in VALIDATION_MODES:
+        raise ValueError(f"El modo de validacion {mode} no es valido. Opciones: {VALIDATION_MODES}")
+    if mode == "off":
+        return True
+
+    schema = DATA_TABLE_SCHEMA if schema is None else schema
+    if isinstance(data, DTColumns):
+        if mode == "structural" or schema is DATA_TABLE_SCHEMA:
+            return True
+        # Solo se crean los registros de las filas a validar; en "sample" no se decodifica el resto.
+        rows = _sample_rows(len(data)) if mode == "sample" else range(len(data))
+        _raise_errors(schema, [data.record(row) for row in rows])
         return True
-    except jsonschema.ValidationError as e:
-        raise e
+    if not _is_table(data):
+        if mode != "structural":
+            _raise_errors(schema, data)
+        _raise_errors(DATA_TABLE_SCHEMA, data)
+    if mode == "structural" or schema is DATA_TABLE_SCHEMA:
+        return True
+    if mode == "sample":
+        data = [data[row] for row in _sample_rows(len(data))]
+    _raise_errors(schema, data)
+    return True
+
+def _sample_rows(length: int) -> Sequence[int]:
+    """Filas de la muestra: SAMPLE_SIZE filas repartidas uniformemente (todas si son menos)."""
+    if length <= SAMPLE_SIZE:
+        return range(length)
+    step = length / SAMPLE_SIZE
+    return [int(index * step) for index in range(SAMPLE_SIZE)]
+
+def _is_table(data: Any) -> bool:
+    return isinstance(data, list) and all(isinstance(record, dict) for record in data)
+
+def _raise_errors(schema: dict, data: Any):
+    from jsonschema.exceptions import best_match
+
+    error = best_match(_get_validator(schema).iter_errors(data))
+    if error is not None:
+        raise error
+
+def _get_validator(schema: dict):
+    """Obtiene un validador compilado para el esquema, reutilizandolo entre llamadas."""
+    key = json.dumps(schema, sort_keys=True)
+    validator = _validators.get(key)
+    if validator is None:
+        from jsonschema.validators import validator_for
+
+        validator_class = validator_for(schema)
+        validator_class.check_schema(schema)
+        validator = validator_class(schema)
+        _validators[key] = validator
+    return validator
@@ -1,6 +1,12 @@
 import os
 import sys
+import json
+import time
+import asyncio
+import threading
+from datetime import date
 import pytest
+import jsonschema
 from assertpy import assert_that
 from unittest.mock import MagicMock, patch, mock_open
 
@@ -14,22 +20,33 @@ from pytabify import (
 )
 from pytabify.core.dt_row import DTRow
 from pytabify.core.dt_field import DTField
+from pytabify.core.dt_columns import DTColumns, MISSING
 from pytabify.utils.observer import FieldChangeObserver
 from pytabify.io.strategies.reading import (
     CSVFileReadingStrategy,
     JSONFileReadingStrategy,
-    XLSXReadingStrategy
+    JSONLinesFileReadingStrategy,
+    XLSXReadingStrategy,
+    CacheReadingStrategy
 )
 from pytabify.io.strategies.saving import (
     JsonFileSavingStrategy,
     CsvFileSavingStrategy
 )
 from pytabify.io.file_formats import FileFormats
+from pytabify.utils.validation import validate_data
+from pytabify.utils import aio, instrumentation
 from pytabify.utils.errors import (
     FileExtensionException,
+    FileNotFoundException,
+    FileReadingException,
+    FilesReadingException,
     FileWritingException,
     SheetNameHasNotEmptyException,
-    SheetNameDoesNotExistException
+    SheetNameDoesNotExistException,
+    ColumnDoesNotExistException,
+    DataTypeException,
+    DuplicateKeyException
 )
 
 @pytest.fixture
@@ -62,16 +79,585 @@ class TestDataTableCreator:
         with pytest.raises(FileExtensionException):
             DataTableCreator.from_file("archivo.txt")
 
+class TestIterFile:
+    @pytest.fixture
+    def json_file(self, tmp_path):
+        records = [{"id": i, "name": f"user {i}", "tags": [i, "x"]} for i in range(25)]
+        filepath = tmp_path / "data.json"
+        filepath.write_text(json.dumps(records, indent=2))
+        return filepath
+
+    def test_iter_file_json_por_bloques(self, json_file, monkeypatch):
+        monkeypatch.setattr(JSONFileReadingStrategy, "_BLOCK_SIZE", 7)
+        chunks = list(DataTableCreator.iter_chunks(str(json_file), chunk_size=10))
+        assert_that([len(chunk) for chunk in chunks]).is_equal_to([10, 10, 5])
+        rows = list(DataTableCreator.iter_file(str(json_file), chunk_size=10))
+        assert_that([row.to_dict() for row in rows]).is_equal_to(
+            DataTableCreator.from_file(str(json_file)).to_dict()
+        )
+
+    def test_iter_file_csv(self, tmp_path):
+        filepath = tmp_path / "data.csv"
+        filepath.write_text('name,age\nAlice,30\n"Bob\nJr",25\n')
+        rows = list(DataTableCreator.iter_file(str(filepath), chunk_size=1))
+        assert_that(rows).is_length(2)
+        assert_that(rows[1].name.value).is_equal_to("Bob\nJr")
+
+    def test_iter_file_json_que_no_es_lista(self, tmp_path):
+        filepath = tmp_path / "data.json"
+        filepath.write_text('{"name": "Alice"}')
+        with pytest.raises(jsonschema.ValidationError):
+            list(DataTableCreator.iter_file(str(filepath)))
+
+    @pytest.mark.parametrize("content", ['[{"a": 1},', '[{"a": 1} {"b": 2}]', '[{"a": 1}] x', '[1,]'])
+    def test_iter_file_json_invalido(self, tmp_path, content):
+        filepath = tmp_path / "data.json"
+        filepath.write_text(content)
+        with pytest.raises(FileReadingException):
+            list(DataTableCreator.iter_file(str(filepath)))
+
+    def test_iter_file_json_vacio(self, tmp_path):
+        filepath = tmp_path / "data.json"
+        filepath.write_text(" [ ] ")
+        assert_that(list(DataTableCreator.iter_file(str(filepath)))).is_empty()
+
+    def test_chunk_size_invalido(self, json_file):
+        with pytest.raises(ValueError):
+            list(DataTableCreator.iter_file(str(json_file), chunk_size=0))
+
+class TestValidation:
+    AGE_SCHEMA = {
+        "type": "array",
+        "items": {"type": "object", "properties": {"age": {"type": "integer"}}}
+    }
+
+    def test_esquema_por_defecto_sin_jsonschema(self, sample_records):
+        with patch("pytabify.utils.validation._raise_errors") as mock_raise:
+            assert_that(validate_data(sample_records)).is_true()
+            mock_raise.assert_not_called()
+
+    @pytest.mark.parametrize("mode", ["full", "structural", "sample"])
+    def test_datos_que_no_son_tabla(self, mode):
+        with pytest.raises(jsonschema.ValidationError):
+            validate_data([{"a": 1}, "b"], mode=mode)
+
+    def test_modo_off(self):
+        assert_that(validate_data("no es tabla", mode="off")).is_true()
+
+    def test_modo_invalido(self, sample_records):
+        with pytest.raises(ValueError):
+            validate_data(sample_records, mode="fast")
+
+    def test_esquema_propio(self, sample_records):
+        assert_that(validate_data(sample_records, self.AGE_SCHEMA)).is_true()
+        with pytest.raises(jsonschema.ValidationError):
+            validate_data([{"age": "30"}], self.AGE_SCHEMA)
+        assert_that(validate_data([{"age": "30"}], self.AGE_SCHEMA, mode="structural")).is_true()
+
+    def test_modo_muestra(self):
+        records = [{"age": i} for i in range(1000)]
+        records[1] = {"age": "x"}
+        assert_that(validate_data(records, self.AGE_SCHEMA, mode="sample")).is_true()
+        records[0] = {"age": "x"}
+        with pytest.raises(jsonschema.ValidationError):
+            validate_data(records, self.AGE_SCHEMA, mode="sample")
+
+    def test_modo_muestra_en_columnas(self):
+        store = DTColumns.from_records([{"age": str(i)} for i in range(1000)])
+        schema = {"type": "array", "items": {"type": "object", "required": ["age"]}}
+        with patch.object(DTColumns, "record", wraps=store.record) as record:
+            assert_that(validate_data(store, schema, mode="sample")).is_true()
+        assert_that(record.call_count).is_equal_to(100)
+        with pytest.raises(jsonschema.ValidationError):
+            validate_data(store, self.AGE_SCHEMA, mode="sample")
+
+    def test_validador_en_cache(self, sample_records):
+        from pytabify.utils import validation
+        validate_data(sample_records, self.AGE_SCHEMA)
+        validator = validation._get_validator(self.AGE_SCHEMA)
+        assert_that(validation._get_validator(dict(self.AGE_SCHEMA))).is_same_as(validator)
+
+    def test_from_file_con_modo(self, tmp_path):
+        filepath = tmp_path / "data.json"
+        filepath.write_text('[{"age": "30"}]')
+        with pytest.raises(jsonschema.ValidationError):
+            DataTableCreator.from_file(str(filepath), schema=self.AGE_SCHEMA)
+        with pytest.raises(jsonschema.ValidationError):
+            list(DataTableCreator.iter_file(str(filepath), schema=self.AGE_SCHEMA))
+        dt = DataTableCreator.from_file(str(filepath), validate="off", schema=self.AGE_SCHEMA)
+        assert_that(dt[0].age.value).is_equal_to("30")
+
+class TestParallelCSV:
+    @pytest.fixture
+    def csv_file(self, tmp_path):
+        filepath = tmp_path / "big.csv"
+        lines = ["id,comment,city"]
+        for i in range(500):
+            comment = f'"linea {i}\nsegunda, con ""comillas""\n"' if i % 7 == 0 else f"texto {i}"
+            if i % 11 == 0:
+                comment = f'"crlf {i}\r\ndentro de comillas"'
+            lines.append(f"{i},{comment},ciudad {i % 13}")
+        filepath.write_text("\r\n".join(lines) + "\r\n", encoding="utf-8")
+        return str(filepath)
+
+    @pytest.mark.parametrize("workers", [2, 5, 16])
+    def test_igual_que_lectura_secuencial(self, csv_file, workers, monkeypatch):
+        monkeypatch.setattr(CSVFileReadingStrategy, "MIN_RANGE_BYTES", 64)
+        strategy = CSVFileReadingStrategy(csv_file, workers=workers)
+        store = strategy.read_columns()
+        assert_that(DataTable(store, FieldChangeObserver()).to_dict()).is_equal_to(
+            CSVFileReadingStrategy(csv_file).read()
+        )
+        assert_that(store.columns[1][11]).is_equal_to("crlf 11\r\ndentro de comillas")
+
+    def test_from_file_con_workers(self, csv_file, monkeypatch):
+        monkeypatch.setattr(CSVFileReadingStrategy, "MIN_RANGE_BYTES", 64)
+        dt = DataTableCreator.from_file(csv_file, workers=4)
+        assert_that(dt).is_length(500)
+        assert_that(dt[7].comment.value).is_equal_to('linea 7\nsegunda, con "comillas"\n')
+
+    def test_sin_workers_usa_lectura_secuencial(self, csv_file):
+        assert_that(CSVFileReadingStrategy(csv_file).read_columns()).is_none()
+
+    def test_archivo_solo_con_encabezado(self, tmp_path):
+        filepath = tmp_path / "empty.csv"
+        filepath.write_text("a,b\n")
+        store = CSVFileReadingStrategy(str(filepath), workers=4).read_columns()
+        assert_that(store.names).is_equal_to(["a", "b"])
+        assert_that(store).is_length(0)
+
+class TestMmapCSV:
+    CONTENT = 'id,comment,city\r\n1,"hola, ""mundo""\nadios",Madrid\r\n\r\n2,,Lima\r\n3,corto\r\n4,"ul\r\ntimo",Quito'
+
+    @pytest.fixture
+    def csv_file(self, tmp_path):
+        filepath = tmp_path / "data.csv"
+        filepath.write_bytes(self.CONTENT.encode("utf-8"))
+        return str(filepath)
+
+    def test_igual_que_lectura_secuencial(self, csv_file):
+        dt = DataTableCreator.from_file(csv_file, mmap=True)
+        assert_that(dt.to_dict()).is_equal_to(DataTableCreator.from_file(csv_file).to_dict())
+        assert_that(dt[3].comment.value).is_equal_to("ul\r\ntimo")
+
+    def test_columnas_perezosas(self, csv_file):
+        from pytabify.io.strategies.csv_mmap import CSVMmapColumn, CSVMmapIndex
+        dt = DataTableCreator.from_file(csv_file, mmap=True)
+        assert_that(dt._store.columns[0]).is_instance_of(CSVMmapColumn)
+        with patch.object(CSVMmapIndex, "_decode", wraps=dt._store.columns[0]._index._decode) as decode:
+            assert_that(dt[1].city.value).is_equal_to("Lima")
+            assert_that(decode.call_count).is_equal_to(1)
+
+    def test_modificar_materializa_la_columna(self, csv_file):
+        dt = DataTableCreator.from_file(csv_file, mmap=True)
+        dt[0].city = "Roma"
+        assert_that(dt._store.columns[2]).is_instance_of(list)
+        assert_that([row.city.value for row in dt]).is_equal_to(["Roma", "Lima", "None", "Quito"])
+
+    def test_fila_con_campos_de_mas(self, tmp_path):
+        filepath = tmp_path / "data.csv"
+        filepath.write_text("a,b\n1,2,3\n")
+        with pytest.raises(FileReadingException):
+            DataTableCreator.from_file(str(filepath), mmap=True)
+
+    def test_se_puede_serializar(self, csv_file):
+        import pickle
+        dt = DataTableCreator.from_file(csv_file, mmap=True)
+        assert_that(pickle.loads(pickle.dumps(dt)).to_dict()).is_equal_to(dt.to_dict())
+
+class TestColumnarCache:
+    RECORDS = [
+        {"id": 1, "price": 1.5, "active": True, "born": "2000-01-31", "name": "Ñandú"},
+        {"id": 2, "price": 2.25, "active": False, "born": "1999-12-01", "name": ""},
+    ]
+
+    def test_into_cache_y_from_cache(self, tmp_path):
+        dt = DataTableCreator.from_records(self.RECORDS, dtypes="infer")
+        dt[0]["extra"] = "solo en la primera"
+        output_file = str(tmp_path / "data.pytc")
+        DataTableSaver.into_cache(dt, output_file)
+        loaded = DataTableCreator.from_cache(output_file)
+        assert_that(loaded.to_dict()).is_equal_to(dt.to_dict())
+        assert_that(loaded.dtypes()).is_equal_to(dt.dtypes())
+        assert_that(DataTableCreator.from_file(output_file).to_dict()).is_equal_to(dt.to_dict())
+
+    def test_archivo_invalido(self, tmp_path):
+        filepath = tmp_path / "data.pytc"
+        filepath.write_bytes(b"no es cache")
+        with pytest.raises(FileReadingException):
+            DataTableCreator.from_cache(str(filepath))
+
+    def test_cache_transparente(self, tmp_path):
+        filepath = tmp_path / "data.csv"
+        filepath.write_text("id,name\n1,Alice\n")
+        first = DataTableCreator.from_file(str(filepath), cache=True)
+        cache_files = list((tmp_path / "__pytabify_cache__").iterdir())
+        assert_that(cache_files).is_length(1)
+
+        with patch.object(CSVFileReadingStrategy, "read", side_effect=AssertionError("no debe leer")):
+            second = DataTableCreator.from_file(str(filepath), cache=True)
+        assert_that(second.to_dict()).is_equal_to(first.to_dict())
+
+        filepath.write_text("id,name\n1,Alice\n2,Bob\n")
+        os.utime(filepath, ns=(0, 10 ** 18))
+        assert_that(DataTableCreator.from_file(str(filepath), cache=True)).is_length(2)
+        assert_that(list((tmp_path / "__pytabify_cache__").iterdir())).is_length(1)
+
+    def test_cache_en_carpeta_y_opciones(self, tmp_path):
+        filepath = tmp_path / "data.csv"
+        filepath.write_text("id\n1\n")
+        cache_dir = tmp_path / "compilados"
+        DataTableCreator.from_file(str(filepath), cache=str(cache_dir))
+        typed = DataTableCreator.from_file(str(filepath), cache=str(cache_dir), dtypes="infer")
+        assert_that(typed.dtypes()).is_equal_to({"id": int})
+        assert_that(list(cache_dir.iterdir())).is_length(2)
+
+    def test_cache_con_filtro_de_funciones(self, tmp_path):
+        filepath = tmp_path / "data.csv"
+        filepath.write_text("id,age\n1,30\n2,70\n")
+        cache_dir = tmp_path / "compilados"
+        for limit, expected in ((20, ["1", "2"]), (60, ["2"])):
+            dt = DataTableCreator.from_file(
+                str(filepath), cache=str(cache_dir), where={"age": lambda value, limit=limit: int(value) > limit}
+            )
+            assert_that([row.id.value for row in dt]).is_equal_to(expected)
+        assert_that(cache_dir.exists()).is_false()
+        DataTableCreator.from_file(str(filepath), cache=str(cache_dir), where={"age": "70"}, dtypes={"id": int})
+        assert_that(list(cache_dir.iterdir())).is_length(1)
+
+class TestMemoryCache:
+    @pytest.fixture(autouse=True)
+    def memory_cache(self):
+        DataTableCreator.enable_cache(max_entries=2)
+        yield
+        DataTableCreator.disable_cache()
+
+    @pytest.fixture
+    def csv_file(self, tmp_path):
+        filepath = tmp_path / "data.csv"
+        filepath.write_text("id,name\n1,Alice\n2,Bob\n")
+        return filepath
+
+    def test_aciertos_y_fallos(self, csv_file):
+        DataTableCreator.from_file(str(csv_file))
+        with patch.object(CSVFileReadingStrategy, "read", side_effect=AssertionError("no debe leer")):
+            dt = DataTableCreator.from_file(str(csv_file))
+        assert_that(dt[1].name.value).is_equal_to("Bob")
+        info = DataTableCreator.cache_info()
+        assert_that((info.hits, info.misses, info.entries)).is_equal_to((1, 1, 1))
+
+    def test_filtro_con_funciones_no_usa_el_cache(self, csv_file):
+        for limit, expected in ((0, ["1", "2"]), (1, ["2"])):
+            dt = DataTableCreator.scan(str(csv_file)).where(id=lambda value, limit=limit: int(value) > limit).collect()
+            assert_that([row.id.value for row in dt]).is_equal_to(expected)
+        assert_that(DataTableCreator.cache_info().entries).is_equal_to(0)
+        for _ in range(2):
+            dt = DataTableCreator.scan(str(csv_file)).where(name="Bob").collect()
+            assert_that(dt.to_dict()).is_equal_to([{"id": "2", "name": "Bob"}])
+        info = DataTableCreator.cache_info()
+        assert_that((info.hits, info.entries)).is_equal_to((1, 1))
+
+    def test_copia_al_escribir(self, csv_file):
+        first = DataTableCreator.from_file(str(csv_file))
+        first[0].name = "Cambiado"
+        first[0].city = "Madrid"
+        second = DataTableCreator.from_file(str(csv_file))
+        assert_that(second.to_dict()).is_equal_to([{"id": "1", "name": "Alice"}, {"id": "2", "name": "Bob"}])
+        assert_that(first[0].name.value).is_equal_to("Cambiado")
+
+    def test_invalidacion_por_cambio_de_archivo(self, csv_file):
+        DataTableCreator.from_file(str(csv_file))
+        csv_file.write_text("id,name\n1,Alice\n")
+        os.utime(csv_file, ns=(0, 10 ** 18))
+        assert_that(DataTableCreator.from_file(str(csv_file))).is_length(1)
+        DataTableCreator.clear_cache(str(csv_file))
+        assert_that(DataTableCreator.cache_info().entries).is_equal_to(0)
+
+    def test_desalojo_lru(self, tmp_path):
+        paths = []
+        for i in range(3):
+            filepath = tmp_path / f"data{i}.csv"
+            filepath.write_text(f"id\n{i}\n")
+            paths.append(str(filepath))
+            DataTableCreator.from_file(str(filepath))
+        info = DataTableCreator.cache_info()
+        assert_that((info.entries, info.evictions)).is_equal_to((2, 1))
+
+    def test_limite_de_bytes(self, csv_file):
+        DataTableCreator.enable_cache(max_bytes=1)
+        DataTableCreator.from_file(str(csv_file))
+        assert_that(DataTableCreator.cache_info().entries).is_equal_to(0)
+
+class TestFromFiles:
+    @pytest.fixture
+    def files(self, tmp_path):
+        csv_file = tmp_path / "users.csv"
+        csv_file.write_text("id,name\n1,Alice\n2,Bob\n")
+        json_file = tmp_path / "more.json"
+        json_file.write_text('[{"id": 3, "email": "c@x.com"}]')
+        return [str(csv_file), str(json_file)]
+
+    @pytest.mark.parametrize("executor", ["thread", "process"])
+    def test_from_files_diccionario(self, files, executor):
+        result = DataTableCreator.from_files(files, workers=2, executor=executor, dtypes="infer")
+        assert_that(list(result)).is_equal_to(files)
+        assert_that(result[files[0]].to_dict()).is_equal_to([{"id": 1, "name": "Alice"}, {"id": 2, "name": "Bob"}])
+        assert_that(result[files[1]][0].email.value).is_equal_to("c@x.com")
+
+    def test_from_files_concatenado(self, files):
+        dt = DataTableCreator.from_files(files, concat=True)
+        assert_that(dt.to_dict()).is_equal_to([
+            {"id": "1", "name": "Alice"},
+            {"id": "2", "name": "Bob"},
+            {"id": "3", "email": "c@x.com"}
+        ])
+        assert_that([h.name for h in dt.headers()]).is_equal_to(["id", "name", "email"])
+
+    def test_from_files_errores_por_archivo(self, files, tmp_path):
+        bad = str(tmp_path / "bad.json")
+        with open(bad, "w") as file:
+            file.write("{")
+        with pytest.raises(FilesReadingException) as exc_info:
+            DataTableCreator.from_files(files + [bad, "missing.txt"])
+        assert_that(exc_info.value.errors).contains_only(bad, "missing.txt")
+        assert_that(exc_info.value.errors["missing.txt"]).is_instance_of(FileExtensionException)
+
+    def test_concat_conserva_tipos(self):
+        first = DataTableCreator.from_records([{"id": 1, "v": 1.5}], dtypes="infer")
+        second = DataTableCreator.from_records([{"id": 2, "v": "x"}], dtypes="infer")
+        dt = DataTable.concat([first, second])
+        assert_that(dt.dtypes()).is_equal_to({"id": int, "v": str})
+        assert_that([row.v.value for row in dt]).is_equal_to(["1.5", "x"])
+
+class TestAsync:
+    @pytest.fixture
+    def csv_file(self, tmp_path):
+        csv_file = tmp_path / "data.csv"
+        csv_file.write_text("id,name\n" + "".join(f"{i},n{i}\n" for i in range(10)), encoding="utf-8")
+        return str(csv_file)
+
+    def test_from_file_async(self, csv_file):
+        dt = asyncio.run(DataTableCreator.from_file_async(csv_file, dtypes="infer"))
+        assert_that(dt.dtypes()).is_equal_to({"id": int, "name": str})
+        assert_that(len(dt)).is_equal_to(10)
+
+    def test_from_files_async_errores(self, csv_file):
+        with pytest.raises(FilesReadingException) as exc_info:
+            asyncio.run(DataTableCreator.from_files_async([csv_file, "missing.txt"]))
+        assert_that(exc_info.value.errors).contains_only("missing.txt")
+        dt = asyncio.run(DataTableCreator.from_files_async([csv_file, csv_file], concat=True))
+        assert_that(len(dt)).is_equal_to(20)
+
+    def test_iter_file_async_cierra_al_salir(self, csv_file):
+        async def first_rows():
+            rows = []
+            async for row in DataTableCreator.iter_file_async(csv_file, chunk_size=3):
+                rows.append(row.id.value)
+                if len(rows) == 4:
+                    break
+            return rows
+        assert_that(asyncio.run(first_rows())).is_equal_to(["0", "1", "2", "3"])
+
+    def test_limite_de_concurrencia(self):
+        runner = aio.AsyncRunner(max_workers=4, max_concurrency=2)
+        lock = threading.Lock()
+        state = {"running": 0, "peak": 0}
+
+        def work():
+            with lock:
+                state["running"] += 1
+                state["peak"] = max(state["peak"], state["running"])
+            time.sleep(0.02)
+            with lock:
+                state["running"] -= 1
+
+        async def main():
+            await asyncio.gather(*(runner.run(work) for _ in range(6)))
+        asyncio.run(main())
+        runner.shutdown()
+        assert_that(state["peak"]).is_equal_to(2)
+
+    def test_cancelar_descarta_lecturas_pendientes(self):
+        runner = aio.AsyncRunner(max_workers=1)
+        started = []
+        release = threading.Event()
+
+        async def main():
+            first = asyncio.ensure_future(runner.run(release.wait))
+            second = asyncio.ensure_future(runner.run(started.append, "second"))
+            await asyncio.sleep(0.01)
+            second.cancel()
+            release.set()
+            await first
+            with pytest.raises(asyncio.CancelledError):
+                await second
+        asyncio.run(main())
+        runner.shutdown()
+        assert_that(started).is_empty()
+
+    def test_into_csv_async(self, csv_file, tmp_path):
+        output = str(tmp_path / "out.csv")
+        dt = DataTableCreator.from_file(csv_file)
+        asyncio.run(DataTableSaver.into_csv_async(dt, output))
+        assert_that(DataTableCreator.from_file(output).to_dict()).is_equal_to(dt.to_dict())
+
+class TestSharedMemory:
+    @pytest.fixture
+    def name(self, request):
+        return f"pytabify_{os.getpid()}_{request.node.name}"[:30]
+
+    @pytest.fixture
+    def typed_datatable(self):
+        return DataTableCreator.from_records([
+            {"id": 1, "name": "Añá", "born": "2024-01-02", "ok": "True", "score": 1.5},
+            {"id": 2, "born": "2024-01-03", "ok": "False", "score": 2.5, "city": "Lima"}
+        ], dtypes="infer")
+
+    def _run(self, code):
+        import subprocess
+        return subprocess.run(
+            [sys.executable, "-c", f"from pytabify import DataTableCreator, DataTableSaver; {code}"],
+            capture_output=True, text=True, check=True, env=dict(os.environ, PYTHONPATH=path)
+        )
+
+    def test_otro_proceso_lee_el_datatable(self, typed_datatable, name):
+        with DataTableSaver.into_shared_memory(typed_datatable, name):
+            result = self._run(f"print(repr(DataTableCreator.from_shared_memory({name!r}).to_dict()))")
+        assert_that(result.stdout.strip()).is_equal_to(repr(typed_datatable.to_dict()))
+        assert_that(result.stderr).is_empty()
+
+    def test_vista_copia_al_escribir(self, typed_datatable, name):
+        with DataTableSaver.into_shared_memory(typed_datatable, name):
+            dt = DataTableCreator.from_shared_memory(name)
+            assert_that(dt.dtypes()).is_equal_to(typed_datatable.dtypes())
+            dt[0].name = "Bob"
+            dt.update("score", lambda score: score * 2)
+            assert_that([row.score.value for row in dt]).is_equal_to(["3.0", "5.0"])
+            other = DataTableCreator.from_shared_memory(name)
+            assert_that(other[0].name.value).is_equal_to("Añá")
+            assert_that(other.where(city="Lima").to_dict()).is_equal_to([typed_datatable.to_dict()[1]])
+
+    def test_unlink_elimina_el_segmento(self, sample_datatable, name):
+        shared = DataTableSaver.into_shared_memory(sample_datatable, name)
+        shared.unlink()
+        with pytest.raises(FileNotFoundException):
+            DataTableCreator.from_shared_memory(name)
+
+    def test_se_elimina_al_terminar_el_proceso(self, name):
+        self._run(f"DataTableSaver.into_shared_memory(DataTableCreator.from_records([{{'a': 1}}]), {name!r})")
+        with pytest.raises(FileNotFoundException):
+            DataTableCreator.from_shared_memory(name)
+
+    def test_conexion_de_otro_proceso(self, sample_datatable, name):
+        with DataTableSaver.into_shared_memory(sample_datatable, name):
+            code = (
+                "from pytabify.utils.shared_table import SharedTable; "
+                f"shared = SharedTable.attach({name!r}); print(shared.owner, len(shared.datatable())); shared.close()"
+            )
+            assert_that(self._run(code).stdout.split()).is_equal_to(["False", "2"])
+            assert_that(DataTableCreator.from_shared_memory(name).to_dict()).is_equal_to(sample_datatable.to_dict())
+
+class TestCompression:
+    @pytest.fixture
+    def datatable(self):
+        return DataTableCreator.from_records([{"id": i, "name": f"n{i}"} for i in range(5)])
+
+    @pytest.mark.parametrize("ext", ["gz", "bz2", "xz"])
+    @pytest.mark.parametrize("file_format", ["csv", "json", "jsonl"])
+    def test_guarda_y_lee_comprimido(self, datatable, tmp_path, file_format, ext):
+        filepath = str(tmp_path / f"data.{file_format}.{ext}")
+        getattr(DataTableSaver, f"into_{file_format}")(datatable, filepath)
+        with open(filepath, "rb") as file:
+            assert_that(file.read(1)).is_not_equal_to(b"i" if file_format == "csv" else b"[")
+        assert_that(DataTableCreator.from_file(filepath).to_dict()).is_equal_to(datatable.to_dict())
+        rows = DataTableCreator.iter_file(filepath, chunk_size=2, columns=["name"], where={"id": "3"})
+        assert_that([row.name.value for row in rows]).is_equal_to(["n3"])
+
+    def test_xlsx_comprimido(self, datatable, tmp_path):
+        filepath = str(tmp_path / "data.xlsx.gz")
+        DataTableSaver.into_xlsx(datatable, filepath)
+        assert_that(DataTableCreator.from_file(filepath, sheet_name="Sheet").to_dict()).is_equal_to(datatable.to_dict())
+
+    def test_append_en_csv_comprimido(self, tmp_path):
+        import gzip
+        filepath = str(tmp_path / "data.csv.gz")
+        dt = DataTableCreator.from_records([{"a": 1}])
+        DataTableSaver.into_csv(dt, filepath)
+        dt.append_rows([{"a": 2}])
+        DataTableSaver.into_csv(dt, filepath, append=True)
+        with gzip.open(filepath, "rt") as file:
+            assert_that(file.read().splitlines()).is_equal_to(["a", "1", "2"])
+
+    def test_cache_comprimido_no_soportado(self, datatable, tmp_path):
+        with pytest.raises(FileWritingException):
+            DataTableSaver.into_cache(datatable, str(tmp_path / "data.pytc.gz"))
+
+    def test_sniff_sin_extension_o_enganosa(self, datatable, tmp_path):
+        DataTableSaver.into_json(datatable, str(tmp_path / "data.json.bz2"))
+        os.replace(tmp_path / "data.json.bz2", tmp_path / "export")
+        DataTableSaver.into_jsonl(datatable, str(tmp_path / "lines.csv"))
+        with pytest.raises(FileExtensionException):
+            DataTableCreator.from_file(str(tmp_path / "export"))
+        assert_that(DataTableCreator.from_file(str(tmp_path / "export"), sniff=True).to_dict()).is_equal_to(
+            datatable.to_dict()
+        )
+        assert_that(DataTableCreator.from_file(str(tmp_path / "lines.csv"), sniff=True).to_dict()).is_equal_to(
+            datatable.to_dict()
+        )
+
+    def test_sniff_contenido_desconocido(self, tmp_path):
+        filepath = tmp_path / "data.bin"
+        filepath.write_bytes(b"\x00\x01\x02")
+        with pytest.raises(FileExtensionException):
+            DataTableCreator.from_file(str(filepath), sniff=True)
+
 class TestFileFormats:
     @pytest.mark.parametrize("ext, ext_class", [
         (".csv", CSVFileReadingStrategy),
         (".json", JSONFileReadingStrategy),
-        (".xlsx", XLSXReadingStrategy)
+        (".jsonl", JSONLinesFileReadingStrategy),
+        (".xlsx", XLSXReadingStrategy),
+        (".pytc", CacheReadingStrategy)
     ])
     def test_get_strategy(self, ext, ext_class):
         strategy_class = FileFormats(ext).get_strategy()
         assert_that(strategy_class).is_equal_to(ext_class)
 
+class TestImportTime:
+    HEAVY_MODULES = [
+        "openpyxl",
+        "jsonschema",
+        "multiprocessing",
+        "hashlib",
+        "asyncio",
+        "gzip",
+        "bz2",
+        "lzma",
+        "pytabify.io.strategies.reading",
+        "pytabify.io.strategies.saving",
+    ]
+
+    def _loaded_after(self, code):
+        import subprocess
+        script = f"import sys, json; {code}; print(json.dumps([m for m in {self.HEAVY_MODULES!r} if m in sys.modules]))"
+        output = subprocess.run(
+            [sys.executable, "-c", script], capture_output=True, text=True, check=True,
+            env=dict(os.environ, PYTHONPATH=path)
+        ).stdout
+        return json.loads(output)
+
+    def test_import_no_carga_dependencias(self):
+        assert_that(self._loaded_after("import pytabify")).is_empty()
+
+    def test_csv_no_carga_openpyxl_ni_jsonschema(self, tmp_path):
+        csv_file = tmp_path / "data.csv"
+        csv_file.write_text("a\n1\n", encoding="utf-8")
+        loaded = self._loaded_after(
+            f"from pytabify import DataTableCreator, DataTableSaver; "
+            f"DataTableSaver.into_csv(DataTableCreator.from_file({str(csv_file)!r}), {str(csv_file)!r})"
+        )
+        assert_that(loaded).is_equal_to(["pytabify.io.strategies.reading", "pytabify.io.strategies.saving"])
+
 class TestDataTable:
     def test_len(self, sample_datatable):
         assert_that(sample_datatable).is_length(2)
@@ -92,6 +678,460 @@ class TestDataTable:
         assert_that(data_dict).is_instance_of(list)
         assert_that(data_dict[0]).is_equal_to({"name": "Alice", "age": "30"})
 
+class TestDTColumns:
+    def test_from_records_guarda_por_columnas(self, sample_records):
+        store = DTColumns.from_records(sample_records)
+        assert_that(store).is_length(2)
+        assert_that(store.names).is_equal_to(["name", "age"])
+        assert_that(store.columns).is_equal_to([["Alice", "Bob"], ["30", "25"]])
+
+    def test_registros_heterogeneos(self):
+        store = DTColumns.from_records([{"a": 1}, {"b": 2}])
+        assert_that(store.names).is_equal_to(["a", "b"])
+        assert_that(store.columns[0][1]).is_same_as(MISSING)
+        assert_that(store.record(1)).is_equal_to({"b": "2"})
+
+    def test_llaves_que_no_son_texto(self, tmp_path):
+        store = DTColumns.from_records([{1: "a", None: "b"}] * 3)
+        assert_that(store.names).is_equal_to(["1", "None"])
+        assert_that(store.columns).is_equal_to([["a"] * 3, ["b"] * 3])
+        from openpyxl import Workbook
+        workbook = Workbook()
+        workbook.active.title = "Datos"
+        for values in (["id", 2024, "name"], [1, 10, "Ana"], [2, 20, "Luis"]):
+            workbook.active.append(values)
+        filepath = str(tmp_path / "data.xlsx")
+        workbook.save(filepath)
+        output_file = tmp_path / "output.csv"
+        DataTableSaver.into_csv(DataTableCreator.from_file(filepath, sheet_name="Datos"), str(output_file))
+        assert_that(output_file.read_text(encoding="utf-8").splitlines()).is_equal_to(
+            ["id,2024,name", "1,10,Ana", "2,20,Luis"]
+        )
+
+    def test_nueva_columna_desde_fila(self, sample_datatable):
+        sample_datatable[0]["city"] = "Madrid"
+        assert_that(sample_datatable[0].city.value).is_equal_to("Madrid")
+        assert_that(sample_datatable[1].city).is_none()
+        assert_that(sample_datatable[1].to_dict()).is_equal_to({"name": "Bob", "age": "25"})
+        assert_that([h.name for h in sample_datatable.headers()]).is_equal_to(["name", "age", "city"])
+
+    def test_indice_de_posiciones_incremental(self, sample_datatable):
+        store = sample_datatable[0]._store
+        assert_that(sample_datatable[1]._store).is_same_as(store)
+        assert_that(store.position("age")).is_equal_to(1)
+        sample_datatable[1].city = "Madrid"
+        assert_that(store.position("city")).is_equal_to(2)
+        assert_that(store.position("missing")).is_none()
+
+    def test_nombres_que_no_son_texto(self):
+        dt = DataTableCreator.from_records([{2024: "a"}, {2024: "b"}])
+        assert_that(dt[0][2024].value).is_equal_to("a")
+        dt[1][2024] = "c"
+        dt[1][7] = "x"
+        assert_that(dt._store.names).is_equal_to(["2024", "7"])
+        assert_that(dt.to_dict()).is_equal_to([{"2024": "a"}, {"2024": "c", "7": "x"}])
+
+    def test_asignar_campo_existente_lo_reemplaza(self, sample_datatable):
+        sample_datatable[1].age = 26
+        assert_that(sample_datatable[1].age.value).is_equal_to("26")
+        assert_that(sample_datatable[1]).is_length(2)
+
+class TestTypedColumns:
+    RECORDS = [
+        {"id": 1, "zip": "007", "price": 1.5, "active": True, "born": "2000-01-31", "name": "Alice"},
+        {"id": 2, "zip": "010", "price": 2.0, "active": False, "born": "1999-12-01", "name": "Bob"},
+    ]
+
+    def test_inferencia(self):
+        from array import array
+        from datetime import date
+        dt = DataTableCreator.from_records(self.RECORDS, dtypes="infer")
+        assert_that(dt.dtypes()).is_equal_to(
+            {"id": int, "zip": str, "price": float, "active": bool, "born": date, "name": str}
+        )
+        assert_that(dt._store.columns[0]).is_instance_of(array)
+        assert_that(dt[0].id.typed_value).is_equal_to(1)
+        assert_that(dt[0].born.typed_value).is_equal_to(date(2000, 1, 31))
+
+    def test_value_igual_que_sin_tipos(self):
+        typed = DataTableCreator.from_records(self.RECORDS, dtypes="infer")
+        plain = DataTableCreator.from_records(self.RECORDS)
+        for typed_row, plain_row in zip(typed, plain):
+            assert_that([f.value for f in typed_row]).is_equal_to([f.value for f in plain_row])
+
+    def test_mapa_explicito(self):
+        dt = DataTableCreator.from_records(self.RECORDS, dtypes={"zip": "int", "active": bool})
+        assert_that(dt[0].zip.typed_value).is_equal_to(7)
+        assert_that(dt.dtypes()["id"]).is_equal_to(str)
+
+    def test_mapa_explicito_invalido(self):
+        with pytest.raises(DataTypeException):
+            DataTableCreator.from_records(self.RECORDS, dtypes={"name": int})
+        with pytest.raises(ColumnDoesNotExistException):
+            DataTableCreator.from_records(self.RECORDS, dtypes={"email": str})
+        with pytest.raises(ValueError):
+            DataTableCreator.from_records(self.RECORDS, dtypes="auto")
+
+    def test_celdas_ausentes(self):
+        records = [{"a": "1", "b": "2"}, {"a": "3"}]
+        with pytest.raises(DataTypeException, match="celdas ausentes"):
+            DataTableCreator.from_records(records, dtypes={"b": "int"})
+        dt = DataTableCreator.from_records(records, dtypes={"a": "int"})
+        assert_that(dt.dtypes()).is_equal_to({"a": int, "b": str})
+        with pytest.raises(DataTypeException, match="values o default"):
+            dt.add_column("n", dtype="int")
+        assert_that(dt.store.names).is_equal_to(["a", "b"])
+        dt.add_column("n", default=0, dtype="int")
+        assert_that([row.n.typed_value for row in dt]).is_equal_to([0, 0])
+
+    def test_asignacion_conserva_o_regresa_a_str(self):
+        dt = DataTableCreator.from_records(self.RECORDS, dtypes="infer")
+        dt[0].id = "5"
+        assert_that(dt[0].id.typed_value).is_equal_to(5)
+        dt[1].id = "N/A"
+        assert_that(dt.dtypes()["id"]).is_equal_to(str)
+        assert_that([row.id.value for row in dt]).is_equal_to(["5", "N/A"])
+
+class TestQueries:
+    RECORDS = [
+        {"id": 1, "city": "Madrid", "amount": 10, "status": "active"},
+        {"id": 2, "city": "Lima", "amount": 5, "status": "inactive"},
+        {"id": 3, "city": "Madrid", "amount": 7, "status": "active"},
+        {"id": 4, "city": "Quito", "amount": 1, "status": "active"},
+    ]
+
+    @pytest.fixture
+    def dt(self):
+        return DataTableCreator.from_records(self.RECORDS, dtypes="infer")
+
+    def test_where_por_igualdad_y_funcion(self, dt):
+        result = dt.where(status="active", city="Madrid")
+        assert_that([row.id.value for row in result]).is_equal_to(["1", "3"])
+        result = dt.where("amount", lambda amount: amount > 5)
+        assert_that([row.id.typed_value for row in result]).is_equal_to([1, 3])
+        assert_that(dt.where(id="2")[0].city.value).is_equal_to("Lima")
+
+    def test_where_no_crea_filas(self, dt):
+        with patch.object(DTRow, "view", side_effect=AssertionError("no debe crear filas")):
+            assert_that(dt.where(status="active")).is_length(3)
+
+    def test_select_comparte_columnas(self, dt):
+        result = dt.select("city", "id")
+        assert_that([h.name for h in result.headers()]).is_equal_to(["city", "id"])
+        assert_that(result.store.columns[0]).is_same_as(dt.store.columns[1])
+        result[0].city = "Roma"
+        assert_that(dt[0].city.value).is_equal_to("Madrid")
+        dt[1].city = "Cusco"
+        assert_that(result[1].city.value).is_equal_to("Lima")
+
+    def test_sort_by(self, dt):
+        assert_that([row.id.value for row in dt.sort_by("amount")]).is_equal_to(["4", "2", "3", "1"])
+        assert_that([row.id.value for row in dt.sort_by("city", "amount", reverse=True)]).is_equal_to(
+            ["4", "1", "3", "2"]
+        )
+
+    def test_sort_by_celdas_ausentes_al_final(self):
+        dt = DataTableCreator.from_records([{"a": "2"}, {"b": "x"}, {"a": "1"}])
+        assert_that([row.to_dict() for row in dt.sort_by("a")]).is_equal_to([{"a": "1"}, {"a": "2"}, {"b": "x"}])
+        assert_that([row.to_dict() for row in dt.sort_by("a", reverse=True)]).is_equal_to(
+            [{"a": "2"}, {"a": "1"}, {"b": "x"}]
+        )
+
+    def test_distinct(self, dt):
+        assert_that(dt.distinct("city").to_dict()).is_equal_to(
+            [{"city": "Madrid"}, {"city": "Lima"}, {"city": "Quito"}]
+        )
+
+    def test_group_by(self, dt):
+        result = dt.group_by("city").agg(
+            total=("amount", "sum"), people=("id", "count"), biggest=("amount", max)
+        )
+        assert_that(result.to_dict()).is_equal_to([
+            {"city": "Madrid", "total": 17, "people": 2, "biggest": 10},
+            {"city": "Lima", "total": 5, "people": 1, "biggest": 5},
+            {"city": "Quito", "total": 1, "people": 1, "biggest": 1},
+        ])
+        assert_that(result.dtypes()["total"]).is_equal_to(int)
+
+    def test_group_by_sin_tipos(self):
+        dt = DataTableCreator.from_records(self.RECORDS)
+        result = dt.group_by("status").agg(mean=("amount", "mean"))
+        assert_that([row.mean.value for row in result]).is_equal_to(["6", "5"])
+
+    def test_columna_inexistente(self, dt):
+        with pytest.raises(ColumnDoesNotExistException):
+            dt.where(email="x")
+
+    def test_add_column(self, dt):
+        dt.add_column("doble", lambda row: row.amount.typed_value * 2, dtype=int)
+        dt.add_column("pais", default="ES")
+        dt.add_column("orden", ["d", "c", "b", "a"])
+        dt.add_column("vacia")
+        assert_that(dt[0].to_dict()).is_equal_to(
+            {"id": 1, "city": "Madrid", "amount": 10, "status": "active", "doble": 20, "pais": "ES", "orden": "d"}
+        )
+        assert_that(dt.dtypes()["doble"]).is_equal_to(int)
+        assert_that([h.name for h in dt.headers()][-4:]).is_equal_to(["doble", "pais", "orden", "vacia"])
+        with pytest.raises(ValueError):
+            dt.add_column("pais", default="MX")
+        with pytest.raises(ValueError):
+            dt.add_column("corta", ["x"])
+
+class TestBulkUpdate:
+    @pytest.fixture
+    def dt(self):
+        return DataTableCreator.from_records(TestQueries.RECORDS, dtypes="infer")
+
+    def test_update(self, dt):
+        dt.update("amount", lambda amount: amount * 10, where={"city": "Madrid"})
+        assert_that([row.amount.typed_value for row in dt]).is_equal_to([100, 5, 70, 1])
+        dt.update("status", "closed", where={"id": lambda id: id > 2})
+        assert_that([row.status.value for row in dt]).is_equal_to(["active", "inactive", "closed", "closed"])
+        dt.update("amount", ["a", "b", "c", "d"])
+        assert_that(dt.dtypes()["amount"]).is_equal_to(str)
+        with pytest.raises(ValueError):
+            dt.update("amount", ["x"])
+
+    def test_update_columna_nueva(self, dt):
+        observer = FieldChangeObserver()
+        dt = DataTable(dt.store, observer)
+        dt.update("flag", "si", where={"status": "inactive"})
+        assert_that([row.flag.value if row.flag else None for row in dt]).is_equal_to([None, "si", None, None])
+        assert_that(observer.events).is_length(1)
+
+    def test_update_respeta_indices(self, dt):
+        dt.create_index("id", unique=True)
+        with pytest.raises(DuplicateKeyException):
+            dt.update("id", 1)
+        assert_that(dt.lookup(id=4)).is_length(1)
+        with pytest.raises(DuplicateKeyException):
+            dt.update("id", 1, where={"city": "Quito"})
+        assert_that(dt.where(city="Quito")[0].id.typed_value).is_equal_to(4)
+        dt.update("id", lambda id: id + 100)
+        assert_that(dt.lookup(id=104)[0].city.value).is_equal_to("Quito")
+        dt.create_index("amount", kind="sorted")
+        dt.update("amount", lambda amount: -amount, where={"city": "Madrid"})
+        assert_that([row.amount.typed_value for row in dt.range("amount", high=0)]).is_sorted()
+
+    def test_apply(self):
+        dt = DataTableCreator.from_records([{"a": " x ", "b": " y"}, {"a": "z "}])
+        dt.apply(str.strip)
+        assert_that(dt.to_dict()).is_equal_to([{"a": "x", "b": "y"}, {"a": "z"}])
+
+    def test_append_rows(self, dt):
+        dt.create_index("id", unique=True)
+        dt.append_rows([{"id": 5, "city": "Roma"}, {"id": 6, "city": "Lima", "zip": "15001"}])
+        assert_that(dt).is_length(6)
+        assert_that(dt.lookup(id=6)[0].zip.value).is_equal_to("15001")
+        assert_that(dt[0].zip).is_none()
+        with pytest.raises(DuplicateKeyException):
+            dt.append_rows([{"id": 7}, {"id": 5}])
+        assert_that(dt).is_length(6)
+
+    def test_append_rows_rechazado_conserva_tipos(self, dt):
+        dt.create_index("id", unique=True)
+        dtypes = dt.dtypes()
+        with pytest.raises(DuplicateKeyException):
+            dt.append_rows([{"id": 8, "amount": "mucho"}, {"id": 9}, {"id": 1}])
+        assert_that(dt).is_length(4)
+        assert_that(dt.dtypes()).is_equal_to(dtypes)
+        assert_that([row.amount.typed_value for row in dt]).is_equal_to([10, 5, 7, 1])
+        dt.append_rows([{"id": 8, "city": "Roma", "amount": 3, "status": "active"}])
+        assert_that(dt[4].amount.typed_value).is_equal_to(3)
+        assert_that(dt.dtypes()).is_equal_to(dtypes)
+
+class TestIndexes:
+    @pytest.fixture
+    def dt(self):
+        return DataTableCreator.from_records(TestQueries.RECORDS, dtypes="infer")
+
+    def test_lookup_con_indice(self, dt):
+        dt.create_index("id", unique=True)
+        dt.create_index("city")
+        with patch.object(DTColumns, "take", wraps=dt.store.take) as take:
+            assert_that(dt.lookup(id="3")[0].city.value).is_equal_to("Madrid")
+        assert_that(take.call_args.args[0]).is_equal_to([2])
+        assert_that([row.id.value for row in dt.lookup(city="Madrid", status="active")]).is_equal_to(["1", "3"])
+        assert_that(dt.lookup(id="x")).is_length(0)
+        assert_that(dt.where(city="Lima")[0].id.typed_value).is_equal_to(2)
+
+    def test_indice_unico(self, dt):
+        with pytest.raises(DuplicateKeyException):
+            dt.create_index("city", unique=True)
+        dt.create_index("id", unique=True)
+        with pytest.raises(DuplicateKeyException):
+            dt[0]["id"] = 2
+        assert_that(dt[0].id.typed_value).is_equal_to(1)
+        with pytest.raises(DuplicateKeyException):
+            dt.store.extend([{"id": 5}, {"id": 1, "extra": "x"}])
+        assert_that(dt).is_length(4)
+        assert_that(dt.store.names).does_not_contain("extra")
+
+    def test_indice_se_actualiza(self, dt):
+        dt.create_index("id", unique=True, kind="sorted")
+        dt[0]["id"] = 10
+        dt.row(1).id = "x2"
+        dt.store.extend([{"id": 7}])
+        assert_that(dt.lookup(id=1)).is_length(0)
+        assert_that(dt.lookup(id="10")[0].city.value).is_equal_to("Madrid")
+        assert_that(dt.lookup(id="x2")[0].city.value).is_equal_to("Lima")
+        assert_that(dt.lookup(id="7")).is_length(1)
+        assert_that(dt.dtypes()["id"]).is_equal_to(str)
+
+    def test_range(self, dt):
+        assert_that([row.id.value for row in dt.range("amount", 5, 10)]).is_equal_to(["2", "3", "1"])
+        dt.create_index("amount", kind="sorted")
+        assert_that([row.id.value for row in dt.range("amount", 5, 10)]).is_equal_to(["2", "3", "1"])
+        assert_that([row.id.value for row in dt.range("amount", high=5)]).is_equal_to(["4", "2"])
+        dt[3]["amount"] = 8
+        assert_that([row.id.value for row in dt.range("amount", low=7)]).is_equal_to(["3", "4", "1"])
+        with pytest.raises(DataTypeException):
+            dt.range("amount", "x")
+
+    def test_indice_ordenado_en_bloque(self):
+        import random
+        values = [random.randrange(1000) for _ in range(500)]
+        dt = DataTableCreator.from_records([{"k": value} for value in values], dtypes={"k": int})
+        with patch("pytabify.core.dt_index.insort") as insort:
+            dt.create_index("k", kind="sorted")
+        insort.assert_not_called()
+        dt.append_rows([{"k": random.randrange(1000)} for _ in range(100)])
+        dt.append_rows([{"k": 500}])
+        by_index = [row.k.typed_value for row in dt.range("k", 100, 900)]
+        dt.drop_index("k")
+        assert_that(by_index).is_equal_to([row.k.typed_value for row in dt.range("k", 100, 900)])
+        assert_that(by_index).is_sorted()
+
+class TestJoin:
+    USERS = [
+        {"id": "1", "name": "Ana"},
+        {"id": "2", "name": "Luis"},
+        {"id": "3", "name": "Eva"},
+    ]
+    ORDERS = [
+        {"id": "3", "total": "7", "name": "pedido c"},
+        {"id": "1", "total": "10", "name": "pedido a"},
+        {"id": "1", "total": "5", "name": "pedido b"},
+        {"id": "9", "total": "1", "name": "pedido x"},
+    ]
+
+    @pytest.fixture
+    def tables(self):
+        return DataTableCreator.from_records(self.USERS), DataTableCreator.from_records(self.ORDERS)
+
+    def test_inner(self, tables):
+        users, orders = tables
+        result = users.join(orders, on="id")
+        assert_that([h.name for h in result.headers()]).is_equal_to(["id", "name", "total", "name_right"])
+        assert_that([(row.id.value, row.total.value) for row in result]).is_equal_to(
+            [("1", "10"), ("1", "5"), ("3", "7")]
+        )
+
+    def test_left_y_outer(self, tables):
+        users, orders = tables
+        left = users.join(orders, on="id", how="left")
+        assert_that([row.total for row in left if row.id.value == "2"]).is_equal_to([None])
+        outer = users.join(orders, on="id", how="outer")
+        assert_that(outer).is_length(5)
+        assert_that(outer[-1].to_dict()).is_equal_to({"id": "9", "total": "1", "name_right": "pedido x"})
+
+    @pytest.mark.parametrize("how", ["inner", "left", "outer"])
+    def test_merge_igual_a_hash(self, tables, how):
+        users, orders = tables
+        by_hash = users.join(orders, on="id", how=how).sort_by("id", "total").to_dict()
+        by_merge = users.join(orders, on="id", how=how, method="merge").sort_by("id", "total").to_dict()
+        assert_that(by_merge).is_equal_to(by_hash)
+
+        typed = DataTableCreator.from_records([{"id": 1}, {"id": 2}, {"id": 10}], dtypes={"id": int})
+        text = DataTableCreator.from_records([{"id": "1"}, {"id": "2"}, {"id": "10"}])
+        by_hash = typed.join(text, on="id", how=how).sort_by("id").to_dict()
+        by_merge = typed.join(text, on="id", how=how, method="merge").sort_by("id").to_dict()
+        assert_that(by_merge).is_length(3).is_equal_to(by_hash)
+
+    def test_tipos_y_columnas(self):
+        users = DataTableCreator.from_records(self.USERS, dtypes={"id": int})
+        orders = DataTableCreator.from_records(self.ORDERS, dtypes={"id": int, "total": int})
+        result = users.join(orders, on="id")
+        assert_that(result.dtypes()).is_equal_to({"id": int, "name": str, "total": int, "name_right": str})
+        with patch.object(DTField, "__init__", side_effect=AssertionError("no debe crear campos")):
+            users.join(orders, on="id", how="outer")
+        mixed = DataTableCreator.from_records(self.USERS).join(orders, on="id")
+        assert_that(mixed).is_length(3)
+        with pytest.raises(ColumnDoesNotExistException):
+            users.join(orders, on="email")
+
+class TestScan:
+    RECORDS = TestQueries.RECORDS
+
+    @pytest.fixture(params=["csv", "json", "mmap", "pytc"])
+    def source(self, request, tmp_path):
+        dt = DataTableCreator.from_records(self.RECORDS)
+        if request.param == "json":
+            path = str(tmp_path / "data.json")
+            DataTableSaver.into_json(dt, path)
+            return path, {}
+        if request.param == "pytc":
+            path = str(tmp_path / "data.pytc")
+            DataTableSaver.into_cache(DataTableCreator.from_records(self.RECORDS, dtypes="infer"), path)
+            return path, {}
+        path = str(tmp_path / "data.csv")
+        DataTableSaver.into_csv(dt, path)
+        return path, {"mmap": True} if request.param == "mmap" else {}
+
+    def test_where_y_select(self, source):
+        path, kwargs = source
+        result = (
+            DataTableCreator.scan(path, **kwargs)
+            .where(status="active")
+            .where("amount", lambda amount: int(amount) > 1)
+            .select("id", "city")
+            .collect()
+        )
+        assert_that([h.name for h in result.headers()]).is_equal_to(["id", "city"])
+        assert_that([(row.id.value, row.city.value) for row in result]).is_equal_to([("1", "Madrid"), ("3", "Madrid")])
+
+    def test_plan(self):
+        scan = DataTableCreator.scan("data.csv").select("id", "status").where(status="active")
+        assert_that(scan.plan()).is_equal_to({"path": "data.csv", "columns": ["id", "status"], "where": ["status"]})
+        with pytest.raises(ColumnDoesNotExistException):
+            scan.where(city="Lima")
+
+    def test_csv_no_crea_registros_completos(self, tmp_path):
+        path = str(tmp_path / "data.csv")
+        DataTableSaver.into_csv(DataTableCreator.from_records(self.RECORDS), path)
+        with patch("csv.DictReader", side_effect=AssertionError("no debe leer registros completos")):
+            result = DataTableCreator.scan(path).where(city="Lima").select("id").collect()
+        assert_that(result.to_dict()).is_equal_to([{"id": "2"}])
+
+    def test_xlsx(self, tmp_path):
+        from openpyxl import Workbook
+        workbook = Workbook()
+        workbook.active.title = "Datos"
+        workbook.active.append(list(self.RECORDS[0]))
+        for record in self.RECORDS:
+            workbook.active.append(list(record.values()))
+        path = str(tmp_path / "data.xlsx")
+        workbook.save(path)
+        result = DataTableCreator.scan(path, sheet_name="Datos").where(city="Madrid").select("amount").collect()
+        assert_that(result.to_dict()).is_equal_to([{"amount": "10"}, {"amount": "7"}])
+
+    def test_columna_inexistente(self, source):
+        path, kwargs = source
+        with pytest.raises(ColumnDoesNotExistException, match="emial"):
+            DataTableCreator.scan(path, **kwargs).where(emial="x").collect()
+        with pytest.raises(ColumnDoesNotExistException, match="emial"):
+            DataTableCreator.scan(path, **kwargs).select("id", "emial").collect()
+
+    def test_columna_inexistente_jsonl(self, tmp_path):
+        path = str(tmp_path / "data.jsonl")
+        DataTableSaver.into_jsonl(DataTableCreator.from_records(self.RECORDS), path)
+        with pytest.raises(ColumnDoesNotExistException):
+            DataTableCreator.scan(path).where(emial="x").collect()
+        with pytest.raises(ColumnDoesNotExistException):
+            list(DataTableCreator.iter_file(path, columns=["id", "emial"]))
+        result = DataTableCreator.scan(path).where(city="Lima").select("id").collect()
+        assert_that(result.to_dict()).is_equal_to([{"id": "2"}])
+
 class TestDTRow:
     def test_setitem(self):
         observer = FieldChangeObserver()
@@ -137,6 +1177,21 @@ class TestFieldChangeObserver:
         assert_that(observer.events).is_length(1)
         assert_that(observer.events[0]["field"].value).is_equal_to("xyz")
 
+    def test_eventos_acotados(self):
+        observer = FieldChangeObserver(max_events=2)
+        for pos in range(5):
+            observer.notify(pos, DTField(f"c{pos}", "x", pos))
+        assert_that([event["pos"] for event in observer.events]).is_equal_to([3, 4])
+        assert_that(observer.total_events).is_equal_to(5)
+
+    def test_un_evento_por_columna(self):
+        observer = FieldChangeObserver()
+        dt = DataTable(DTColumns.from_records([{"a": str(i)} for i in range(100)]), observer)
+        for row in dt:
+            row["b"] = "x"
+        dt.add_column("c", default="1")
+        assert_that([event["field"].name for event in observer.events]).is_equal_to(["b", "c"])
+
 class TestReadingStrategies:
     @patch("builtins.open", new_callable=mock_open, read_data='[{"name": "Alice"}]')
     def test_json_reading_strategy(self, mock_file, tmp_path):
@@ -166,11 +1221,8 @@ class TestReadingStrategies:
         mock_load_workbook.return_value = mock_workbook
 
         # Configurar el mock de la hoja
-        mock_sheet.__getitem__.return_value = [MagicMock(value="name"), MagicMock(value="age")]
-        mock_sheet.iter_rows.return_value = [
-            ("Alice", 30),
-            ("Bob", 25)
-        ]
+        filas = [("name", "age"), ("Alice", 30), ("Bob", 25)]
+        mock_sheet.iter_rows.side_effect = lambda min_row=1, max_row=None, **kwargs: iter(filas[min_row - 1:max_row])
 
         # Crear archivo temporal (aunque no se usa realmente gracias al mock)
         filepath = tmp_path / "test.xlsx"
@@ -214,6 +1266,112 @@ class TestReadingStrategies:
         with pytest.raises(SheetNameHasNotEmptyException):
             XLSXReadingStrategy(str(filepath)).read()
 
+class TestXLSXReadOnly:
+    @pytest.fixture
+    def xlsx_file(self, tmp_path):
+        from openpyxl import Workbook
+        workbook = Workbook()
+        sheet = workbook.active
+        sheet.title = "Datos"
+        sheet.append(["id", "name", "age", "city"])
+        for i in range(5):
+            sheet.append([i, f"user {i}", 20 + i, None])
+        workbook.create_sheet("Otra").append(["x"])
+        filepath = tmp_path / "data.xlsx"
+        workbook.save(filepath)
+        return str(filepath)
+
+    def test_lectura_solo_lectura(self, xlsx_file):
+        data = XLSXReadingStrategy(xlsx_file, sheet_name="Datos").read()
+        assert_that(data).is_length(5)
+        assert_that(data[0]).is_equal_to({"id": "0", "name": "user 0", "age": "20", "city": ""})
+        assert_that(data).is_equal_to(XLSXReadingStrategy(xlsx_file, sheet_name="Datos", read_only=False).read())
+
+    def test_dimension_desactualizada(self, xlsx_file, tmp_path):
+        import re
+        import zipfile
+        filepath = str(tmp_path / "stale.xlsx")
+        with zipfile.ZipFile(xlsx_file) as source, zipfile.ZipFile(filepath, "w") as target:
+            for item in source.infolist():
+                content = source.read(item.filename)
+                if item.filename == "xl/worksheets/sheet1.xml":
+                    content = re.sub(rb'<dimension ref="[^"]*" ?/>', b'<dimension ref="A1"/>', content)
+                    assert_that(content).contains(b'<dimension ref="A1"/>')
+                target.writestr(item, content)
+        data = XLSXReadingStrategy(filepath, sheet_name="Datos").read()
+        assert_that(data).is_length(5)
+        assert_that(data).is_equal_to(XLSXReadingStrategy(xlsx_file, sheet_name="Datos", read_only=False).read())
+        filtered = XLSXReadingStrategy(filepath, sheet_name="Datos", where={"city": ""}, columns=["name"]).read()
+        assert_that(filtered).is_length(5)
+
+    def test_rango_de_filas(self, xlsx_file):
+        data = XLSXReadingStrategy(xlsx_file, sheet_name="Datos", row_range=(1, 3)).read()
+        assert_that([record["id"] for record in data]).is_equal_to(["1", "2"])
+
+    def test_subconjunto_de_columnas(self, xlsx_file):
+        data = XLSXReadingStrategy(xlsx_file, sheet_name="Datos", columns=["age", "name"]).read()
+        assert_that(data[4]).is_equal_to({"age": "24", "name": "user 4"})
+
+    def test_columna_inexistente(self, xlsx_file):
+        with pytest.raises(ColumnDoesNotExistException):
+            XLSXReadingStrategy(xlsx_file, sheet_name="Datos", columns=["email"]).read()
+
+    @pytest.mark.parametrize("read_only", [True, False])
+    def test_hoja_vacia(self, tmp_path, read_only):
+        from openpyxl import Workbook
+        workbook = Workbook()
+        workbook.active.title = "Vacia"
+        filepath = str(tmp_path / "empty.xlsx")
+        workbook.save(filepath)
+        assert_that(XLSXReadingStrategy(filepath, sheet_name="Vacia", read_only=read_only).read()).is_empty()
+
+    def test_cierra_el_libro(self, xlsx_file):
+        with patch("pytabify.io.strategies.reading.load_workbook") as mock_load_workbook:
+            mock_load_workbook.return_value.sheetnames = []
+            with pytest.raises(SheetNameDoesNotExistException):
+                XLSXReadingStrategy(xlsx_file, sheet_name="Datos").read()
+            mock_load_workbook.return_value.close.assert_called_once()
+
+class TestInstrumentation:
+    def test_etapas_de_lectura_y_guardado(self, sample_datatable, tmp_path):
+        path = str(tmp_path / "data.csv")
+        with instrumentation.StageCollector() as collector:
+            DataTableSaver.into_csv(sample_datatable, path)
+            DataTableCreator.from_file(path)
+        assert_that([event.stage for event in collector.events]).is_equal_to(["save", "read", "validate", "build"])
+        save, read, _, build = collector.events
+        assert_that(save.bytes).is_equal_to(os.path.getsize(path))
+        assert_that(save.details).is_equal_to({"format": "csv", "append": False})
+        assert_that(read.rows).is_equal_to(2)
+        assert_that(read.bytes).is_equal_to(os.path.getsize(path))
+        assert_that((build.rows, build.columns)).is_equal_to((2, 2))
+        assert_that(collector.summary()["read"]["count"]).is_equal_to(1)
+        assert_that(instrumentation.enabled()).is_false()
+
+    def test_pico_de_memoria(self, tmp_path):
+        path = str(tmp_path / "data.json")
+        DataTableSaver.into_json(DataTableCreator.from_records([{"a": "x" * 100}] * 1000), path)
+        with instrumentation.StageCollector(trace_memory=True) as collector:
+            DataTableCreator.from_file(path)
+        assert_that(collector.summary()["read"]["peak_memory"]).is_greater_than(100 * 1000)
+
+    def test_sin_listeners_no_mide(self):
+        assert_that(instrumentation.stage("read", "x")).is_same_as(instrumentation.stage("build"))
+        with patch("time.perf_counter", side_effect=AssertionError("no debe medir")):
+            DataTableCreator.from_records([{"a": "1"}])
+
+    def test_listener_recibe_errores(self, tmp_path):
+        path = tmp_path / "broken.json"
+        path.write_text("[{", encoding="utf-8")
+        events = []
+        instrumentation.add_listener(events.append)
+        try:
+            with pytest.raises(FileReadingException):
+                DataTableCreator.from_file(str(path))
+        finally:
+            instrumentation.remove_listener(events.append)
+        assert_that(events[0].details).contains_key("error")
+
 class TestSaver:
     @patch("builtins.open", new_callable=mock_open)
     def test_into_json(self, mock_file, sample_datatable, tmp_path):
@@ -229,12 +1387,137 @@ class TestSaver:
         handle = mock_file()
         handle.write.assert_called()
 
+    def test_into_xlsx_write_only(self, sample_datatable, tmp_path):
+        sample_datatable[1]["city"] = "Madrid"
+        output_file = str(tmp_path / "output.xlsx")
+        DataTableSaver.into_xlsx(sample_datatable, output_file)
+        data = DataTableCreator.from_file(output_file, sheet_name="Sheet").to_dict()
+        assert_that(data).is_equal_to([
+            {"name": "Alice", "age": "30", "city": ""},
+            {"name": "Bob", "age": "25", "city": "Madrid"}
+        ])
+
+    def test_into_xlsx_sheets(self, sample_datatable, tmp_path):
+        other = DataTableCreator.from_records([{"sku": "A1"}])
+        output_file = str(tmp_path / "output.xlsx")
+        DataTableSaver.into_xlsx_sheets({"Users": sample_datatable, "Orders": other}, output_file)
+        assert_that(DataTableCreator.from_file(output_file, sheet_name="Users").to_dict()).is_equal_to(
+            sample_datatable.to_dict()
+        )
+        assert_that(DataTableCreator.from_file(output_file, sheet_name="Orders")[0].sku.value).is_equal_to("A1")
+
+    @pytest.mark.parametrize("saver", ["into_csv", "into_json", "into_jsonl"])
+    def test_append_solo_filas_nuevas(self, saver, tmp_path):
+        path = str(tmp_path / f"output.{saver[5:]}")
+        dt = DataTableCreator.from_records([{"id": "1", "name": "Ana"}])
+        save = getattr(DataTableSaver, saver)
+        save(dt, path, append=True)
+        dt.append_rows([{"id": "2", "name": "Luis"}, {"id": "3", "name": "Eva"}])
+        with patch("builtins.open", wraps=open) as spy:
+            save(dt, path, append=True)
+        assert_that([call.kwargs.get("mode") for call in spy.call_args_list]).does_not_contain("w")
+        assert_that(DataTableCreator.from_file(path).to_dict()).is_equal_to(dt.to_dict())
+
+    @pytest.mark.parametrize("saver", ["into_csv", "into_json"])
+    def test_append_reescribe_si_cambia_una_fila(self, saver, tmp_path):
+        path = str(tmp_path / f"output.{saver[5:]}")
+        dt = DataTableCreator.from_records([{"id": "1", "name": "Ana"}, {"id": "2", "name": "Luis"}])
+        save = getattr(DataTableSaver, saver)
+        save(dt, path)
+        dt[0]["name"] = "Ana Maria"
+        dt.append_rows([{"id": "3", "name": "Eva"}])
+        assert_that(dt.tracker.dirty_rows(path)).is_equal_to([0])
+        save(dt, path, append=True)
+        assert_that(DataTableCreator.from_file(path).to_dict()).is_equal_to(dt.to_dict())
+        assert_that(dt.tracker.dirty_rows(path)).is_empty()
+
+    def test_append_jsonl_columnas_nuevas(self, tmp_path):
+        path = str(tmp_path / "output.jsonl")
+        dt = DataTableCreator.from_records([{"id": "1"}])
+        DataTableSaver.into_jsonl(dt, path)
+        dt.append_rows([{"id": "2", "city": "Lima"}])
+        DataTableSaver.into_jsonl(dt, path, append=True)
+        with open(path, encoding="utf-8") as file:
+            assert_that(file.read().splitlines()).is_equal_to(['{"id": "1"}', '{"id": "2", "city": "Lima"}'])
+        assert_that(DataTableCreator.scan(path).where(city="Lima").collect()).is_length(1)
+
+    def test_append_reescribe_si_el_archivo_cambio(self, tmp_path):
+        path = tmp_path / "output.csv"
+        dt = DataTableCreator.from_records([{"id": "1"}])
+        DataTableSaver.into_csv(dt, str(path))
+        path.write_text("id\n9\n8\n", encoding="utf-8")
+        dt.append_rows([{"id": "2"}])
+        DataTableSaver.into_csv(dt, str(path), append=True)
+        assert_that(DataTableCreator.from_file(str(path)).to_dict()).is_equal_to([{"id": "1"}, {"id": "2"}])
+
     def test_into_csv_error(self, sample_datatable, tmp_path):
-        with patch("csv.DictWriter.writerow", side_effect=Exception("Error")):
+        with patch("csv.writer", side_effect=Exception("Error")):
             with pytest.raises(FileWritingException):
                 CsvFileSavingStrategy.save(sample_datatable, str(tmp_path / "output.csv"), "utf-8")
 
     def test_into_json_error(self, sample_datatable, tmp_path):
-        with patch("json.dump", side_effect=Exception("Error")):
+        with patch("pytabify.io.strategies.saving.json_records", side_effect=Exception("Error")):
             with pytest.raises(FileWritingException):
                 JsonFileSavingStrategy.save(sample_datatable, str(tmp_path / "output.json"), "utf-8")
+
+    @pytest.mark.parametrize("file_format", ["json", "jsonl"])
+    def test_columna_fecha_ida_y_vuelta(self, tmp_path, file_format):
+        dt = DataTableCreator.from_records(
+            [{"fecha": "2024-01-31", "n": "1"}, {"fecha": "1999-12-01", "n": "2"}], dtypes="infer"
+        )
+        assert_that(dt.dtypes()["fecha"]).is_equal_to(date)
+        filepath = str(tmp_path / f"output.{file_format}")
+        getattr(DataTableSaver, f"into_{file_format}")(dt, filepath)
+        result = DataTableCreator.from_file(filepath, dtypes="infer")
+        assert_that(result.to_dict()).is_equal_to(dt.to_dict())
+        assert_that([row.fecha.value for row in result]).is_equal_to([row.fecha.value for row in dt])
+
+    def test_escritura_incremental_igual_a_to_dict(self, tmp_path):
+        dt = DataTableCreator.from_records(
+            [{"id": "1", "name": "Ñandú \"x\"", "score": "1.5"}, {"id": "2", "extra": "a,b"}], dtypes="infer"
+        )
+        with patch.object(DataTable, "to_dict", side_effect=AssertionError("no debe usar to_dict")):
+            DataTableSaver.into_json(dt, str(tmp_path / "output.json"))
+            DataTableSaver.into_csv(dt, str(tmp_path / "output.csv"))
+        with open(tmp_path / "output.json", encoding="utf-8") as file:
+            assert_that(file.read()).is_equal_to(json.dumps(dt.to_dict()))
+        assert_that(DataTableCreator.from_file(str(tmp_path / "output.csv")).to_dict()).is_equal_to([
+            {"id": "1", "name": "Ñandú \"x\"", "score": "1.5", "extra": ""},
+            {"id": "2", "name": "", "score": "", "extra": "a,b"}
+        ])
+
+class TestBenchmarks:
+    @pytest.fixture
+    def bench(self):
+        sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "benchmarks")))
+        try:
+            import bench_pipeline
+            yield bench_pipeline
+        finally:
+            sys.path.pop(0)
+
+    def test_mide_cada_etapa(self, bench, tmp_path):
+        path = bench.generate_fixture(str(tmp_path), "csv", 20, 4)
+        assert_that(DataTableCreator.from_file(path)).is_length(20)
+        for stage in bench.STAGES:
+            metrics = bench.run_stage(path, "csv", str(tmp_path), 1, stage)
+            assert_that(metrics).contains_key(*bench.METRICS)
+
+    def test_pico_de_rss_por_etapa(self, bench):
+        if bench._current_rss() is None:
+            pytest.skip("RSS actual no disponible en esta plataforma")
+        size = 64 * 1024 * 1024
+        assert_that(bench._rss_peak(lambda: bytearray(size))).is_greater_than(size // 2)
+
+    def test_compara_con_linea_base(self, bench):
+        mib = 1024 * 1024
+        baseline = {"cases": {"csv/10x4/read": {"wall": 1.0, "rss_peak": None, "alloc_peak": 10 * mib}}}
+        results = {"cases": {"csv/10x4/read": {"wall": 1.1, "rss_peak": 5 * mib, "alloc_peak": 20 * mib}}}
+        assert_that(bench.compare(results, baseline, 0.25)).is_equal_to(
+            [f"csv/10x4/read alloc_peak: {10 * mib} -> {20 * mib}"]
+        )
+        assert_that(bench.compare(results, baseline, 1.5)).is_empty()
+        zero = {"cases": {"csv/10x4/read": {"wall": 1.0, "rss_peak": 0, "alloc_peak": 20 * mib}}}
+        assert_that(bench.compare(results, zero, 0.25)).is_empty()
+        small = {"cases": {"csv/10x4/read": {"wall": 1.0, "rss_peak": 1, "alloc_peak": 20 * mib}}}
+        assert_that(bench.compare({"cases": {"csv/10x4/read": {"rss_peak": 1000}}}, small, 0.25)).is_empty()